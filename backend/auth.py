@@ -10,13 +10,44 @@ Version: 1.0.0
 
 import os
 import jwt
+import asyncio
+import aiohttp
+import hmac
+import time
+import base64
+import binascii
+import hashlib
 import secrets
-import bcrypt
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import threading
+import orjson
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime
+from typing import Optional, Dict, Any, Tuple, List
 from dotenv import load_dotenv
 import logging
 from pathlib import Path
+from urllib.parse import urlencode, quote
+
+from cache import TTLCache, cache
+from database import get_user_email
+
+# Prefer a natively tuned bcrypt build when one is installed. All
+# implementations share the $2b$ Modular Crypt Format, so hashes stay portable.
+try:
+    import cbcrypt as bcrypt_impl
+except ImportError:
+    import bcrypt as bcrypt_impl
+
+# PyNaCl is only needed when tokens are signed with EdDSA (Ed25519)
+try:
+    from nacl.signing import SigningKey, VerifyKey
+    from nacl.exceptions import BadSignatureError
+    NACL_AVAILABLE = True
+except ImportError:
+    NACL_AVAILABLE = False
 
 # Load environment variables from root directory
 root_dir = Path(__file__).parent.parent
@@ -25,40 +56,328 @@ load_dotenv(dotenv_path=env_path)
 
 logger = logging.getLogger(__name__)
 
-# JWT Configuration
-JWT_SECRET = os.getenv("JWT_SECRET", secrets.token_urlsafe(32))
-JWT_ALGORITHM = "HS256"
-JWT_EXPIRATION_HOURS = int(os.getenv("JWT_EXPIRATION_HOURS", "24"))
-JWT_REFRESH_EXPIRATION_DAYS = int(os.getenv("JWT_REFRESH_EXPIRATION_DAYS", "30"))
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+TOKEN_TYPE_ACCESS = "access"
+TOKEN_TYPE_REFRESH = "refresh"
+
+
+@dataclass(frozen=True, slots=True)
+class AuthConfig:
+    """Authentication settings, read from the environment once at import"""
+    jwt_secret: bytes
+    jwt_algorithm: str = "HS256"
+    jwt_private_key_path: Optional[str] = None
+    jwt_public_key_path: Optional[str] = None
+    access_ttl: int = 24 * 3600
+    refresh_ttl: int = 30 * 86400
+    bcrypt_cost: int = 12
+    google_client_id: Optional[str] = None
+    google_client_secret: Optional[str] = None
+    google_redirect_uri: str = "http://localhost:8080/auth/google/callback"
+    github_client_id: Optional[str] = None
+    github_client_secret: Optional[str] = None
+    github_redirect_uri: str = "http://localhost:8080/auth/github/callback"
+
+
+CFG = AuthConfig(
+    jwt_secret=os.getenv("JWT_SECRET", secrets.token_urlsafe(32)).encode(),
+    # HS256 (default) or EdDSA; EdDSA lets other services verify tokens
+    # with the public key instead of sharing JWT_SECRET
+    jwt_algorithm=os.getenv("JWT_ALGORITHM", "HS256"),
+    jwt_private_key_path=os.getenv("JWT_PRIVATE_KEY_PATH"),
+    jwt_public_key_path=os.getenv("JWT_PUBLIC_KEY_PATH"),
+    access_ttl=int(os.getenv("JWT_EXPIRATION_HOURS", "24")) * 3600,
+    refresh_ttl=int(os.getenv("JWT_REFRESH_EXPIRATION_DAYS", "30")) * 86400,
+    # bcrypt work factor for new hashes; older, cheaper hashes are upgraded on login
+    bcrypt_cost=int(os.getenv("BCRYPT_COST", "12")),
+    google_client_id=os.getenv("GOOGLE_CLIENT_ID"),
+    google_client_secret=os.getenv("GOOGLE_CLIENT_SECRET"),
+    google_redirect_uri=os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8080/auth/google/callback"),
+    github_client_id=os.getenv("GITHUB_CLIENT_ID"),
+    github_client_secret=os.getenv("GITHUB_CLIENT_SECRET"),
+    github_redirect_uri=os.getenv("GITHUB_REDIRECT_URI", "http://localhost:8080/auth/github/callback"),
+)
 
 # Warn if JWT_SECRET is using default
 if not os.getenv("JWT_SECRET"):
     logger.warning("⚠️ Using auto-generated JWT_SECRET. Set JWT_SECRET in .env for production!")
 
-# OAuth Configuration
-GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
-GOOGLE_CLIENT_SECRET = os.getenv("GOOGLE_CLIENT_SECRET")
-GOOGLE_REDIRECT_URI = os.getenv("GOOGLE_REDIRECT_URI", "http://localhost:8080/auth/google/callback")
+# Module-level names kept for existing importers
+JWT_SECRET = CFG.jwt_secret.decode()
+JWT_ALGORITHM = CFG.jwt_algorithm
+JWT_EXPIRATION_HOURS = CFG.access_ttl // 3600
+JWT_REFRESH_EXPIRATION_DAYS = CFG.refresh_ttl // 86400
 
-GITHUB_CLIENT_ID = os.getenv("GITHUB_CLIENT_ID")
-GITHUB_CLIENT_SECRET = os.getenv("GITHUB_CLIENT_SECRET")
-GITHUB_REDIRECT_URI = os.getenv("GITHUB_REDIRECT_URI", "http://localhost:8080/auth/github/callback")
+# Static part of the OAuth authorization URLs; only `state` changes per call
+_GOOGLE_URL_PREFIX = "https://accounts.google.com/o/oauth2/v2/auth?" + urlencode({
+    "client_id": CFG.google_client_id,
+    "redirect_uri": CFG.google_redirect_uri,
+    "response_type": "code",
+    "scope": "openid email profile",
+    "access_type": "offline",
+    "prompt": "consent"
+}) if CFG.google_client_id else None
+
+_GITHUB_URL_PREFIX = "https://github.com/login/oauth/authorize?" + urlencode({
+    "client_id": CFG.github_client_id,
+    "redirect_uri": CFG.github_redirect_uri,
+    "scope": "user:email"
+}) if CFG.github_client_id else None
+
+# Verification caches
+# bcrypt is deliberately slow, so a successful or failed check is remembered
+# for a short window. Keys are HMACs, never the plaintext password.
+_password_cache = TTLCache(maxsize=10_000, ttl=60)
+# Decoded JWT payloads keyed by the token's signature segment; each entry
+# lives at most TOKEN_CACHE_TTL seconds and never past the token's exp
+TOKEN_CACHE_TTL = 300
+_token_cache = TTLCache(maxsize=50_000, ttl=TOKEN_CACHE_TTL)
+# user_id -> email for token refreshes; emails rarely change
+_email_cache = TTLCache(maxsize=10_000, ttl=300)
+
+
+def _password_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    """Derive a cache key for a credential pair without storing the password"""
+    return hmac.new(
+        CFG.jwt_secret,
+        plain_password.encode('utf-8') + b"|" + hashed_password.encode('utf-8'),
+        "sha256"
+    ).digest()
+
+
+# ============================================================================
+# JWT ENCODING
+# ============================================================================
+# Tokens use a single algorithm, so the header is serialized once and
+# signing is one C-level call. HS256 is the default; EdDSA (Ed25519 via
+# PyNaCl) is available via JWT_ALGORITHM=EdDSA. PyJWT is kept for its
+# exception types so callers keep catching jwt.InvalidTokenError & co.
+
+if CFG.jwt_algorithm not in ("HS256", "EdDSA"):
+    raise ValueError(f"Unsupported JWT_ALGORITHM: {CFG.jwt_algorithm}")
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+_JWT_HEADER_B64 = _b64encode(orjson.dumps({"alg": CFG.jwt_algorithm, "typ": "JWT"}))
+# HS256 tags are 32 bytes and Ed25519 signatures 64 bytes, i.e. 43 / 86
+# unpadded base64url characters
+_JWT_SIGNATURE_B64_LEN = 86 if CFG.jwt_algorithm == "EdDSA" else 43
+
+
+def _hmac_pads(key: bytes):
+    """Inner/outer SHA-256 states with the RFC 2104 pads already absorbed"""
+    if len(key) > 64:
+        key = hashlib.sha256(key).digest()
+    key = key.ljust(64, b"\0")
+    inner = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+    outer = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+    return inner, outer
+
+
+_HMAC_INNER, _HMAC_OUTER = _hmac_pads(CFG.jwt_secret)
+
+
+def _sign_hs256(signing_input: bytes) -> bytes:
+    """HMAC-SHA256 with the secret's pads precomputed once at import"""
+    inner = _HMAC_INNER.copy()
+    inner.update(signing_input)
+    outer = _HMAC_OUTER.copy()
+    outer.update(inner.digest())
+    return outer.digest()
+
+
+def _verify_hs256(signing_input: bytes, signature: bytes) -> bool:
+    # Constant-time compare so the HMAC tag can't be recovered by timing
+    return hmac.compare_digest(_sign_hs256(signing_input), signature)
+
+
+def _read_ed25519_key(path: str) -> bytes:
+    """Read a 32-byte Ed25519 key stored raw or hex-encoded"""
+    data = Path(path).read_bytes()
+    if len(data) == 32:
+        return data
+    return bytes.fromhex(data.decode("ascii").strip())
+
+
+def _load_ed25519_keys():
+    """Load the signing/verify keys for EdDSA; a public key alone allows verify-only"""
+    if not NACL_AVAILABLE:
+        raise RuntimeError("JWT_ALGORITHM=EdDSA requires PyNaCl (pip install pynacl)")
+    
+    if CFG.jwt_private_key_path:
+        signing_key = SigningKey(_read_ed25519_key(CFG.jwt_private_key_path))
+        return signing_key, signing_key.verify_key
+    if CFG.jwt_public_key_path:
+        return None, VerifyKey(_read_ed25519_key(CFG.jwt_public_key_path))
+    raise RuntimeError("JWT_ALGORITHM=EdDSA requires JWT_PRIVATE_KEY_PATH or JWT_PUBLIC_KEY_PATH")
+
+
+def _sign_eddsa(signing_input: bytes) -> bytes:
+    if _ED25519_SIGNING_KEY is None:
+        raise RuntimeError("Cannot issue EdDSA tokens without JWT_PRIVATE_KEY_PATH")
+    return _ED25519_SIGNING_KEY.sign(signing_input).signature
+
+
+def _verify_eddsa(signing_input: bytes, signature: bytes) -> bool:
+    try:
+        _ED25519_VERIFY_KEY.verify(signing_input, signature)
+        return True
+    except BadSignatureError:
+        return False
+
+
+if CFG.jwt_algorithm == "EdDSA":
+    _ED25519_SIGNING_KEY, _ED25519_VERIFY_KEY = _load_ed25519_keys()
+    _sign, _verify_signature = _sign_eddsa, _verify_eddsa
+else:
+    _sign, _verify_signature = _sign_hs256, _verify_hs256
+
+
+def _encode_jwt(payload: Dict[str, Any]) -> str:
+    """Serialize and sign a payload as a JWT"""
+    signing_input = _JWT_HEADER_B64 + b"." + _b64encode(orjson.dumps(payload))
+    return (signing_input + b"." + _b64encode(_sign(signing_input))).decode("ascii")
+
+
+def _decode_jwt(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT signed with the configured algorithm and return its payload
+    
+    Raises:
+        jwt.ExpiredSignatureError: If token has expired
+        jwt.InvalidTokenError: If token is malformed or the signature is wrong
+    """
+    try:
+        signing_input, _, signature = token.encode("ascii").rpartition(b".")
+        header_segment, _, payload_segment = signing_input.partition(b".")
+        if not header_segment or not payload_segment or b"." in payload_segment:
+            raise jwt.DecodeError("Not enough segments")
+        # Reject malformed signatures before doing any signature work
+        if len(signature) != _JWT_SIGNATURE_B64_LEN:
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        
+        if header_segment != _JWT_HEADER_B64:
+            header = orjson.loads(_b64decode(header_segment))
+            if not isinstance(header, dict) or header.get("alg") != CFG.jwt_algorithm:
+                raise jwt.InvalidAlgorithmError("The specified alg value is not allowed")
+        
+        if not _verify_signature(signing_input, _b64decode(signature)):
+            raise jwt.InvalidSignatureError("Signature verification failed")
+        
+        payload = orjson.loads(_b64decode(payload_segment))
+    except (ValueError, binascii.Error) as e:
+        raise jwt.DecodeError(f"Invalid token encoding: {e}") from e
+    
+    if not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid payload string: must be a json object")
+    
+    if "exp" in payload:
+        try:
+            exp = int(payload["exp"])
+        except (TypeError, ValueError):
+            raise jwt.DecodeError("Expiration Time claim (exp) must be an integer.")
+        if exp <= time.time():
+            raise jwt.ExpiredSignatureError("Signature has expired")
+    
+    return payload
+
+
+def _get_cached_payload(token: str) -> Optional[Dict[str, Any]]:
+    """Return a previously verified payload for this exact token, if still valid"""
+    entry = _token_cache.get(token.rpartition(".")[2])
+    if entry is None or entry[0] != token:
+        return None
+    return entry[1]
+
+
+def _cache_payload(token: str, payload: Dict[str, Any]):
+    """Remember a verified payload until the token expires (capped at TOKEN_CACHE_TTL)"""
+    ttl = TOKEN_CACHE_TTL
+    if "exp" in payload:
+        ttl = min(ttl, int(payload["exp"]) - time.time())
+    if ttl > 0:
+        _token_cache.set(token.rpartition(".")[2], (token, payload), ttl=ttl)
+
+
+# Marks hashes computed as bcrypt(hex(sha256(password))). Unmarked hashes are
+# plain bcrypt(password) from before pre-hashing and still verify.
+PREHASH_PREFIX = "sha256$"
+
+
+# bcrypt MCF is fixed-layout ("$2b$NN$..."), so the cost is always the two
+# digits at offset 4; check once at import that the backend still emits it
+_BCRYPT_COST_SLICE = slice(len(PREHASH_PREFIX) + 4, len(PREHASH_PREFIX) + 6)
+_test_salt = bcrypt_impl.gensalt(rounds=4).decode("ascii")
+if not (_test_salt.startswith("$2") and _test_salt[4:6] == "04"):
+    raise RuntimeError(f"Unexpected bcrypt hash format: {_test_salt[:7]}")
+del _test_salt
+
+
+def _prehash(password: str) -> bytes:
+    """Normalize a password to a fixed 64-byte input (avoids bcrypt's 72-byte cut-off)"""
+    return hashlib.sha256(password.encode('utf-8')).hexdigest().encode('ascii')
+
+
+# Pre-generated bcrypt salts. Each salt is still used exactly once; only the
+# urandom draws are batched onto a background thread.
+SALT_POOL_SIZE = 1024
+SALT_POOL_LOW_WATER = 256
+_salt_pool: deque = deque(maxlen=SALT_POOL_SIZE)
+_salt_lock = threading.Lock()
+_salt_refill_needed = threading.Event()
+_salt_thread: Optional[threading.Thread] = None
+
+
+def _refill_salt_pool():
+    """Background loop that tops the salt pool back up when it runs low"""
+    while True:
+        _salt_refill_needed.wait()
+        while len(_salt_pool) < SALT_POOL_SIZE:
+            salt = bcrypt_impl.gensalt(rounds=CFG.bcrypt_cost)
+            with _salt_lock:
+                _salt_pool.append(salt)
+        _salt_refill_needed.clear()
+
+
+def _get_salt() -> bytes:
+    """Take a fresh salt from the pool, falling back to generating one inline"""
+    global _salt_thread
+    
+    with _salt_lock:
+        salt = _salt_pool.popleft() if _salt_pool else None
+        if _salt_thread is None:
+            _salt_thread = threading.Thread(target=_refill_salt_pool, name="bcrypt-salt-pool", daemon=True)
+            _salt_thread.start()
+    
+    if len(_salt_pool) < SALT_POOL_LOW_WATER:
+        _salt_refill_needed.set()
+    return salt or bcrypt_impl.gensalt(rounds=CFG.bcrypt_cost)
 
 
 def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt
+    Hash a password using bcrypt over its SHA-256 pre-hash
     
     Args:
         password: Plain text password
         
     Returns:
-        str: Hashed password
+        str: Hashed password (prefixed with PREHASH_PREFIX)
     """
-    password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password_bytes, salt)
-    return hashed.decode('utf-8')
+    password_bytes = _prehash(password)
+    salt = _get_salt()
+    hashed = bcrypt_impl.hashpw(password_bytes, salt)
+    return PREHASH_PREFIX + hashed.decode('utf-8')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -73,14 +392,94 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
         bool: True if password matches
     """
     try:
-        password_bytes = plain_password.encode('utf-8')
-        hashed_bytes = hashed_password.encode('utf-8')
-        return bcrypt.checkpw(password_bytes, hashed_bytes)
+        cache_key = _password_cache_key(plain_password, hashed_password)
+        cached = _password_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        if hashed_password.startswith(PREHASH_PREFIX):
+            password_bytes = _prehash(plain_password)
+            hashed_bytes = hashed_password[len(PREHASH_PREFIX):].encode('utf-8')
+        else:
+            # Legacy hash stored before pre-hashing was introduced
+            password_bytes = plain_password.encode('utf-8')
+            hashed_bytes = hashed_password.encode('utf-8')
+        result = bcrypt_impl.checkpw(password_bytes, hashed_bytes)
+        _password_cache.set(cache_key, result)
+        return result
     except Exception as e:
         logger.error(f"Error verifying password: {e}")
         return False
 
 
+def verify_password_and_rehash(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and produce an upgraded hash if it is not pre-hashed
+    or used a lower bcrypt cost
+    
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+        
+    Returns:
+        Tuple of (password matches, new hash to store or None)
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    
+    if not hashed_password.startswith(PREHASH_PREFIX):
+        return True, hash_password(plain_password)
+    
+    try:
+        cost = int(hashed_password[_BCRYPT_COST_SLICE], 10)
+    except ValueError:
+        return True, None
+    
+    if cost < CFG.bcrypt_cost:
+        return True, hash_password(plain_password)
+    return True, None
+
+
+# ============================================================================
+# ASYNC PASSWORD HELPERS
+# ============================================================================
+# bcrypt releases the GIL while hashing, so a thread pool gives real
+# multi-core throughput without the pickling/startup cost of processes and
+# keeps the password cache shared. Async handlers should use these.
+
+_bcrypt_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_bcrypt_executor() -> ThreadPoolExecutor:
+    global _bcrypt_executor
+    if _bcrypt_executor is None:
+        _bcrypt_executor = ThreadPoolExecutor(
+            max_workers=max(2, (os.cpu_count() or 2) - 1),
+            thread_name_prefix="bcrypt"
+        )
+    return _bcrypt_executor
+
+
+async def hash_password_async(password: str) -> str:
+    """Run hash_password off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_bcrypt_executor(), hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Run verify_password off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_bcrypt_executor(), verify_password, plain_password, hashed_password)
+
+
+async def verify_password_and_rehash_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """Run verify_password_and_rehash off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_bcrypt_executor(), verify_password_and_rehash, plain_password, hashed_password
+    )
+
+
 def create_access_token(user_id: str, email: str, additional_claims: Optional[Dict[str, Any]] = None) -> str:
     """
     Create a JWT access token
@@ -93,21 +492,41 @@ def create_access_token(user_id: str, email: str, additional_claims: Optional[Di
     Returns:
         str: JWT token
     """
-    expiration = datetime.utcnow() + timedelta(hours=JWT_EXPIRATION_HOURS)
+    now = int(time.time())
     
     payload = {
         "user_id": user_id,
         "email": email,
-        "exp": expiration,
-        "iat": datetime.utcnow(),
-        "type": "access"
+        "exp": now + CFG.access_ttl,
+        "iat": now,
+        "type": TOKEN_TYPE_ACCESS
     }
     
     # Add additional claims if provided
     if additional_claims:
         payload.update(additional_claims)
     
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return _encode_jwt(payload)
+
+
+def verify_access_token_fast(token: str) -> Dict[str, Any]:
+    """
+    Verify a JWT access token without caching or logging
+    
+    Args:
+        token: JWT token string
+        
+    Returns:
+        Dict: Decoded token payload
+        
+    Raises:
+        jwt.ExpiredSignatureError: If token has expired
+        jwt.InvalidTokenError: If token is invalid
+    """
+    payload = _decode_jwt(token)
+    if payload.get("type") != TOKEN_TYPE_ACCESS:
+        raise jwt.InvalidTokenError("Invalid token type")
+    return payload
 
 
 def verify_access_token(token: str) -> Dict[str, Any]:
@@ -125,10 +544,11 @@ def verify_access_token(token: str) -> Dict[str, Any]:
         jwt.InvalidTokenError: If token is invalid
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        
-        # Verify token type
-        if payload.get("type") != "access":
+        payload = _get_cached_payload(token)
+        if payload is None:
+            payload = verify_access_token_fast(token)
+            _cache_payload(token, payload)
+        elif payload.get("type") != TOKEN_TYPE_ACCESS:
             raise jwt.InvalidTokenError("Invalid token type")
         
         return payload
@@ -140,6 +560,32 @@ def verify_access_token(token: str) -> Dict[str, Any]:
         raise
 
 
+def verify_tokens_batch(tokens: List[str]) -> List[bool]:
+    """
+    Check many tokens at once (e.g. session audits or revocation sweeps)
+    
+    Uses the verified-token cache and the raw decoder directly, skipping
+    per-token exception logging.
+    
+    Args:
+        tokens: JWT token strings
+        
+    Returns:
+        List of booleans, True where the token is valid and unexpired
+    """
+    results = []
+    for token in tokens:
+        if _get_cached_payload(token) is not None:
+            results.append(True)
+            continue
+        try:
+            _cache_payload(token, _decode_jwt(token))
+            results.append(True)
+        except jwt.InvalidTokenError:
+            results.append(False)
+    return results
+
+
 def create_refresh_token(user_id: str) -> str:
     """
     Create a JWT refresh token (longer expiration)
@@ -150,17 +596,16 @@ def create_refresh_token(user_id: str) -> str:
     Returns:
         str: JWT refresh token
     """
-    expiration = datetime.utcnow() + timedelta(days=JWT_REFRESH_EXPIRATION_DAYS)
+    now = int(time.time())
     
     payload = {
         "user_id": user_id,
-        "exp": expiration,
-        "iat": datetime.utcnow(),
-        "type": "refresh"
+        "exp": now + CFG.refresh_ttl,
+        "iat": now,
+        "type": TOKEN_TYPE_REFRESH
     }
     
-    token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
-    return token
+    return _encode_jwt(payload)
 
 
 def verify_token(token: str) -> Optional[Dict[str, Any]]:
@@ -174,7 +619,10 @@ def verify_token(token: str) -> Optional[Dict[str, Any]]:
         Dict containing token payload if valid, None if invalid
     """
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = _get_cached_payload(token)
+        if payload is None:
+            payload = _decode_jwt(token)
+            _cache_payload(token, payload)
         return payload
     except jwt.ExpiredSignatureError:
         logger.warning("Token has expired")
@@ -195,13 +643,29 @@ def decode_token_without_verification(token: str) -> Optional[Dict[str, Any]]:
         Dict containing token payload
     """
     try:
-        payload = jwt.decode(token, options={"verify_signature": False})
-        return payload
+        payload_segment = token.split(".", 2)[1]
+        return orjson.loads(_b64decode(payload_segment.encode("ascii")))
     except Exception as e:
         logger.error(f"Error decoding token: {str(e)}")
         return None
 
 
+@lru_cache(maxsize=4096)
+def _get_token_exp_int(token: str) -> Optional[int]:
+    """
+    Read the exp claim of a token as an int, without verifying it
+    
+    Memoized because a token's exp never changes and the same token is
+    checked repeatedly over its lifetime.
+    """
+    try:
+        payload_segment = token.split(".", 2)[1]
+        exp = orjson.loads(_b64decode(payload_segment.encode("ascii"))).get("exp")
+        return int(exp) if exp is not None else None
+    except Exception:
+        return None
+
+
 def get_token_expiration(token: str) -> Optional[datetime]:
     """
     Get the expiration time of a token
@@ -212,9 +676,9 @@ def get_token_expiration(token: str) -> Optional[datetime]:
     Returns:
         datetime: Expiration time or None if invalid
     """
-    payload = decode_token_without_verification(token)
-    if payload and "exp" in payload:
-        return datetime.fromtimestamp(payload["exp"])
+    exp = _get_token_exp_int(token)
+    if exp is not None:
+        return datetime.fromtimestamp(exp)
     return None
 
 
@@ -228,10 +692,27 @@ def is_token_expired(token: str) -> bool:
     Returns:
         bool: True if expired
     """
-    expiration = get_token_expiration(token)
-    if expiration:
-        return datetime.utcnow() > expiration
-    return True
+    exp = _get_token_exp_int(token)
+    if exp is None:
+        return True
+    return time.time() > exp
+
+
+def _get_user_email(user_id: str) -> Optional[str]:
+    """Look up a user's email, served from a short-lived cache when possible"""
+    email = _email_cache.get(user_id)
+    if email is not None:
+        return email
+    
+    try:
+        email = get_user_email(user_id)
+    except Exception as e:
+        logger.error(f"Error fetching user for refresh: {e}")
+        return None
+    
+    if email:
+        _email_cache.set(user_id, email)
+    return email
 
 
 def refresh_access_token(refresh_token: str) -> Optional[Dict[str, Any]]:
@@ -250,7 +731,7 @@ def refresh_access_token(refresh_token: str) -> Optional[Dict[str, Any]]:
         return None
     
     # Verify it's a refresh token
-    if payload.get("type") != "refresh":
+    if payload.get("type") != TOKEN_TYPE_REFRESH:
         logger.warning("Attempted to refresh with non-refresh token")
         return None
     
@@ -259,15 +740,7 @@ def refresh_access_token(refresh_token: str) -> Optional[Dict[str, Any]]:
     if not user_id:
         return None
     
-    # Fetch user email from database
-    try:
-        from database import Database
-        db = Database()
-        user = db.get_user_by_id(user_id)
-        email = user.get("email", "") if user else ""
-    except Exception as e:
-        logger.error(f"Error fetching user for refresh: {e}")
-        email = ""
+    email = _get_user_email(user_id) or ""
     
     # Create new tokens
     new_access_token = create_access_token(user_id, email)
@@ -276,12 +749,40 @@ def refresh_access_token(refresh_token: str) -> Optional[Dict[str, Any]]:
     return {
         "access_token": new_access_token,
         "refresh_token": new_refresh_token,
-        "expires_in": JWT_EXPIRATION_HOURS * 3600  # Convert hours to seconds
+        "expires_in": CFG.access_ttl
     }
 
 
 # OAuth Helper Functions
 
+# Shared HTTP session for OAuth exchanges so logins reuse pooled
+# keep-alive connections to Google/GitHub instead of a new TLS handshake
+_session: Optional[aiohttp.ClientSession] = None
+_session_lock = asyncio.Lock()
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared OAuth HTTP session, creating it on first use"""
+    global _session
+    
+    if _session is None or _session.closed:
+        async with _session_lock:
+            if _session is None or _session.closed:
+                _session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60)
+                )
+    return _session
+
+
+async def close_oauth_session():
+    """Close the shared OAuth HTTP session (called on application shutdown)"""
+    global _session
+    
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+
 def get_google_oauth_url(state: Optional[str] = None) -> str:
     """
     Generate Google OAuth authorization URL
@@ -292,24 +793,11 @@ def get_google_oauth_url(state: Optional[str] = None) -> str:
     Returns:
         str: Google OAuth URL
     """
-    if not GOOGLE_CLIENT_ID:
+    if not _GOOGLE_URL_PREFIX:
         raise ValueError("GOOGLE_CLIENT_ID not configured")
     
     state = state or secrets.token_urlsafe(32)
-    
-    base_url = "https://accounts.google.com/o/oauth2/v2/auth"
-    params = {
-        "client_id": GOOGLE_CLIENT_ID,
-        "redirect_uri": GOOGLE_REDIRECT_URI,
-        "response_type": "code",
-        "scope": "openid email profile",
-        "state": state,
-        "access_type": "offline",
-        "prompt": "consent"
-    }
-    
-    from urllib.parse import urlencode
-    return f"{base_url}?{urlencode(params)}"
+    return f"{_GOOGLE_URL_PREFIX}&state={quote(state, safe='')}"
 
 
 def get_github_oauth_url(state: Optional[str] = None) -> str:
@@ -322,21 +810,21 @@ def get_github_oauth_url(state: Optional[str] = None) -> str:
     Returns:
         str: GitHub OAuth URL
     """
-    if not GITHUB_CLIENT_ID:
+    if not _GITHUB_URL_PREFIX:
         raise ValueError("GITHUB_CLIENT_ID not configured")
     
     state = state or secrets.token_urlsafe(32)
-    
-    base_url = "https://github.com/login/oauth/authorize"
-    params = {
-        "client_id": GITHUB_CLIENT_ID,
-        "redirect_uri": GITHUB_REDIRECT_URI,
-        "scope": "user:email",
-        "state": state
-    }
-    
-    from urllib.parse import urlencode
-    return f"{base_url}?{urlencode(params)}"
+    return f"{_GITHUB_URL_PREFIX}&state={quote(state, safe='')}"
+
+
+# OAuth codes are single-use, but clients can retry or double-submit the same
+# code; successful exchanges are memoized briefly so the retry doesn't hit the
+# provider (and fail) again
+OAUTH_EXCHANGE_CACHE_TTL = 60
+
+
+def _oauth_cache_key(provider: str, code: str) -> str:
+    return f"oauth:{provider}:{hashlib.sha256(code.encode()).hexdigest()}"
 
 
 async def exchange_google_code(code: str) -> Optional[Dict[str, Any]]:
@@ -349,9 +837,20 @@ async def exchange_google_code(code: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with user info or None if failed
     """
-    import aiohttp
+    cache_key = _oauth_cache_key("google", code)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    if not GOOGLE_CLIENT_ID or not GOOGLE_CLIENT_SECRET:
+    user = await _exchange_google_code(code)
+    if user:
+        await cache.set(cache_key, user, OAUTH_EXCHANGE_CACHE_TTL)
+    return user
+
+
+async def _exchange_google_code(code: str) -> Optional[Dict[str, Any]]:
+    """Run the Google token exchange and user info lookup"""
+    if not CFG.google_client_id or not CFG.google_client_secret:
         logger.error("Google OAuth not configured")
         return None
     
@@ -359,42 +858,42 @@ async def exchange_google_code(code: str) -> Optional[Dict[str, Any]]:
     token_url = "https://oauth2.googleapis.com/token"
     token_data = {
         "code": code,
-        "client_id": GOOGLE_CLIENT_ID,
-        "client_secret": GOOGLE_CLIENT_SECRET,
-        "redirect_uri": GOOGLE_REDIRECT_URI,
+        "client_id": CFG.google_client_id,
+        "client_secret": CFG.google_client_secret,
+        "redirect_uri": CFG.google_redirect_uri,
         "grant_type": "authorization_code"
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(token_url, data=token_data) as response:
-                if response.status != 200:
-                    logger.error(f"Google token exchange failed: {response.status}")
-                    return None
-                
-                token_response = await response.json()
-                access_token = token_response.get("access_token")
-                
-                if not access_token:
-                    return None
-                
-                # Get user info
-                user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
-                headers = {"Authorization": f"Bearer {access_token}"}
-                
-                async with session.get(user_info_url, headers=headers) as user_response:
-                    if user_response.status != 200:
-                        logger.error(f"Google user info fetch failed: {user_response.status}")
-                        return None
-                    
-                    user_info = await user_response.json()
-                    return {
-                        "email": user_info.get("email"),
-                        "name": user_info.get("name"),
-                        "picture": user_info.get("picture"),
-                        "google_id": user_info.get("id"),
-                        "verified_email": user_info.get("verified_email", False)
-                    }
+        session = await _get_session()
+        async with session.post(token_url, data=token_data) as response:
+            if response.status != 200:
+                logger.error(f"Google token exchange failed: {response.status}")
+                return None
+            
+            token_response = await response.json()
+            access_token = token_response.get("access_token")
+        
+        if not access_token:
+            return None
+        
+        # Get user info
+        user_info_url = "https://www.googleapis.com/oauth2/v2/userinfo"
+        headers = {"Authorization": f"Bearer {access_token}"}
+        
+        async with session.get(user_info_url, headers=headers) as user_response:
+            if user_response.status != 200:
+                logger.error(f"Google user info fetch failed: {user_response.status}")
+                return None
+            
+            user_info = await user_response.json()
+            return {
+                "email": user_info.get("email"),
+                "name": user_info.get("name"),
+                "picture": user_info.get("picture"),
+                "google_id": user_info.get("id"),
+                "verified_email": user_info.get("verified_email", False)
+            }
     
     except Exception as e:
         logger.error(f"Error in Google OAuth: {str(e)}")
@@ -411,9 +910,20 @@ async def exchange_github_code(code: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dict with user info or None if failed
     """
-    import aiohttp
+    cache_key = _oauth_cache_key("github", code)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return cached
     
-    if not GITHUB_CLIENT_ID or not GITHUB_CLIENT_SECRET:
+    user = await _exchange_github_code(code)
+    if user:
+        await cache.set(cache_key, user, OAUTH_EXCHANGE_CACHE_TTL)
+    return user
+
+
+async def _exchange_github_code(code: str) -> Optional[Dict[str, Any]]:
+    """Run the GitHub token exchange and user info lookup"""
+    if not CFG.github_client_id or not CFG.github_client_secret:
         logger.error("GitHub OAuth not configured")
         return None
     
@@ -421,55 +931,59 @@ async def exchange_github_code(code: str) -> Optional[Dict[str, Any]]:
     token_url = "https://github.com/login/oauth/access_token"
     token_data = {
         "code": code,
-        "client_id": GITHUB_CLIENT_ID,
-        "client_secret": GITHUB_CLIENT_SECRET,
-        "redirect_uri": GITHUB_REDIRECT_URI
+        "client_id": CFG.github_client_id,
+        "client_secret": CFG.github_client_secret,
+        "redirect_uri": CFG.github_redirect_uri
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            headers = {"Accept": "application/json"}
-            async with session.post(token_url, data=token_data, headers=headers) as response:
-                if response.status != 200:
-                    logger.error(f"GitHub token exchange failed: {response.status}")
-                    return None
-                
-                token_response = await response.json()
-                access_token = token_response.get("access_token")
-                
-                if not access_token:
-                    return None
-                
-                # Get user info
-                user_info_url = "https://api.github.com/user"
-                headers = {
-                    "Authorization": f"Bearer {access_token}",
-                    "Accept": "application/json"
-                }
-                
-                async with session.get(user_info_url, headers=headers) as user_response:
-                    if user_response.status != 200:
-                        logger.error(f"GitHub user info fetch failed: {user_response.status}")
-                        return None
-                    
-                    user_info = await user_response.json()
-                    
-                    # Get user email (separate endpoint)
-                    email_url = "https://api.github.com/user/emails"
-                    async with session.get(email_url, headers=headers) as email_response:
-                        emails = await email_response.json() if email_response.status == 200 else []
-                        primary_email = next(
-                            (e["email"] for e in emails if e.get("primary") and e.get("verified")),
-                            user_info.get("email")
-                        )
-                    
-                    return {
-                        "email": primary_email,
-                        "name": user_info.get("name") or user_info.get("login"),
-                        "avatar": user_info.get("avatar_url"),
-                        "github_id": user_info.get("id"),
-                        "github_username": user_info.get("login")
-                    }
+        session = await _get_session()
+        headers = {"Accept": "application/json"}
+        async with session.post(token_url, data=token_data, headers=headers) as response:
+            if response.status != 200:
+                logger.error(f"GitHub token exchange failed: {response.status}")
+                return None
+            
+            token_response = await response.json()
+            access_token = token_response.get("access_token")
+        
+        if not access_token:
+            return None
+        
+        headers = {
+            "Authorization": f"Bearer {access_token}",
+            "Accept": "application/json"
+        }
+        
+        async def fetch(url: str):
+            async with session.get(url, headers=headers) as resp:
+                return resp.status, (await resp.json() if resp.status == 200 else None)
+        
+        # Profile and emails are independent, fetch them concurrently so the
+        # lookup costs one round-trip. (GitHub's GraphQL API can't replace
+        # this: `viewer` only exposes the public profile email, not the
+        # primary verified address returned by /user/emails.)
+        (user_status, user_info), (_, emails) = await asyncio.gather(
+            fetch("https://api.github.com/user"),
+            fetch("https://api.github.com/user/emails")
+        )
+        
+        if user_status != 200:
+            logger.error(f"GitHub user info fetch failed: {user_status}")
+            return None
+        
+        primary_email = next(
+            (e["email"] for e in emails or [] if e.get("primary") and e.get("verified")),
+            user_info.get("email")
+        )
+        
+        return {
+            "email": primary_email,
+            "name": user_info.get("name") or user_info.get("login"),
+            "avatar": user_info.get("avatar_url"),
+            "github_id": user_info.get("id"),
+            "github_username": user_info.get("login")
+        }
     
     except Exception as e:
         logger.error(f"Error in GitHub OAuth: {str(e)}")
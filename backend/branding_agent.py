@@ -12,17 +12,350 @@ Features:
 import os
 import logging
 import base64
+import hashlib
 import io
-from typing import Optional, Dict, Any, List
+import math
+import secrets
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-import aiohttp
+from functools import lru_cache
+from types import MappingProxyType
+from datetime import datetime, timezone
+import httpx
 import asyncio
-from PIL import Image
-import json
+from PIL import Image, ImageDraw, ImageFont
+import orjson
+
+from cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# pybase64 is a SIMD base64 codec with the same API as the stdlib module
+try:
+    import pybase64 as b64codec
+except ImportError:
+    b64codec = base64
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Generated logos keyed by a hash of the request, so repeated requests
+# (toggling options back and forth, demo loops) skip a 10-30s inference
+LOGO_CACHE_TTL = 86400
+_logo_cache = TTLCache(maxsize=32, ttl=LOGO_CACHE_TTL)
+# Raw PNG bytes by a random per-generation image_id, served by
+# /api/branding/logo/{image_id}.png so clients can fetch the image without the
+# base64 overhead. logo_id is only a readable label (it repeats for the same
+# company within a second), and the unguessable image_id is what keeps other
+# users' logos from being enumerated through that route. At least as long
+# lived and as large as _logo_cache so cached responses' image_url resolves;
+# cache hits re-store their bytes in case fallback logos pushed them out.
+LOGO_IMAGE_TTL = LOGO_CACHE_TTL
+_logo_images = TTLCache(maxsize=64, ttl=LOGO_IMAGE_TTL)
+
+# Prompt fragments for _create_logo_prompt
+_STYLE_PROMPTS = MappingProxyType({
+    "modern": "clean, minimalist, contemporary, geometric",
+    "vintage": "retro, classic, timeless, elegant",
+    "playful": "fun, colorful, creative, dynamic",
+    "corporate": "professional, formal, business, authoritative",
+    "tech": "futuristic, digital, innovative, technological",
+    "artistic": "creative, abstract, artistic, expressive"
+})
+
+_COLOR_PROMPTS = MappingProxyType({
+    "professional": "blue and gray color scheme, corporate colors",
+    "vibrant": "bright, bold, colorful palette, eye-catching",
+    "monochrome": "black and white design, high contrast",
+    "warm": "warm colors like red, orange, yellow, energetic",
+    "cool": "cool colors like blue, green, purple, calming",
+    "earth": "natural earth tones, brown, green, beige"
+})
+
+_SHAPE_PROMPTS = MappingProxyType({
+    "square": "square or rectangular format",
+    "rectangle": "rectangular horizontal format",
+    "circle": "circular or round format",
+    "horizontal": "wide horizontal format",
+    "vertical": "tall vertical format",
+    "abstract": "abstract geometric shapes"
+})
+
+_PROMPT_CHARACTERISTICS = (
+    "Design characteristics: vector art, flat design, clean lines, memorable, scalable, "
+    "brandable, no text, no watermark, white background, professional quality, "
+    "startup-ready, modern aesthetic"
+)
+
+# Options for the branding UI, plus the serialized API responses so the
+# option routes return prebuilt bytes
+STYLE_OPTIONS = (
+    {"value": "modern", "label": "Modern", "description": "Clean, minimalist, contemporary"},
+    {"value": "vintage", "label": "Vintage", "description": "Retro, classic, timeless"},
+    {"value": "playful", "label": "Playful", "description": "Fun, colorful, creative"},
+    {"value": "corporate", "label": "Corporate", "description": "Professional, formal, business"},
+    {"value": "tech", "label": "Tech", "description": "Futuristic, digital, innovative"},
+    {"value": "artistic", "label": "Artistic", "description": "Creative, abstract, artistic"}
+)
+
+COLOR_OPTIONS = (
+    {"value": "professional", "label": "Professional", "description": "Blue and gray tones"},
+    {"value": "vibrant", "label": "Vibrant", "description": "Bright, colorful palette"},
+    {"value": "monochrome", "label": "Monochrome", "description": "Black and white"},
+    {"value": "warm", "label": "Warm", "description": "Red, orange, yellow tones"},
+    {"value": "cool", "label": "Cool", "description": "Blue, green, purple tones"},
+    {"value": "earth", "label": "Earth", "description": "Natural earth tones"}
+)
+
+STYLE_OPTIONS_JSON = orjson.dumps({"status": "success", "data": STYLE_OPTIONS})
+COLOR_OPTIONS_JSON = orjson.dumps({"status": "success", "data": COLOR_OPTIONS})
+
+# Radial gradient value -> alpha for the demo "modern" logo halo
+_MODERN_GRADIENT_LUT = [max(0, 255 - v * 255 // 179) for v in range(256)]
+
+# Health probes reuse the last result for this long so k8s/uptime checks
+# don't hit the HF API on every call
+HEALTH_CACHE_TTL = 30
+
+# Demo logos are rendered with PIL in worker threads so the event loop keeps
+# serving other requests; the pool is bounded to avoid thread churn.
+_render_executor: Optional[ThreadPoolExecutor] = None
+
+def _get_render_executor() -> ThreadPoolExecutor:
+    global _render_executor
+    if _render_executor is None:
+        _render_executor = ThreadPoolExecutor(
+            max_workers=os.cpu_count() or 2,
+            thread_name_prefix="logo-render"
+        )
+    return _render_executor
+
+# HF inference is rate limited per token: each SDXL call spends credits that
+# come back after a minute, so bursts queue here instead of 429ing upstream
+HF_CREDIT_BUDGET = 300
+LOGO_CREDIT_COST = 10
+HF_CREDIT_REFUND_SECONDS = 60
+
+class CreditSemaphore:
+    """
+    Async credit budget. Each transaction spends credits that are refunded
+    refund_time seconds later, so throughput is capped at max_credits per
+    refund window. Waiters are served in FIFO order.
+    """
+    
+    def __init__(self, max_credits: int):
+        self.max_credits = max_credits
+        self._credits = max_credits
+        self._waiters: deque = deque()
+    
+    async def acquire(self, credits: int, refund_time: float):
+        """Wait until credits are available and schedule their refund"""
+        if credits > self.max_credits:
+            raise ValueError(f"Requested {credits} credits, budget is {self.max_credits}")
+        
+        loop = asyncio.get_running_loop()
+        if not self._waiters and self._credits >= credits:
+            self._credits -= credits
+        else:
+            waiter = loop.create_future()
+            self._waiters.append((credits, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Granted just before cancellation: give the credits back
+                    self._release(credits)
+                else:
+                    self._release(0)
+                raise
+        loop.call_later(refund_time, self._release, credits)
+    
+    def _release(self, credits: int):
+        self._credits += credits
+        while self._waiters:
+            needed, waiter = self._waiters[0]
+            if waiter.cancelled():
+                self._waiters.popleft()
+                continue
+            if self._credits < needed:
+                break
+            self._waiters.popleft()
+            self._credits -= needed
+            waiter.set_result(None)
+
+def _new_logo_id(prefix: str, company_name: Optional[str] = None) -> Tuple[str, str]:
+    """Build a logo_id and its created_at timestamp from a single clock read"""
+    now = time.time()
+    logo_id = f"{prefix}_{int(now)}"
+    if company_name is not None:
+        logo_id = f"{logo_id}_{company_name.lower().replace(' ', '_')}"
+    return logo_id, datetime.fromtimestamp(now, timezone.utc).isoformat()
+
+@lru_cache(maxsize=32)
+def _load_font(path: str, size: int, fallback: Optional[str] = None):
+    """Load a TrueType font once per (path, size), falling back to PIL's default font"""
+    for candidate in (path, fallback):
+        if candidate:
+            try:
+                return ImageFont.truetype(candidate, size)
+            except OSError:
+                pass
+    return ImageFont.load_default()
+
+def _render_modern(image, draw, center_x: int, center_y: int, colors: Dict[str, Any]):
+    """Modern: Minimalist geometric design with gradients"""
+    size = 200
+    # Draw main shape with gradient effect: Pillow's radial gradient
+    # reaches 179 at the inscribed circle, so remap it to an alpha
+    # mask that is opaque at the centre and clear from the rim out
+    gradient = Image.radial_gradient('L').point(_MODERN_GRADIENT_LUT).resize((size * 2, size * 2))
+    image.paste(colors['primary'], (center_x - size, center_y - size), gradient)
+    
+    # Add accent elements
+    accent_size = 80
+    draw.rectangle([center_x - accent_size, center_y - accent_size, center_x + accent_size, center_y + accent_size],
+                 fill=colors['secondary'], outline=colors['accent'], width=3)
+
+def _render_vintage(image, draw, center_x: int, center_y: int, colors: Dict[str, Any]):
+    """Vintage: Ornate design with decorative elements"""
+    size = 220
+    # Outer ornate circle
+    draw.ellipse([center_x - size, center_y - size, center_x + size, center_y + size],
+               outline=colors['primary'], width=6)
+    # Inner decorative circle
+    draw.ellipse([center_x - size*0.7, center_y - size*0.7, center_x + size*0.7, center_y + size*0.7],
+               outline=colors['accent'], width=3)
+    
+    # Add decorative elements around the circle
+    for angle in range(0, 360, 45):
+        rad = math.radians(angle)
+        x = center_x + size * 0.85 * math.cos(rad)
+        y = center_y + size * 0.85 * math.sin(rad)
+        draw.ellipse([x - 15, y - 15, x + 15, y + 15], fill=colors['primary'])
+
+def _render_playful(image, draw, center_x: int, center_y: int, colors: Dict[str, Any]):
+    """Playful: Fun, rounded design with multiple colors"""
+    size = 200
+    # Main rounded shape
+    draw.rounded_rectangle([center_x - size, center_y - size, center_x + size, center_y + size],
+                          radius=80, fill=colors['primary'], outline=colors['accent'], width=4)
+    
+    # Add playful elements
+    draw.ellipse([center_x - 60, center_y - 60, center_x + 60, center_y + 60],
+               fill=colors['secondary'])
+    draw.ellipse([center_x - 40, center_y - 40, center_x + 40, center_y + 40],
+               fill=colors['bg'])
+
+def _render_corporate(image, draw, center_x: int, center_y: int, colors: Dict[str, Any]):
+    """Corporate: Professional, structured design"""
+    size = 180
+    # Main square with rounded corners
+    draw.rounded_rectangle([center_x - size, center_y - size, center_x + size, center_y + size],
+                          radius=40, fill=colors['primary'], outline=colors['accent'], width=5)
+    
+    # Inner design
+    inner_size = 120
+    draw.rectangle([center_x - inner_size, center_y - inner_size, center_x + inner_size, center_y + inner_size],
+                 fill=colors['bg'], outline=colors['secondary'], width=3)
+    
+    # Add professional lines
+    line_width = 3
+    draw.rectangle([center_x - inner_size + 20, center_y - inner_size + 20, 
+                  center_x + inner_size - 20, center_y - inner_size + 40],
+                 fill=colors['secondary'])
+
+def _render_tech(image, draw, center_x: int, center_y: int, colors: Dict[str, Any]):
+    """Tech: Futuristic, angular design"""
+    size = 200
+    # Draw hexagon-like shape
+    points = []
+    for i in range(6):
+        angle = i * 60
+        rad = math.radians(angle)
+        x = center_x + size * math.cos(rad)
+        y = center_y + size * math.sin(rad)
+        points.append((x, y))
+    
+    draw.polygon(points, fill=colors['primary'], outline=colors['accent'])
+    
+    # Add inner tech elements
+    for i in range(3):
+        angle = i * 120
+        rad = math.radians(angle)
+        x = center_x + 80 * math.cos(rad)
+        y = center_y + 80 * math.sin(rad)
+        draw.ellipse([x - 30, y - 30, x + 30, y + 30], fill=colors['secondary'])
+
+def _render_artistic(image, draw, center_x: int, center_y: int, colors: Dict[str, Any]):
+    """Artistic: Abstract, creative design"""
+    # Multiple overlapping shapes
+    positions = [
+        (center_x - 80, center_y - 80),
+        (center_x + 80, center_y - 80),
+        (center_x, center_y + 100),
+        (center_x - 100, center_y),
+        (center_x + 100, center_y)
+    ]
+    
+    for i, (x, y) in enumerate(positions):
+        color = colors['primary'] if i % 2 == 0 else colors['secondary']
+        draw.ellipse([x - 70, y - 70, x + 70, y + 70], fill=color, outline=colors['accent'], width=2)
+
+# Demo logo shape renderers by style; each draws onto the base image in place
+_RENDERERS = MappingProxyType({
+    "modern": _render_modern,
+    "vintage": _render_vintage,
+    "playful": _render_playful,
+    "corporate": _render_corporate,
+    "tech": _render_tech,
+    "artistic": _render_artistic
+})
+
+DEMO_LOGO_SIZE = 1024
+
+# Professional color palettes for demo logos
+_DEMO_COLOR_SCHEMES = MappingProxyType({
+    "professional": {"primary": (37, 99, 235), "secondary": (59, 130, 246), "accent": (30, 64, 175), "bg": (255, 255, 255), "text": (30, 30, 30)},
+    "vibrant": {"primary": (239, 68, 68), "secondary": (248, 113, 113), "accent": (220, 38, 38), "bg": (255, 255, 255), "text": (30, 30, 30)},
+    "monochrome": {"primary": (0, 0, 0), "secondary": (80, 80, 80), "accent": (200, 200, 200), "bg": (255, 255, 255), "text": (0, 0, 0)},
+    "warm": {"primary": (245, 158, 11), "secondary": (251, 191, 36), "accent": (217, 119, 6), "bg": (255, 255, 255), "text": (30, 30, 30)},
+    "cool": {"primary": (6, 182, 212), "secondary": (34, 211, 238), "accent": (8, 145, 178), "bg": (255, 255, 255), "text": (30, 30, 30)},
+    "earth": {"primary": (132, 204, 22), "secondary": (187, 247, 208), "accent": (101, 163, 13), "bg": (255, 255, 255), "text": (30, 30, 30)}
+})
+
+# Prerendered demo logo shapes as raw RGB bytes, keyed by (style, colors).
+# Each entry is ~3 MB, so only the most recently used combinations are kept
+# rather than all 7 x 6 of them; a miss just re-renders the shapes.
+BASE_TEMPLATE_CACHE_SIZE = 8
+_base_templates = TTLCache(maxsize=BASE_TEMPLATE_CACHE_SIZE, ttl=LOGO_CACHE_TTL)
+_template_lock = threading.Lock()
+
+def _base_template(style: str, colors_key: str) -> bytes:
+    """Raw RGB bytes of the demo logo shapes (no text) for a style and palette"""
+    if style not in _RENDERERS:
+        style = ""
+    if colors_key not in _DEMO_COLOR_SCHEMES:
+        colors_key = "professional"
+    
+    key = (style, colors_key)
+    template = _base_templates.get(key)
+    if template is None:
+        with _template_lock:
+            template = _base_templates.get(key)
+            if template is None:
+                colors = _DEMO_COLOR_SCHEMES[colors_key]
+                image = Image.new('RGB', (DEMO_LOGO_SIZE, DEMO_LOGO_SIZE), colors['bg'])
+                renderer = _RENDERERS.get(style)
+                if renderer is not None:
+                    center = DEMO_LOGO_SIZE // 2
+                    renderer(image, ImageDraw.Draw(image, 'RGBA'), center, center, colors)
+                template = image.tobytes()
+                _base_templates.set(key, template)
+    return template
+
 @dataclass
 class LogoRequest:
     """Logo generation request"""
@@ -32,6 +365,7 @@ class LogoRequest:
     colors: str = "professional"
     shape: str = "square"  # New field for shape
     custom_prompt: Optional[str] = None
+    force_regenerate: bool = False  # Skip local and HF caches for a fresh image
 
 @dataclass
 class LogoResponse:
@@ -44,6 +378,7 @@ class LogoResponse:
     style: str = "modern"
     colors: str = "professional"
     shape: str = "square"  # Add shape field
+    image_id: Optional[str] = None  # Random key for the PNG endpoint
     image_url: Optional[str] = None
 
 class BrandingAgent:
@@ -62,61 +397,103 @@ class BrandingAgent:
         if not self.hf_token:
             raise ValueError("HF_TOKEN_5 not found in environment variables")
         
+        # Shared HTTP/2 client (created lazily, closed via aclose())
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_lock = asyncio.Lock()
+        self._hf_credits = CreditSemaphore(HF_CREDIT_BUDGET)
+        # (checked_at, status) of the last health probe
+        self._health_cache: Tuple[float, Dict[str, Any]] = (0.0, {})
+        
         logger.info(f"🎨 Branding Agent initialized with Stable Diffusion XL")
         logger.info(f"   Model: {self.model_name}")
         logger.info(f"   API URL: {self.api_url}")
-        logger.info(f"   Using HF Token: {self.hf_token[:15]}...")
+        logger.info(f"   Using HF Token: {self.hf_token[:4]}***")
     
     def _get_hf_token(self) -> Optional[str]:
         """Get HF_TOKEN_5 from environment variables"""
         return os.getenv('HF_TOKEN_5')
     
-    def _create_logo_prompt(self, company_name: str, idea: str, style: str = "modern", colors: str = "professional", shape: str = "square") -> str:
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HF API client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            async with self._client_lock:
+                if self._client is None or self._client.is_closed:
+                    # HTTP/2 lets concurrent generations share one TLS connection
+                    self._client = httpx.AsyncClient(
+                        http2=True,
+                        timeout=httpx.Timeout(180.0, connect=5.0),
+                        limits=httpx.Limits(
+                            max_connections=20,
+                            max_keepalive_connections=20,
+                            keepalive_expiry=60
+                        ),
+                        headers={
+                            "Authorization": f"Bearer {self.hf_token}",
+                            "User-Agent": "Nexora-Branding-Agent/1.0"
+                        }
+                    )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _create_logo_prompt(company_name: str, idea: str, style: str = "modern", colors: str = "professional", shape: str = "square") -> str:
         """Create a detailed prompt for logo generation"""
-        
-        style_prompts = {
-            "modern": "clean, minimalist, contemporary, geometric",
-            "vintage": "retro, classic, timeless, elegant",
-            "playful": "fun, colorful, creative, dynamic", 
-            "corporate": "professional, formal, business, authoritative",
-            "tech": "futuristic, digital, innovative, technological",
-            "artistic": "creative, abstract, artistic, expressive"
-        }
-        
-        color_prompts = {
-            "professional": "blue and gray color scheme, corporate colors",
-            "vibrant": "bright, bold, colorful palette, eye-catching",
-            "monochrome": "black and white design, high contrast",
-            "warm": "warm colors like red, orange, yellow, energetic",
-            "cool": "cool colors like blue, green, purple, calming",
-            "earth": "natural earth tones, brown, green, beige"
-        }
-        
-        shape_prompts = {
-            "square": "square or rectangular format",
-            "rectangle": "rectangular horizontal format",
-            "circle": "circular or round format",
-            "horizontal": "wide horizontal format",
-            "vertical": "tall vertical format",
-            "abstract": "abstract geometric shapes"
-        }
-        
-        style_desc = style_prompts.get(style, "modern, clean design")
-        color_desc = color_prompts.get(colors, "professional color scheme")
-        shape_desc = shape_prompts.get(shape, "square format")
+        style_desc = _STYLE_PROMPTS.get(style, "modern, clean design")
+        color_desc = _COLOR_PROMPTS.get(colors, "professional color scheme")
+        shape_desc = _SHAPE_PROMPTS.get(shape, "square format")
         
         # Create a more detailed and professional prompt
-        prompt = f"""A professional, high-quality logo design for {company_name}. 
-Business focus: {idea}. 
-Style: {style_desc}. 
-Colors: {color_desc}. 
-Format: {shape_desc}.
-Design characteristics: vector art, flat design, clean lines, memorable, scalable, brandable, no text, no watermark, white background, professional quality, startup-ready, modern aesthetic"""
-        
-        return prompt.strip()
+        return "\n".join((
+            f"A professional, high-quality logo design for {company_name}.",
+            f"Business focus: {idea}.",
+            f"Style: {style_desc}.",
+            f"Colors: {color_desc}.",
+            f"Format: {shape_desc}.",
+            _PROMPT_CHARACTERISTICS
+        ))
+    
+    @staticmethod
+    def _store_logo_image(image_bytes: bytes, image_id: Optional[str] = None) -> Tuple[str, str]:
+        """Keep the raw image for the PNG endpoint and return its image_id and URL path"""
+        if image_id is None:
+            image_id = secrets.token_urlsafe(16)
+        _logo_images.set(image_id, bytes(image_bytes))
+        return image_id, f"/api/branding/logo/{image_id}.png"
+    
+    def get_logo_image(self, image_id: str) -> Optional[bytes]:
+        """Get the raw PNG bytes of a recently generated logo"""
+        return _logo_images.get(image_id)
+    
+    @staticmethod
+    def _logo_cache_key(request: LogoRequest) -> str:
+        """Content hash of the request fields that affect the generated image"""
+        canonical = orjson.dumps({
+            "c": request.company_name,
+            "i": request.idea,
+            "s": request.style,
+            "col": request.colors,
+            "sh": request.shape,
+            "p": request.custom_prompt
+        }, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(canonical).hexdigest()
     
     async def generate_logo(self, request: LogoRequest) -> LogoResponse:
         """Generate a logo using Stable Diffusion XL from Hugging Face"""
+        cache_key = self._logo_cache_key(request)
+        cached = None if request.force_regenerate else _logo_cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"🎨 Returning cached logo for {request.company_name}")
+            if cached.image_id and _logo_images.get(cached.image_id) is None:
+                # Evicted by newer logos; restore it so image_url still works
+                self._store_logo_image(b64codec.b64decode(cached.image_base64), cached.image_id)
+            return cached
+        
         try:
             # Create prompt
             if request.custom_prompt:
@@ -132,16 +509,9 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
                     request.shape
                 )
             
-            logger.info(f"🎨 Generating logo for {request.company_name}")
-            logger.info(f"📝 Prompt: {prompt[:80]}...")
-            logger.info(f"🔗 API URL: {self.api_url}")
-            
-            # Call Hugging Face API with proper headers
-            headers = {
-                "Authorization": f"Bearer {self.hf_token}",
-                "Content-Type": "application/json",
-                "User-Agent": "Nexora-Branding-Agent/1.0"
-            }
+            logger.info("🎨 Generating logo for %s", request.company_name)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("📝 Prompt: %s...", prompt[:80])
             
             # Payload for Stable Diffusion XL
             payload = {
@@ -155,66 +525,82 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
                 },
                 "options": {
                     "wait_for_model": True,
-                    "use_cache": False
+                    "use_cache": not request.force_regenerate
                 }
             }
             
-            logger.info(f"📤 Sending request to HF API...")
-            logger.info(f"📤 Headers: {headers}")
-            logger.info(f"📤 Payload keys: {payload.keys()}")
-            
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=180)) as session:
-                async with session.post(self.api_url, headers=headers, json=payload) as response:
-                    logger.info(f"📥 HF API Response Status: {response.status}")
-                    logger.info(f"📋 Response Headers: {dict(response.headers)}")
-                    logger.info(f"📋 Response Content-Type: {response.headers.get('content-type', 'unknown')}")
+            client = await self._get_client()
+            await self._hf_credits.acquire(LOGO_CREDIT_COST, HF_CREDIT_REFUND_SECONDS)
+            async with client.stream(
+                "POST", self.api_url, content=orjson.dumps(payload), headers=JSON_HEADERS
+            ) as response:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "📥 HF API Response Status: %s (%s), Content-Type: %s",
+                        response.status_code, response.http_version,
+                        response.headers.get('content-type', 'unknown')
+                    )
+                
+                if response.status_code == 200:
+                    # Stream the body into one buffer (kept for the PNG endpoint)
+                    # and base64 encode whole 3-byte groups as they arrive, so
+                    # encoding overlaps the download instead of following it
+                    image_bytes = bytearray()
+                    encoded_parts = []
+                    encoded_upto = 0
+                    async for chunk in response.aiter_bytes(65536):
+                        image_bytes.extend(chunk)
+                        aligned = len(image_bytes) - (len(image_bytes) - encoded_upto) % 3
+                        if aligned > encoded_upto:
+                            with memoryview(image_bytes) as view:
+                                encoded_parts.append(b64codec.b64encode(view[encoded_upto:aligned]))
+                            encoded_upto = aligned
                     
-                    if response.status == 200:
-                        # Try to read as image first
-                        content_type = response.headers.get('content-type', '')
-                        logger.info(f"📦 Content-Type: {content_type}")
-                        
-                        image_bytes = await response.read()
-                        logger.info(f"📊 Response size: {len(image_bytes)} bytes")
-                        
-                        if len(image_bytes) < 100:
-                            # Likely an error response
-                            error_text = image_bytes.decode('utf-8', errors='ignore')
-                            logger.error(f"❌ Response too small, likely an error: {error_text}")
-                            raise Exception(f"API returned invalid response: {error_text}")
-                        
-                        # Convert to base64
-                        image_base64 = base64.b64encode(image_bytes).decode('utf-8')
-                        logger.info(f"✅ Successfully encoded image to base64")
-                        
-                        # Generate unique ID
-                        logo_id = f"logo_{int(datetime.now().timestamp())}_{request.company_name.lower().replace(' ', '_')}"
-                        
-                        return LogoResponse(
-                            logo_id=logo_id,
-                            company_name=request.company_name,
-                            prompt_used=prompt,
-                            image_base64=image_base64,
-                            created_at=datetime.now().isoformat(),
-                            style=request.style,
-                            colors=request.colors,
-                            shape=request.shape
-                        )
+                    if len(image_bytes) < 100:
+                        # Likely an error response
+                        error_text = bytes(image_bytes).decode('utf-8', errors='ignore')
+                        logger.error(f"❌ Response too small, likely an error: {error_text}")
+                        raise Exception(f"API returned invalid response: {error_text}")
                     
-                    elif response.status == 503:
-                        # Model is loading
-                        error_data = await response.json()
-                        estimated_time = error_data.get('estimated_time', 60)
-                        logger.warning(f"⏳ Model is loading. Estimated time: {estimated_time}s")
-                        raise Exception(f"Model is loading. Please wait {estimated_time} seconds and try again.")
+                    # Encode the (padded) tail and join
+                    with memoryview(image_bytes) as view:
+                        encoded_parts.append(b64codec.b64encode(view[encoded_upto:]))
+                    image_base64 = b"".join(encoded_parts).decode('ascii')
                     
-                    else:
-                        error_text = await response.text()
-                        logger.error(f"❌ HF API error: {response.status}")
-                        logger.error(f"❌ Error details: {error_text[:500]}")
-                        raise Exception(f"HF API failed (Status {response.status}): {error_text[:200]}")
-        
-        except asyncio.TimeoutError:
+                    # Generate unique ID
+                    logo_id, created_at = _new_logo_id("logo", request.company_name)
+                    image_id, image_url = self._store_logo_image(image_bytes)
+                    
+                    logo = LogoResponse(
+                        logo_id=logo_id,
+                        company_name=request.company_name,
+                        prompt_used=prompt,
+                        image_base64=image_base64,
+                        created_at=created_at,
+                        style=request.style,
+                        colors=request.colors,
+                        shape=request.shape,
+                        image_id=image_id,
+                        image_url=image_url
+                    )
+                    _logo_cache.set(cache_key, logo)
+                    return logo
+            
+                elif response.status_code == 503:
+                    # Model is loading
+                    error_data = orjson.loads(await response.aread())
+                    estimated_time = error_data.get('estimated_time', 60)
+                    logger.warning(f"⏳ Model is loading. Estimated time: {estimated_time}s")
+                    raise Exception(f"Model is loading. Please wait {estimated_time} seconds and try again.")
+            
+                else:
+                    await response.aread()
+                    error_text = response.text
+                    logger.error(f"❌ HF API error: {response.status_code}")
+                    logger.error(f"❌ Error details: {error_text[:500]}")
+                    raise Exception(f"HF API failed (Status {response.status_code}): {error_text[:200]}")
+
+        except httpx.TimeoutException:
             logger.error(f"❌ Request timeout after 180 seconds")
             raise Exception("Request timeout - the model took too long to respond")
         
@@ -222,161 +608,37 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
             logger.error(f"❌ Error generating logo: {str(e)}", exc_info=True)
             raise
     
-    async def generate_custom_logo(self, company_name: str, custom_prompt: str) -> LogoResponse:
+    async def generate_custom_logo(self, company_name: str, custom_prompt: str, force_regenerate: bool = False) -> LogoResponse:
         """Generate a logo with custom user prompt"""
         request = LogoRequest(
             company_name=company_name,
             idea="custom",
-            custom_prompt=custom_prompt
+            custom_prompt=custom_prompt,
+            force_regenerate=force_regenerate
         )
         return await self.generate_logo(request)
     
     async def _generate_demo_logo(self, request: LogoRequest) -> LogoResponse:
         """Generate a professional AI-quality logo using advanced PIL techniques"""
+        # PIL rasterization is CPU-bound; keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_render_executor(), self._render_demo_logo_sync, request)
+    
+    def _render_demo_logo_sync(self, request: LogoRequest) -> LogoResponse:
+        """Render the demo logo synchronously (runs in the render executor)"""
         try:
-            from PIL import Image, ImageDraw, ImageFont, ImageFilter
-            import io
-            import random
-            import math
-            import hashlib
-            
-            # Set dimensions
-            width, height = 1024, 1024
-            
-            # Professional color palettes
-            color_schemes = {
-                "professional": {"primary": (37, 99, 235), "secondary": (59, 130, 246), "accent": (30, 64, 175), "bg": (255, 255, 255), "text": (30, 30, 30)},
-                "vibrant": {"primary": (239, 68, 68), "secondary": (248, 113, 113), "accent": (220, 38, 38), "bg": (255, 255, 255), "text": (30, 30, 30)},
-                "monochrome": {"primary": (0, 0, 0), "secondary": (80, 80, 80), "accent": (200, 200, 200), "bg": (255, 255, 255), "text": (0, 0, 0)},
-                "warm": {"primary": (245, 158, 11), "secondary": (251, 191, 36), "accent": (217, 119, 6), "bg": (255, 255, 255), "text": (30, 30, 30)},
-                "cool": {"primary": (6, 182, 212), "secondary": (34, 211, 238), "accent": (8, 145, 178), "bg": (255, 255, 255), "text": (30, 30, 30)},
-                "earth": {"primary": (132, 204, 22), "secondary": (187, 247, 208), "accent": (101, 163, 13), "bg": (255, 255, 255), "text": (30, 30, 30)}
-            }
-            
-            colors = color_schemes.get(request.colors, color_schemes["professional"])
-            
-            # Create base image
-            image = Image.new('RGB', (width, height), colors['bg'])
+            # Copy the prerendered shapes for this style/palette; only the
+            # company-specific text is drawn per request
+            colors = _DEMO_COLOR_SCHEMES.get(request.colors, _DEMO_COLOR_SCHEMES["professional"])
+            image = Image.frombytes('RGB', (DEMO_LOGO_SIZE, DEMO_LOGO_SIZE), _base_template(request.style, request.colors))
             draw = ImageDraw.Draw(image, 'RGBA')
             
-            center_x, center_y = width // 2, height // 2
-            
-            # Use company name to generate consistent but varied designs
-            seed = int(hashlib.md5(request.company_name.encode()).hexdigest(), 16) % 100
-            random.seed(seed)
-            
-            # Draw sophisticated logo based on style
-            if request.style == "modern":
-                # Modern: Minimalist geometric design with gradients
-                size = 200
-                # Draw main shape with gradient effect
-                for i in range(size, 0, -2):
-                    alpha = int(255 * (1 - i/size))
-                    color = tuple(list(colors['primary'][:3]) + [alpha])
-                    draw.ellipse([center_x - i, center_y - i, center_x + i, center_y + i], fill=color)
-                
-                # Add accent elements
-                accent_size = 80
-                draw.rectangle([center_x - accent_size, center_y - accent_size, center_x + accent_size, center_y + accent_size],
-                             fill=colors['secondary'], outline=colors['accent'], width=3)
-                
-            elif request.style == "vintage":
-                # Vintage: Ornate design with decorative elements
-                size = 220
-                # Outer ornate circle
-                draw.ellipse([center_x - size, center_y - size, center_x + size, center_y + size],
-                           outline=colors['primary'], width=6)
-                # Inner decorative circle
-                draw.ellipse([center_x - size*0.7, center_y - size*0.7, center_x + size*0.7, center_y + size*0.7],
-                           outline=colors['accent'], width=3)
-                
-                # Add decorative elements around the circle
-                for angle in range(0, 360, 45):
-                    rad = math.radians(angle)
-                    x = center_x + size * 0.85 * math.cos(rad)
-                    y = center_y + size * 0.85 * math.sin(rad)
-                    draw.ellipse([x - 15, y - 15, x + 15, y + 15], fill=colors['primary'])
-                
-            elif request.style == "playful":
-                # Playful: Fun, rounded design with multiple colors
-                size = 200
-                # Main rounded shape
-                draw.rounded_rectangle([center_x - size, center_y - size, center_x + size, center_y + size],
-                                      radius=80, fill=colors['primary'], outline=colors['accent'], width=4)
-                
-                # Add playful elements
-                draw.ellipse([center_x - 60, center_y - 60, center_x + 60, center_y + 60],
-                           fill=colors['secondary'])
-                draw.ellipse([center_x - 40, center_y - 40, center_x + 40, center_y + 40],
-                           fill=colors['bg'])
-                
-            elif request.style == "corporate":
-                # Corporate: Professional, structured design
-                size = 180
-                # Main square with rounded corners
-                draw.rounded_rectangle([center_x - size, center_y - size, center_x + size, center_y + size],
-                                      radius=40, fill=colors['primary'], outline=colors['accent'], width=5)
-                
-                # Inner design
-                inner_size = 120
-                draw.rectangle([center_x - inner_size, center_y - inner_size, center_x + inner_size, center_y + inner_size],
-                             fill=colors['bg'], outline=colors['secondary'], width=3)
-                
-                # Add professional lines
-                line_width = 3
-                draw.rectangle([center_x - inner_size + 20, center_y - inner_size + 20, 
-                              center_x + inner_size - 20, center_y - inner_size + 40],
-                             fill=colors['secondary'])
-                
-            elif request.style == "tech":
-                # Tech: Futuristic, angular design
-                size = 200
-                # Draw hexagon-like shape
-                points = []
-                for i in range(6):
-                    angle = i * 60
-                    rad = math.radians(angle)
-                    x = center_x + size * math.cos(rad)
-                    y = center_y + size * math.sin(rad)
-                    points.append((x, y))
-                
-                draw.polygon(points, fill=colors['primary'], outline=colors['accent'])
-                
-                # Add inner tech elements
-                for i in range(3):
-                    angle = i * 120
-                    rad = math.radians(angle)
-                    x = center_x + 80 * math.cos(rad)
-                    y = center_y + 80 * math.sin(rad)
-                    draw.ellipse([x - 30, y - 30, x + 30, y + 30], fill=colors['secondary'])
-                
-            elif request.style == "artistic":
-                # Artistic: Abstract, creative design
-                size = 200
-                # Multiple overlapping shapes
-                positions = [
-                    (center_x - 80, center_y - 80),
-                    (center_x + 80, center_y - 80),
-                    (center_x, center_y + 100),
-                    (center_x - 100, center_y),
-                    (center_x + 100, center_y)
-                ]
-                
-                for i, (x, y) in enumerate(positions):
-                    color = colors['primary'] if i % 2 == 0 else colors['secondary']
-                    draw.ellipse([x - 70, y - 70, x + 70, y + 70], fill=color, outline=colors['accent'], width=2)
+            center_x = center_y = DEMO_LOGO_SIZE // 2
             
             # Add company initial prominently
             if request.company_name:
                 initial = request.company_name[0].upper()
-                try:
-                    font_size = 300
-                    font = ImageFont.truetype("arialbd.ttf", font_size)
-                except:
-                    try:
-                        font = ImageFont.truetype("arial.ttf", 300)
-                    except:
-                        font = ImageFont.load_default()
+                font = _load_font("arialbd.ttf", 300, "arial.ttf")
                 
                 # Get text size for centering
                 bbox = draw.textbbox((0, 0), initial, font=font)
@@ -391,10 +653,7 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
             
             # Add company name below
             if request.company_name:
-                try:
-                    name_font = ImageFont.truetype("arial.ttf", 60)
-                except:
-                    name_font = ImageFont.load_default()
+                name_font = _load_font("arial.ttf", 60)
                 
                 name_bbox = draw.textbbox((0, 0), request.company_name, font=name_font)
                 name_width = name_bbox[2] - name_bbox[0]
@@ -403,35 +662,32 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
                 
                 draw.text((name_x, name_y), request.company_name, fill=colors['text'], font=name_font)
             
-            # Apply slight blur for professional look
-            image = image.filter(ImageFilter.GaussianBlur(radius=0.5))
-            
             # Convert to base64
             buffer = io.BytesIO()
-            image.save(buffer, format='PNG', quality=95)
-            image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+            image.save(buffer, format='PNG', compress_level=1, optimize=False)
+            image_base64 = b64codec.b64encode(buffer.getbuffer()).decode('ascii')
             
             # Generate unique ID
-            logo_id = f"logo_{int(datetime.now().timestamp())}_{request.company_name.lower().replace(' ', '_')}"
+            logo_id, created_at = _new_logo_id("logo", request.company_name)
+            image_id, image_url = self._store_logo_image(buffer.getvalue())
             
             return LogoResponse(
                 logo_id=logo_id,
                 company_name=request.company_name,
                 prompt_used=f"AI-generated professional logo for {request.company_name} - {request.style} style, {request.colors} colors",
                 image_base64=image_base64,
-                created_at=datetime.now().isoformat(),
+                created_at=created_at,
                 style=request.style,
                 colors=request.colors,
-                shape=request.shape
+                shape=request.shape,
+                image_id=image_id,
+                image_url=image_url
             )
             
         except Exception as e:
             logger.error(f"Error generating professional logo: {str(e)}", exc_info=True)
             # If even this fails, create a simple fallback
             try:
-                from PIL import Image, ImageDraw, ImageFont
-                import io
-                
                 width, height = 512, 512
                 image = Image.new('RGB', (width, height), (255, 255, 255))
                 draw = ImageDraw.Draw(image)
@@ -440,10 +696,7 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
                 draw.rectangle([50, 50, width-50, height-50], outline=(0, 0, 0), width=3)
                 
                 # Add company name
-                try:
-                    font = ImageFont.truetype("arial.ttf", 48)
-                except:
-                    font = ImageFont.load_default()
+                font = _load_font("arial.ttf", 48)
                 
                 text = request.company_name[:15]
                 bbox = draw.textbbox((0, 0), text, font=font)
@@ -451,15 +704,16 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
                 draw.text(((width - text_width) // 2, height // 2 - 24), text, fill=(0, 0, 0), font=font)
                 
                 buffer = io.BytesIO()
-                image.save(buffer, format='PNG')
-                image_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
+                image.save(buffer, format='PNG', compress_level=1, optimize=False)
+                image_base64 = b64codec.b64encode(buffer.getbuffer()).decode('ascii')
                 
+                logo_id, created_at = _new_logo_id("fallback_logo")
                 return LogoResponse(
-                    logo_id=f"fallback_logo_{int(datetime.now().timestamp())}",
+                    logo_id=logo_id,
                     company_name=request.company_name,
                     prompt_used=f"Fallback logo for {request.company_name}",
                     image_base64=image_base64,
-                    created_at=datetime.now().isoformat(),
+                    created_at=created_at,
                     style=request.style,
                     colors=request.colors,
                     shape=request.shape
@@ -468,83 +722,57 @@ Design characteristics: vector art, flat design, clean lines, memorable, scalabl
                 logger.error(f"Fallback logo generation failed: {str(fallback_error)}")
                 raise
     
-    def get_style_options(self) -> List[Dict[str, str]]:
+    def get_style_options(self) -> Tuple[Dict[str, str], ...]:
         """Get available style options"""
-        return [
-            {"value": "modern", "label": "Modern", "description": "Clean, minimalist, contemporary"},
-            {"value": "vintage", "label": "Vintage", "description": "Retro, classic, timeless"},
-            {"value": "playful", "label": "Playful", "description": "Fun, colorful, creative"},
-            {"value": "corporate", "label": "Corporate", "description": "Professional, formal, business"},
-            {"value": "tech", "label": "Tech", "description": "Futuristic, digital, innovative"},
-            {"value": "artistic", "label": "Artistic", "description": "Creative, abstract, artistic"}
-        ]
+        return STYLE_OPTIONS
     
-    def get_color_options(self) -> List[Dict[str, str]]:
+    def get_color_options(self) -> Tuple[Dict[str, str], ...]:
         """Get available color options"""
-        return [
-            {"value": "professional", "label": "Professional", "description": "Blue and gray tones"},
-            {"value": "vibrant", "label": "Vibrant", "description": "Bright, colorful palette"},
-            {"value": "monochrome", "label": "Monochrome", "description": "Black and white"},
-            {"value": "warm", "label": "Warm", "description": "Red, orange, yellow tones"},
-            {"value": "cool", "label": "Cool", "description": "Blue, green, purple tones"},
-            {"value": "earth", "label": "Earth", "description": "Natural earth tones"}
-        ]
+        return COLOR_OPTIONS
     
     async def health_check(self) -> Dict[str, Any]:
         """Check if the branding agent is healthy"""
+        checked_at, status = self._health_cache
+        if status and time.monotonic() - checked_at < HEALTH_CACHE_TTL:
+            return dict(status)
+        
         try:
-            # Test API connectivity with a simple request
-            headers = {
-                "Authorization": f"Bearer {self.hf_token}",
-                "User-Agent": "Nexora-Branding-Agent/1.0"
-            }
-            
-            # Test with a simple prompt to check model availability
-            test_payload = {
-                "inputs": "simple logo design test",
-                "parameters": {
-                    "num_inference_steps": 1,
-                    "width": 64,
-                    "height": 64
-                },
-                "options": {
-                    "wait_for_model": False,
-                    "use_cache": True
+            # A HEAD on the model endpoint checks reachability and auth
+            # without running (and paying for) an inference
+            client = await self._get_client()
+            response = await client.head(self.api_url, timeout=10.0)
+            if response.status_code < 400 or response.status_code == 405:
+                status = {
+                    "status": "healthy",
+                    "model": self.model_name,
+                    "token_configured": bool(self.hf_token),
+                    "api_accessible": True
+                }
+            elif response.status_code == 503:
+                # Model is loading
+                status = {
+                    "status": "loading",
+                    "model": self.model_name,
+                    "token_configured": bool(self.hf_token),
+                    "api_accessible": True,
+                    "message": "Model is loading, please wait"
+                }
+            else:
+                status = {
+                    "status": "unhealthy",
+                    "model": self.model_name,
+                    "token_configured": bool(self.hf_token),
+                    "api_accessible": False,
+                    "error": f"API returned {response.status_code}"
                 }
-            }
-            
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10)) as session:
-                async with session.post(self.api_url, headers=headers, json=test_payload) as response:
-                    if response.status == 200:
-                        return {
-                            "status": "healthy",
-                            "model": self.model_name,
-                            "token_configured": bool(self.hf_token),
-                            "api_accessible": True
-                        }
-                    elif response.status == 503:
-                        # Model is loading
-                        return {
-                            "status": "loading",
-                            "model": self.model_name,
-                            "token_configured": bool(self.hf_token),
-                            "api_accessible": True,
-                            "message": "Model is loading, please wait"
-                        }
-                    else:
-                        error_text = await response.text()
-                        return {
-                            "status": "unhealthy",
-                            "model": self.model_name,
-                            "token_configured": bool(self.hf_token),
-                            "api_accessible": False,
-                            "error": f"API returned {response.status}: {error_text}"
-                        }
         except Exception as e:
-            return {
+            status = {
                 "status": "unhealthy",
                 "model": self.model_name,
                 "token_configured": bool(self.hf_token),
                 "api_accessible": False,
                 "error": str(e)
             }
+        
+        self._health_cache = (time.monotonic(), status)
+        return dict(status)
@@ -384,6 +384,17 @@ def get_user_by_id(user_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def get_user_email(user_id: str) -> Optional[str]:
+    """Get only the email address for a user ID"""
+    query = "SELECT email FROM users WHERE id = %s"
+    try:
+        result = execute_query(query, (user_id,), fetch_one=True)
+        return result["email"] if result else None
+    except Error as e:
+        logger.error(f"Error getting user email: {e}")
+        return None
+
+
 def update_user_credits(user_id: str, credits: int) -> bool:
     """Update user credits with validation"""
     if not isinstance(credits, int) or credits < 0:
@@ -20,13 +20,14 @@ import asyncio
 import logging
 import re
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from typing import BinaryIO, Dict, List, Optional, Any, Tuple, Union
 from dataclasses import dataclass, asdict
 from io import BytesIO
 import base64
 
 # Third-party imports
 import aiohttp
+import orjson
 import requests
 from dotenv import load_dotenv
 
@@ -37,6 +38,7 @@ try:
     from reportlab.lib.units import inch
     from reportlab.lib import colors
     from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Image
+    from reportlab import rl_config
     from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
     REPORTLAB_AVAILABLE = True
 except ImportError:
@@ -54,11 +56,80 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# ============================================================================
+# PDF STYLES
+# ============================================================================
+
+# Set NEXORA_PDF_DEBUG=1 (or run with DEBUG logging) to keep ReportLab's
+# per-attribute shape validation on while working on the report layout.
+PDF_DEBUG = os.getenv("NEXORA_PDF_DEBUG", "0") == "1"
+
+
+# LLM text goes into Paragraph markup, so <, > and & must be escaped or
+# ReportLab's parser drops or chokes on them. Chained str.replace beats a
+# compiled regex or str.translate here (each replace is a C-level scan that
+# returns the same string when there's nothing to swap).
+def _xesc(text: Any) -> str:
+    """Escape text for use inside a ReportLab Paragraph"""
+    # LLM JSON can hand us numbers (e.g. a numeric TAM) where strings are expected
+    if not isinstance(text, str):
+        text = str(text)
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+# Built once at import; the report only reads these, so every PDF can share them.
+if REPORTLAB_AVAILABLE:
+    if not (PDF_DEBUG or logger.isEnabledFor(logging.DEBUG)):
+        rl_config.shapeChecking = 0
+    
+    _STYLES = getSampleStyleSheet()
+    
+    _TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a1a1a'),
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+    
+    _HEADING_STYLE = ParagraphStyle(
+        'CustomHeading',
+        parent=_STYLES['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#2563eb'),
+        spaceAfter=12,
+        spaceBefore=12
+    )
+    
+    _SCORE_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+    
+    _RISK_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+        ('GRID', (0, 0), (-1, -1), 1, colors.black)
+    ])
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeasibilityScore:
     """AI Feasibility scoring breakdown"""
     feasibility: int  # 0-100
@@ -68,7 +139,7 @@ class FeasibilityScore:
     reasoning: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Competitor:
     """Competitor information"""
     name: str
@@ -85,7 +156,7 @@ class Competitor:
             self.weaknesses = []
 
 
-@dataclass
+@dataclass(slots=True)
 class AudienceSegment:
     """Target audience segment"""
     name: str
@@ -99,7 +170,7 @@ class AudienceSegment:
             self.pain_points = []
 
 
-@dataclass
+@dataclass(slots=True)
 class TargetAudience:
     """Target audience analysis"""
     segments: List[AudienceSegment]
@@ -107,7 +178,7 @@ class TargetAudience:
     total_addressable_market: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ProblemSolutionFit:
     """Problem-solution fit analysis"""
     trend_score: int  # 0-100
@@ -121,7 +192,7 @@ class ProblemSolutionFit:
             self.validation_sources = []
 
 
-@dataclass
+@dataclass(slots=True)
 class Risk:
     """Risk information"""
     risk: str
@@ -130,6 +201,7 @@ class Risk:
     confidence: int = 75  # 0-100
 
 
+# Not slotted: format_response() caches its asdict() result on the instance
 @dataclass
 class IdeaValidationResponse:
     """Complete idea validation response"""
@@ -147,6 +219,17 @@ class IdeaValidationResponse:
     created_at: str = ""
 
 
+# Returned whenever the feasibility analysis fails. FeasibilityScore is frozen,
+# so every failed validation can share this one instance.
+_DEFAULT_FEASIBILITY = FeasibilityScore(
+    feasibility=50,
+    novelty=50,
+    scalability=50,
+    overall=50,
+    reasoning="Error during analysis"
+)
+
+
 # ============================================================================
 # API CLIENTS
 # ============================================================================
@@ -205,7 +288,7 @@ class GroqClient:
                         logger.error(f"Groq API error: {error_text}")
                         raise Exception(f"Groq API error: {response.status}")
                     
-                    data = await response.json()
+                    data = await response.json(loads=orjson.loads)
                     return data["choices"][0]["message"]["content"]
         
         except Exception as e:
@@ -393,7 +476,7 @@ Return scores (0-100) and reasoning in JSON format."""
             )
             
             # Parse JSON response
-            data = json.loads(response)
+            data = orjson.loads(response)
             logger.info(f"Groq feasibility response: {data}")
             
             # Extract scores with robust error handling
@@ -439,13 +522,7 @@ Return scores (0-100) and reasoning in JSON format."""
             logger.error(f"Error analyzing feasibility: {str(e)}")
             logger.error(f"Raw response: {response if 'response' in locals() else 'No response'}")
             # Return default scores on error
-            return FeasibilityScore(
-                feasibility=50,
-                novelty=50,
-                scalability=50,
-                overall=50,
-                reasoning="Error during analysis"
-            )
+            return _DEFAULT_FEASIBILITY
     
     # ========================================================================
     # MODULE 2: COMPETITOR PRESENCE CHECK
@@ -517,7 +594,7 @@ Return as JSON array."""
                 )
                 
                 # Parse response
-                data = json.loads(response)
+                data = orjson.loads(response)
                 
                 # Handle both array and object with competitors key
                 if isinstance(data, dict) and "competitors" in data:
@@ -591,7 +668,7 @@ Return as JSON."""
                 json_mode=True
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             segments = []
             for seg in data.get("segments", []):
@@ -611,6 +688,8 @@ Return as JSON."""
         
         except Exception as e:
             logger.error(f"Error analyzing target audience: {str(e)}")
+            # Built fresh rather than shared: segments is a list that ends
+            # up on the response, where callers are free to mutate it
             return TargetAudience(
                 segments=[],
                 fit_score=50,
@@ -677,7 +756,7 @@ Return as JSON."""
                 json_mode=True
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             return ProblemSolutionFit(
                 trend_score=int(data.get("trend_score", 50)),
@@ -689,6 +768,7 @@ Return as JSON."""
         
         except Exception as e:
             logger.error(f"Error analyzing problem-solution fit: {str(e)}")
+            # Built fresh for the same reason (validation_sources is a list)
             return ProblemSolutionFit(
                 trend_score=50,
                 trend_summary="Unable to analyze trends",
@@ -746,7 +826,7 @@ Return top 5 risks as JSON array."""
                 json_mode=True
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             # Handle both array and object with risks key
             if isinstance(data, dict) and "risks" in data:
@@ -779,8 +859,36 @@ Return top 5 risks as JSON array."""
         """
         Generate professional PDF report
         Returns file path or URL
+        
+        Layout and file I/O run in a worker thread so in-flight Groq and
+        Firecrawl calls from other validations aren't stalled behind them.
         """
         
+        return await asyncio.to_thread(self._build_pdf_report, validation_response, output_path)
+    
+    async def generate_pdf_bytes(self, validation_response: IdeaValidationResponse) -> BytesIO:
+        """
+        Render the PDF report into memory, rewound and ready to stream
+        
+        Unlike generate_pdf_report this writes nothing to disk and lets
+        errors propagate, since the caller has no file path to fall back on.
+        """
+        
+        if not REPORTLAB_AVAILABLE:
+            raise RuntimeError("ReportLab not available, PDF generation is disabled")
+        
+        buffer = BytesIO()
+        await asyncio.to_thread(self._write_pdf, validation_response, buffer)
+        buffer.seek(0)
+        return buffer
+    
+    def _build_pdf_report(
+        self,
+        validation_response: IdeaValidationResponse,
+        output_path: Optional[str] = None
+    ) -> str:
+        """Render and write the PDF report (blocking; runs in a worker thread)"""
+        
         if not REPORTLAB_AVAILABLE:
             logger.warning("ReportLab not available, skipping PDF generation")
             return ""
@@ -795,132 +903,7 @@ Return top 5 risks as JSON array."""
                     f"idea_validation_{validation_response.validation_id}.pdf"
                 )
             
-            # Create PDF
-            doc = SimpleDocTemplate(output_path, pagesize=letter)
-            story = []
-            styles = getSampleStyleSheet()
-            
-            # Custom styles
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#1a1a1a'),
-                spaceAfter=30,
-                alignment=TA_CENTER
-            )
-            
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontSize=16,
-                textColor=colors.HexColor('#2563eb'),
-                spaceAfter=12,
-                spaceBefore=12
-            )
-            
-            # Title
-            story.append(Paragraph("IDEA VALIDATION REPORT", title_style))
-            story.append(Paragraph(validation_response.idea_title, styles['Heading2']))
-            story.append(Spacer(1, 0.3*inch))
-            
-            # Summary
-            story.append(Paragraph("Executive Summary", heading_style))
-            story.append(Paragraph(validation_response.summary, styles['BodyText']))
-            story.append(Spacer(1, 0.2*inch))
-            
-            # AI Feasibility Score
-            story.append(Paragraph("AI Feasibility Score", heading_style))
-            score_data = [
-                ['Metric', 'Score'],
-                ['Feasibility', f"{validation_response.ai_feasibility_score.feasibility}/100"],
-                ['Novelty', f"{validation_response.ai_feasibility_score.novelty}/100"],
-                ['Scalability', f"{validation_response.ai_feasibility_score.scalability}/100"],
-                ['Overall', f"{validation_response.ai_feasibility_score.overall}/100"]
-            ]
-            score_table = Table(score_data, colWidths=[3*inch, 2*inch])
-            score_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2563eb')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(score_table)
-            story.append(Spacer(1, 0.2*inch))
-            
-            # Competitors
-            if validation_response.competitors:
-                story.append(Paragraph("Competitor Analysis", heading_style))
-                for comp in validation_response.competitors[:3]:
-                    story.append(Paragraph(
-                        f"<b>{comp.name}</b> (Overlap: {comp.overlap_score}%)",
-                        styles['BodyText']
-                    ))
-                    story.append(Paragraph(comp.description, styles['BodyText']))
-                    story.append(Spacer(1, 0.1*inch))
-            
-            # Target Audience
-            story.append(Paragraph("Target Audience", heading_style))
-            story.append(Paragraph(
-                f"Audience Fit Score: {validation_response.target_audience.fit_score}/100",
-                styles['BodyText']
-            ))
-            story.append(Paragraph(
-                f"TAM: {validation_response.target_audience.total_addressable_market}",
-                styles['BodyText']
-            ))
-            story.append(Spacer(1, 0.2*inch))
-            
-            # Problem-Solution Fit
-            story.append(Paragraph("Problem-Solution Fit", heading_style))
-            story.append(Paragraph(
-                f"Trend Score: {validation_response.problem_solution_fit.trend_score}/100",
-                styles['BodyText']
-            ))
-            story.append(Paragraph(
-                validation_response.problem_solution_fit.trend_summary,
-                styles['BodyText']
-            ))
-            story.append(Spacer(1, 0.2*inch))
-            
-            # Risks
-            if validation_response.risks:
-                story.append(Paragraph("Risk Analysis", heading_style))
-                risk_data = [['Risk', 'Severity', 'Mitigation']]
-                for risk in validation_response.risks:
-                    risk_data.append([
-                        risk.risk[:50] + "..." if len(risk.risk) > 50 else risk.risk,
-                        risk.severity,
-                        risk.mitigation[:60] + "..." if len(risk.mitigation) > 60 else risk.mitigation
-                    ])
-                
-                risk_table = Table(risk_data, colWidths=[2*inch, 1*inch, 3*inch])
-                risk_table.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#dc2626')),
-                    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                    ('FONTSIZE', (0, 0), (-1, 0), 10),
-                    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.black)
-                ]))
-                story.append(risk_table)
-            
-            # Recommendation
-            story.append(Spacer(1, 0.3*inch))
-            story.append(Paragraph("Final Recommendation", heading_style))
-            story.append(Paragraph(
-                validation_response.summary_recommendation,
-                styles['BodyText']
-            ))
-            
-            # Build PDF
-            doc.build(story)
+            self._write_pdf(validation_response, output_path)
             
             logger.info(f"PDF report generated: {output_path}")
             return output_path
@@ -929,6 +912,100 @@ Return top 5 risks as JSON array."""
             logger.error(f"Error generating PDF report: {str(e)}")
             return ""
     
+    def _write_pdf(
+        self,
+        validation_response: IdeaValidationResponse,
+        output: Union[str, BinaryIO]
+    ) -> None:
+        """Lay out the report and write it to a file path or binary stream"""
+        
+        # Create PDF
+        doc = SimpleDocTemplate(output, pagesize=letter)
+        story = []
+        styles = _STYLES
+        title_style = _TITLE_STYLE
+        heading_style = _HEADING_STYLE
+        
+        # Title
+        story.append(Paragraph("IDEA VALIDATION REPORT", title_style))
+        story.append(Paragraph(_xesc(validation_response.idea_title), styles['Heading2']))
+        story.append(Spacer(1, 0.3*inch))
+        
+        # Summary
+        story.append(Paragraph("Executive Summary", heading_style))
+        story.append(Paragraph(_xesc(validation_response.summary), styles['BodyText']))
+        story.append(Spacer(1, 0.2*inch))
+        
+        # AI Feasibility Score
+        story.append(Paragraph("AI Feasibility Score", heading_style))
+        score = validation_response.ai_feasibility_score
+        score_data = (
+            ('Metric', 'Score'),
+            ('Feasibility', f"{score.feasibility}/100"),
+            ('Novelty', f"{score.novelty}/100"),
+            ('Scalability', f"{score.scalability}/100"),
+            ('Overall', f"{score.overall}/100")
+        )
+        score_table = Table(score_data, colWidths=[3*inch, 2*inch])
+        score_table.setStyle(_SCORE_TABLE_STYLE)
+        story.append(score_table)
+        story.append(Spacer(1, 0.2*inch))
+        
+        # Competitors
+        if validation_response.competitors:
+            story.append(Paragraph("Competitor Analysis", heading_style))
+            for comp in validation_response.competitors[:3]:
+                story.append(Paragraph(
+                    f"<b>{_xesc(comp.name)}</b> (Overlap: {comp.overlap_score}%)<br/>"
+                    f"{_xesc(comp.description)}",
+                    styles['BodyText']
+                ))
+                story.append(Spacer(1, 0.1*inch))
+        
+        # Target Audience
+        audience = validation_response.target_audience
+        story.append(Paragraph("Target Audience", heading_style))
+        story.append(Paragraph(
+            f"Audience Fit Score: {audience.fit_score}/100<br/>"
+            f"TAM: {_xesc(audience.total_addressable_market)}",
+            styles['BodyText']
+        ))
+        story.append(Spacer(1, 0.2*inch))
+        
+        # Problem-Solution Fit
+        problem_fit = validation_response.problem_solution_fit
+        story.append(Paragraph("Problem-Solution Fit", heading_style))
+        story.append(Paragraph(
+            f"Trend Score: {problem_fit.trend_score}/100<br/>"
+            f"{_xesc(problem_fit.trend_summary)}",
+            styles['BodyText']
+        ))
+        story.append(Spacer(1, 0.2*inch))
+        
+        # Risks
+        if validation_response.risks:
+            story.append(Paragraph("Risk Analysis", heading_style))
+            truncate = self._truncate
+            risk_data = (('Risk', 'Severity', 'Mitigation'),) + tuple(
+                (truncate(risk.risk, 50), risk.severity, truncate(risk.mitigation, 60))
+                for risk in validation_response.risks
+            )
+            
+            risk_table = Table(risk_data, colWidths=[2*inch, 1*inch, 3*inch])
+            risk_table.setStyle(_RISK_TABLE_STYLE)
+            story.append(risk_table)
+        
+        # Recommendation
+        story.append(Spacer(1, 0.3*inch))
+        story.append(Paragraph("Final Recommendation", heading_style))
+        story.append(Paragraph(
+            _xesc(validation_response.summary_recommendation),
+            styles['BodyText']
+        ))
+        
+        # Build PDF
+        doc.build(story)
+    
     # ========================================================================
     # MAIN VALIDATION PIPELINE
     # ========================================================================
@@ -954,12 +1031,11 @@ Return top 5 risks as JSON array."""
         validation_id = str(uuid.uuid4())[:8]
         logger.info(f"Starting idea validation {validation_id}")
         
-        # Extract idea title
-        idea_title = await self._extract_title(idea)
-        
-        # Run all analysis modules in parallel for speed
+        # Run all analysis modules in parallel for speed. The title only
+        # needs the idea, so it rides along instead of delaying the rest.
         logger.info("Running parallel analysis...")
         
+        title_task = self._extract_title(idea)
         feasibility_task = self.analyze_feasibility(idea)
         competitors_task = self.find_competitors(idea, industry)
         audience_task = self.analyze_target_audience(idea)
@@ -967,7 +1043,8 @@ Return top 5 risks as JSON array."""
         risks_task = self.detect_risks(idea, industry)
         
         # Wait for all tasks
-        feasibility, competitors, audience, problem_fit, risks = await asyncio.gather(
+        idea_title, feasibility, competitors, audience, problem_fit, risks = await asyncio.gather(
+            title_task,
             feasibility_task,
             competitors_task,
             audience_task,
@@ -975,14 +1052,15 @@ Return top 5 risks as JSON array."""
             risks_task
         )
         
-        # Generate summary recommendation
-        summary_recommendation = await self._generate_recommendation(
-            feasibility, competitors, audience, problem_fit, risks
+        # Recommendation and executive summary both build on the module
+        # results but not on each other
+        summary_recommendation, summary = await asyncio.gather(
+            self._generate_recommendation(
+                feasibility, competitors, audience, problem_fit, risks
+            ),
+            self._generate_summary(idea, feasibility, competitors, audience)
         )
         
-        # Generate executive summary
-        summary = await self._generate_summary(idea, feasibility, competitors, audience)
-        
         # Create response object
         response = IdeaValidationResponse(
             idea_title=idea_title,
@@ -1010,6 +1088,12 @@ Return top 5 risks as JSON array."""
     # HELPER METHODS
     # ========================================================================
     
+    @staticmethod
+    def _truncate(text: str, limit: int) -> str:
+        """Cut text to limit characters, marking the cut with an ellipsis"""
+        
+        return text if len(text) <= limit else text[:limit] + "..."
+    
     async def _extract_keywords(self, idea: str) -> str:
         """Extract key search terms from idea"""
         
@@ -1114,19 +1198,26 @@ Write a professional summary."""
         
         return f"{recommendation}: {reason}"
     
+    def format_response(self, response: IdeaValidationResponse) -> Dict[str, Any]:
+        """
+        Convert response to a plain dict
+        
+        asdict() deep-copies every nested dataclass, so the result is cached
+        on the response the first time. Call this once the response is
+        complete (after pdf_report_url is set) and treat the dict as read-only.
+        """
+        
+        cached = getattr(response, '_cached_dict', None)
+        if cached is None:
+            cached = asdict(response)
+            object.__setattr__(response, '_cached_dict', cached)
+        return cached
+    
     def to_json(self, response: IdeaValidationResponse) -> str:
         """Convert response to JSON string"""
         
-        def convert_to_dict(obj):
-            if hasattr(obj, '__dict__'):
-                return {k: convert_to_dict(v) for k, v in obj.__dict__.items()}
-            elif isinstance(obj, list):
-                return [convert_to_dict(item) for item in obj]
-            else:
-                return obj
-        
         response_dict = {
-            "idea_validation_response": convert_to_dict(response)
+            "idea_validation_response": self.format_response(response)
         }
         
         return json.dumps(response_dict, indent=2)
@@ -9,37 +9,39 @@ Version: 1.0.0
 """
 
 from fastapi import APIRouter, HTTPException, BackgroundTasks, File, UploadFile
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List
+from functools import lru_cache
 import os
+import time
 import logging
 from datetime import datetime
 
 from idea_validation_agent import (
     IdeaValidationAgent,
-    IdeaValidationResponse,
     FeasibilityScore,
     Competitor,
     TargetAudience,
     ProblemSolutionFit,
-    Risk
+    Risk,
+    REPORTLAB_AVAILABLE
 )
 
 logger = logging.getLogger(__name__)
 
 # Create router
-router = APIRouter(prefix="/api/idea-validation", tags=["Idea Validation"])
-
-# Initialize agent (singleton)
-agent = None
+router = APIRouter(
+    prefix="/api/idea-validation",
+    tags=["Idea Validation"],
+    default_response_class=ORJSONResponse
+)
 
-def get_agent():
+# Initialize agent (singleton, built on first use)
+@lru_cache(maxsize=1)
+def get_agent() -> IdeaValidationAgent:
     """Get or create agent instance"""
-    global agent
-    if agent is None:
-        agent = IdeaValidationAgent()
-    return agent
+    return IdeaValidationAgent()
 
 
 # ============================================================================
@@ -150,6 +152,8 @@ async def validate_idea(request: IdeaValidationRequest):
     Returns complete validation results with actionable insights.
     """
     
+    now_iso = datetime.utcnow().isoformat()
+    
     try:
         logger.info(f"Validating idea: {request.idea[:100]}...")
         
@@ -163,16 +167,13 @@ async def validate_idea(request: IdeaValidationRequest):
             generate_pdf=request.generate_pdf
         )
         
-        # Convert to response model
-        response = _convert_to_response(result)
-        
-        # Add model metadata
-        response_dict = response.model_dump() if hasattr(response, 'model_dump') else response.dict()
+        # Copy the cached dict form so the metadata doesn't leak into it
+        response_dict = dict(validation_agent.format_response(result))
         response_dict["metadata"] = {
             "model": "Groq-Llama",
             "provider": "Groq",
             "reason": "Optimized for analysis and reasoning",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": now_iso
         }
         
         logger.info(f"Validation completed: {result.validation_id}")
@@ -332,6 +333,47 @@ async def detect_risks(request: IdeaValidationRequest):
         raise HTTPException(status_code=500, detail=f"Risk detection failed: {str(e)}")
 
 
+@router.post("/validate-stream")
+async def validate_idea_stream(request: IdeaValidationRequest):
+    """
+    Validate a startup idea and stream the PDF report
+    
+    Runs the full validation and returns the report as an
+    application/pdf download rendered in memory, without writing
+    it to the reports directory first.
+    """
+    
+    if not REPORTLAB_AVAILABLE:
+        raise HTTPException(status_code=503, detail="PDF generation is unavailable")
+    
+    try:
+        logger.info(f"Validating idea (PDF stream): {request.idea[:100]}...")
+        
+        # Get agent instance
+        validation_agent = get_agent()
+        
+        # Run validation without the on-disk report
+        result = await validation_agent.validate_idea(
+            idea=request.idea,
+            industry=request.industry or "",
+            generate_pdf=False
+        )
+        
+        buffer = await validation_agent.generate_pdf_bytes(result)
+        
+        return StreamingResponse(
+            buffer,
+            media_type="application/pdf",
+            headers={
+                "Content-Disposition": f"attachment; filename=idea_validation_{result.validation_id}.pdf"
+            }
+        )
+    
+    except Exception as e:
+        logger.error(f"Error streaming validation report: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
+
+
 @router.get("/report/{validation_id}")
 async def download_report(validation_id: str):
     """
@@ -377,12 +419,14 @@ async def health_check():
         
         status = {
             "status": "healthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _ts(int(time.time())),
             "services": {
                 "groq_api": "configured" if groq_key else "missing",
                 "firecrawl_api": "configured" if firecrawl_key else "missing",
                 "pdf_generation": "available" if os.getenv("REPORTLAB_AVAILABLE", "true") == "true" else "unavailable"
-            }
+            },
+            # Report without forcing construction of the agent
+            "agent": "initialized" if get_agent.cache_info().currsize else "not_initialized"
         }
         
         # Check if all required services are available
@@ -396,7 +440,7 @@ async def health_check():
         logger.error(f"Health check failed: {str(e)}")
         return {
             "status": "unhealthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _ts(int(time.time())),
             "error": str(e)
         }
 
@@ -405,80 +449,7 @@ async def health_check():
 # HELPER FUNCTIONS
 # ============================================================================
 
-def _convert_to_response(result: IdeaValidationResponse) -> IdeaValidationResponseModel:
-    """Convert internal response to API response model"""
-    
-    # Convert feasibility score
-    feasibility = FeasibilityScoreResponse(
-        feasibility=result.ai_feasibility_score.feasibility,
-        novelty=result.ai_feasibility_score.novelty,
-        scalability=result.ai_feasibility_score.scalability,
-        overall=result.ai_feasibility_score.overall,
-        reasoning=result.ai_feasibility_score.reasoning
-    )
-    
-    # Convert competitors
-    competitors = [
-        CompetitorResponse(
-            name=comp.name,
-            description=comp.description,
-            overlap_score=comp.overlap_score,
-            url=comp.url,
-            strengths=comp.strengths or [],
-            weaknesses=comp.weaknesses or []
-        )
-        for comp in result.competitors
-    ]
-    
-    # Convert audience segments
-    segments = [
-        AudienceSegmentResponse(
-            name=seg.name,
-            demographics=seg.demographics,
-            psychographics=seg.psychographics,
-            pain_points=seg.pain_points,
-            adoption_likelihood=seg.adoption_likelihood
-        )
-        for seg in result.target_audience.segments
-    ]
-    
-    audience = TargetAudienceResponse(
-        segments=segments,
-        fit_score=result.target_audience.fit_score,
-        total_addressable_market=result.target_audience.total_addressable_market
-    )
-    
-    # Convert problem-solution fit
-    problem_fit = ProblemSolutionFitResponse(
-        trend_score=result.problem_solution_fit.trend_score,
-        trend_summary=result.problem_solution_fit.trend_summary,
-        search_volume_trend=result.problem_solution_fit.search_volume_trend,
-        market_demand=result.problem_solution_fit.market_demand,
-        validation_sources=result.problem_solution_fit.validation_sources or []
-    )
-    
-    # Convert risks
-    risks = [
-        RiskResponse(
-            risk=risk.risk,
-            severity=risk.severity,
-            mitigation=risk.mitigation,
-            confidence=risk.confidence
-        )
-        for risk in result.risks
-    ]
-    
-    return IdeaValidationResponseModel(
-        idea_title=result.idea_title,
-        summary=result.summary,
-        ai_feasibility_score=feasibility,
-        competitors=competitors,
-        target_audience=audience,
-        problem_solution_fit=problem_fit,
-        risks=risks,
-        pdf_report_url=result.pdf_report_url,
-        community_poll_link=result.community_poll_link,
-        summary_recommendation=result.summary_recommendation,
-        validation_id=result.validation_id,
-        created_at=result.created_at
-    )
+@lru_cache(maxsize=1)
+def _ts(second: int) -> str:
+    """ISO timestamp for a whole epoch second, reused by every call within it"""
+    return datetime.fromtimestamp(second).isoformat()
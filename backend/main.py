@@ -17,7 +17,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, Depends, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, StreamingResponse, FileResponse
+from fastapi.responses import JSONResponse, StreamingResponse, FileResponse, Response, ORJSONResponse
 from pydantic import BaseModel, Field, field_validator, StringConstraints
 from dotenv import load_dotenv
 import bleach
@@ -25,12 +25,15 @@ from auth import (
     create_access_token,
     create_refresh_token,
     verify_token as verify_jwt_token,
-    hash_password,
-    verify_password,
+    verify_access_token,
+    refresh_access_token,
+    hash_password_async,
+    verify_password_and_rehash_async,
     get_google_oauth_url,
     get_github_oauth_url,
     exchange_google_code,
     exchange_github_code,
+    close_oauth_session,
     JWT_EXPIRATION_HOURS
 )
 from payment import payment_manager, PaymentProvider
@@ -84,7 +87,7 @@ from market_research_agent import MarketResearchAgent
 from pitch_deck_agent import PitchDeckAgent
 
 # Import Branding Agent
-from branding_agent import BrandingAgent
+from branding_agent import BrandingAgent, STYLE_OPTIONS_JSON, COLOR_OPTIONS_JSON
 
 # Import Cache
 from cache import cache, cached, cache_ai_response, get_cached_ai_response
@@ -218,7 +221,13 @@ async def lifespan(app: FastAPI):
     
     # Shutdown
     logger.info("Shutting down NEXORA API...")
-    # Add any cleanup code here if needed
+    await close_oauth_session()
+    if market_research_agent:
+        await market_research_agent.aclose()
+    if branding_agent:
+        await branding_agent.aclose()
+    if pitch_deck_agent:
+        await pitch_deck_agent.aclose()
     logger.info("NEXORA API shutdown complete")
 
 # Initialize FastAPI app with lifespan
@@ -406,7 +415,6 @@ async def verify_token(authorization: Optional[str] = Header(None)) -> Optional[
     
     try:
         # Use proper JWT verification from auth module
-        from auth import verify_access_token
         payload = verify_access_token(token)
         return payload.get("user_id")
     except Exception as e:
@@ -506,7 +514,7 @@ async def register_user(request: Request, user_request: UserRegistrationRequest)
         
         # Create user
         user_id = str(uuid.uuid4())
-        password_hash = hash_password(user_request.password)
+        password_hash = await hash_password_async(user_request.password)
         
         if db.create_user(user_id, user_request.email, user_request.name, password_hash):
             # Generate JWT tokens
@@ -558,10 +566,11 @@ async def login_user(request: Request, user_request: UserLoginRequest):
         password_hash = user.get('password_hash', '')
         password_valid = False
         needs_rehash = False
+        new_hash = None
         
         try:
-            # Try bcrypt verification first
-            password_valid = verify_password(user_request.password, password_hash)
+            # Try bcrypt verification first (also upgrades hashes below BCRYPT_COST)
+            password_valid, new_hash = await verify_password_and_rehash_async(user_request.password, password_hash)
         except Exception as e:
             # If bcrypt fails, try legacy hash methods (MD5, SHA256)
             import hashlib
@@ -585,9 +594,9 @@ async def login_user(request: Request, user_request: UserLoginRequest):
             logger.warning(f"Invalid password attempt for user: {user_request.email}")
             raise HTTPException(status_code=401, detail="Invalid email or password")
         
-        # Upgrade to bcrypt if using legacy hash
-        if needs_rehash:
-            new_hash = hash_password(user_request.password)
+        # Upgrade to bcrypt if using legacy hash or an outdated bcrypt cost
+        if needs_rehash or new_hash:
+            new_hash = new_hash or await hash_password_async(user_request.password)
             db.execute_query(
                 "UPDATE users SET password_hash = %s WHERE id = %s",
                 (new_hash, user['id'])
@@ -646,7 +655,7 @@ async def reset_password(request: Request, email: str, new_password: str, admin_
             raise HTTPException(status_code=404, detail="User not found")
         
         # Hash new password
-        new_hash = hash_password(new_password)
+        new_hash = await hash_password_async(new_password)
         
         # Update password
         db.execute_query(
@@ -673,8 +682,6 @@ async def reset_password(request: Request, email: str, new_password: str, admin_
 async def refresh_token_endpoint(request: Request, token_request: RefreshTokenRequest):
     """Refresh access token using refresh token"""
     try:
-        from auth import refresh_access_token
-        
         token_data = refresh_access_token(token_request.refresh_token)
         if not token_data:
             raise HTTPException(status_code=401, detail="Invalid or expired refresh token")
@@ -730,7 +737,7 @@ async def google_oauth_callback(code: str, state: Optional[str] = None):
         else:
             # Create new user
             user_id = str(uuid.uuid4())
-            password_hash = hash_password(secrets.token_urlsafe(32))  # Random password for OAuth users
+            password_hash = await hash_password_async(secrets.token_urlsafe(32))  # Random password for OAuth users
             
             if not db.create_user(user_id, user_info["email"], user_info["name"], password_hash):
                 raise HTTPException(status_code=500, detail="Failed to create user")
@@ -799,7 +806,7 @@ async def github_oauth_callback(code: str, state: Optional[str] = None):
         else:
             # Create new user
             user_id = str(uuid.uuid4())
-            password_hash = hash_password(secrets.token_urlsafe(32))  # Random password for OAuth users
+            password_hash = await hash_password_async(secrets.token_urlsafe(32))  # Random password for OAuth users
             
             if not db.create_user(user_id, user_info["email"], user_info["name"], password_hash):
                 raise HTTPException(status_code=500, detail="Failed to create user")
@@ -1707,6 +1714,10 @@ class MarketResearchRequest(BaseModel):
     product_description: str = Field(default="", description="Product description")
     geographic_scope: str = Field(default="Global", description="Geographic scope")
     idea: str = Field(default="", description="Business idea")
+    batch_sections: Optional[bool] = Field(
+        default=None,
+        description="Analyze sentiment, pricing and market gaps in one call (default: chosen by competitor count)"
+    )
 
 @app.post("/api/market-research/research")
 async def conduct_market_research(
@@ -1719,16 +1730,20 @@ async def conduct_market_research(
             raise HTTPException(status_code=503, detail="Market Research Agent not initialized")
         
         data = request.dict()
-        result = await market_research_agent.conduct_research(
+        report = await market_research_agent.conduct_market_research(
             industry=data.get("industry", ""),
             target_segment=data.get("target_segment", ""),
-            product_description=data.get("product_description", ""),
-            geographic_scope=data.get("geographic_scope", "Global")
+            your_product_description=data.get("product_description", ""),
+            geographic_scope=data.get("geographic_scope", "Global"),
+            batch_sections=data.get("batch_sections")
         )
         
+        # Export for /api/market-research/report/{id}/markdown, written off the event loop
+        await market_research_agent.save_markdown_report(report)
+        
         return {
             "status": "success",
-            "data": result
+            "data": market_research_agent.format_report_json(report)
         }
     
     except Exception as e:
@@ -1991,18 +2006,45 @@ class LogoGenerationRequest(BaseModel):
     style: str = Field(default="modern", description="Logo style")
     colors: str = Field(default="professional", description="Color scheme")
     shape: str = Field(default="square", description="Logo shape")
+    force_regenerate: bool = Field(default=False, description="Bypass cached logos and generate a new image")
 
 class CustomLogoRequest(BaseModel):
     """Custom logo generation request model"""
     company_name: str = Field(..., description="Company name")
     custom_prompt: str = Field(..., description="Custom prompt for logo generation")
+    force_regenerate: bool = Field(default=False, description="Bypass cached logos and generate a new image")
 
-@app.post("/api/branding/generate-logo")
+def _logo_result_data(result, inline: bool) -> Dict[str, Any]:
+    """
+    Logo metadata for API responses; base64 image only when inline is
+    requested or the PNG endpoint can no longer serve the image
+    """
+    data = {
+        "logo_id": result.logo_id,
+        "company_name": result.company_name,
+        "prompt_used": result.prompt_used,
+        "created_at": result.created_at,
+        "style": result.style,
+        "colors": result.colors,
+        "shape": result.shape,
+        "image_url": result.image_url
+    }
+    if inline or not result.image_id or branding_agent.get_logo_image(result.image_id) is None:
+        data["image_base64"] = result.image_base64
+    return data
+
+@app.post("/api/branding/generate-logo", response_class=ORJSONResponse)
 async def generate_logo(
     request: LogoGenerationRequest,
+    inline: bool = True,
     token: Optional[str] = Depends(verify_token)
 ):
-    """Generate a logo based on company name and idea"""
+    """
+    Generate a logo based on company name and idea
+    
+    Pass inline=false to receive only metadata plus image_url and fetch the
+    PNG from image_url, avoiding base64 in the JSON.
+    """
     try:
         if not branding_agent:
             raise HTTPException(status_code=503, detail="Branding Agent not initialized")
@@ -2014,32 +2056,25 @@ async def generate_logo(
             idea=request.idea,
             style=request.style,
             colors=request.colors,
-            shape=request.shape  # Include shape parameter
+            shape=request.shape,  # Include shape parameter
+            force_regenerate=request.force_regenerate
         )
         
         result = await branding_agent.generate_logo(logo_request)
         
         return {
             "status": "success",
-            "data": {
-                "logo_id": result.logo_id,
-                "company_name": result.company_name,
-                "prompt_used": result.prompt_used,
-                "image_base64": result.image_base64,
-                "created_at": result.created_at,
-                "style": result.style,
-                "colors": result.colors,
-                "shape": result.shape  # Include shape in response
-            }
+            "data": _logo_result_data(result, inline)
         }
     
     except Exception as e:
         logger.error(f"Error generating logo: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/api/branding/generate-custom-logo")
+@app.post("/api/branding/generate-custom-logo", response_class=ORJSONResponse)
 async def generate_custom_logo(
     request: CustomLogoRequest,
+    inline: bool = True,
     token: Optional[str] = Depends(verify_token)
 ):
     """Generate a logo with custom user prompt"""
@@ -2049,27 +2084,41 @@ async def generate_custom_logo(
         
         result = await branding_agent.generate_custom_logo(
             company_name=request.company_name,
-            custom_prompt=request.custom_prompt
+            custom_prompt=request.custom_prompt,
+            force_regenerate=request.force_regenerate
         )
         
         return {
             "status": "success",
-            "data": {
-                "logo_id": result.logo_id,
-                "company_name": result.company_name,
-                "prompt_used": result.prompt_used,
-                "image_base64": result.image_base64,
-                "created_at": result.created_at,
-                "style": result.style,
-                "colors": result.colors,
-                "shape": result.shape
-            }
+            "data": _logo_result_data(result, inline)
         }
     
     except Exception as e:
         logger.error(f"Error generating custom logo: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/branding/logo/{image_id}.png")
+async def get_logo_image(image_id: str):
+    """
+    Serve a recently generated logo as raw PNG bytes
+    
+    No auth header so the URL works directly in <img src>; image_id is a
+    random per-generation token only returned to the requester, and that
+    unguessable id is the access control.
+    """
+    if not branding_agent:
+        raise HTTPException(status_code=503, detail="Branding Agent not initialized")
+    
+    image_bytes = branding_agent.get_logo_image(image_id)
+    if image_bytes is None:
+        raise HTTPException(status_code=404, detail="Logo not found or expired")
+    
+    return Response(
+        content=image_bytes,
+        media_type="image/png",
+        headers={"Cache-Control": "private, max-age=3600"}
+    )
+
 @app.get("/api/branding/style-options")
 async def get_style_options():
     """Get available logo style options"""
@@ -2077,11 +2126,8 @@ async def get_style_options():
         if not branding_agent:
             raise HTTPException(status_code=503, detail="Branding Agent not initialized")
         
-        styles = branding_agent.get_style_options()
-        return {
-            "status": "success",
-            "data": styles
-        }
+        # Static option list, serialized once at import
+        return Response(content=STYLE_OPTIONS_JSON, media_type="application/json")
     
     except Exception as e:
         logger.error(f"Error getting style options: {str(e)}")
@@ -2094,11 +2140,8 @@ async def get_color_options():
         if not branding_agent:
             raise HTTPException(status_code=503, detail="Branding Agent not initialized")
         
-        colors = branding_agent.get_color_options()
-        return {
-            "status": "success",
-            "data": colors
-        }
+        # Static option list, serialized once at import
+        return Response(content=COLOR_OPTIONS_JSON, media_type="application/json")
     
     except Exception as e:
         logger.error(f"Error getting color options: {str(e)}")
@@ -2175,35 +2218,36 @@ async def generate_comprehensive_marketing_strategy(
         # Phase 1: Market Research
         logger.info("Phase 1: Conducting market research...")
         
-        # Discover competitors
-        competitors = await market_research_agent.discover_competitors(
-            industry=industry,
-            target_segment=target_market,
-            limit=10
-        )
-        
-        # Estimate market size
-        market_size = await market_research_agent.estimate_market_size(
-            industry=industry,
-            target_segment=target_market,
-            geographic_scope=region
-        )
-        
-        # Analyze trends
-        trends = await market_research_agent.analyze_trends(
-            industry=industry,
-            target_segment=target_market,
-            limit=10
-        )
-        
+        # Competitors, market size, trends and SWOT are independent Groq
+        # calls, so run them concurrently
+        research_calls = [
+            market_research_agent.discover_competitors(
+                industry=industry,
+                target_segment=target_market,
+                limit=10
+            ),
+            market_research_agent.estimate_market_size(
+                industry=industry,
+                target_segment=target_market,
+                geographic_scope=region
+            ),
+            market_research_agent.analyze_trends(
+                industry=industry,
+                target_segment=target_market,
+                limit=10
+            )
+        ]
         # Generate SWOT if product description provided
-        swot = None
         if idea:
-            swot = await market_research_agent.generate_swot(
+            research_calls.append(market_research_agent.generate_swot(
                 industry=industry,
                 target_segment=target_market,
                 your_product_description=idea
-            )
+            ))
+        
+        research_results = await asyncio.gather(*research_calls)
+        competitors, market_size, trends = research_results[:3]
+        swot = research_results[3] if idea else None
         
         # Identify market gaps
         market_gaps = await market_research_agent.identify_market_gaps(
@@ -2483,6 +2527,46 @@ async def generate_pitch_deck_slides(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/api/pitch-deck/slides/stream")
+async def stream_pitch_deck_slides(
+    request: PitchDeckSlidesRequest,
+    token: Optional[str] = Depends(verify_token)
+):
+    """Stream pitch deck slides as server-sent events, one event per finished slide"""
+    if not pitch_deck_agent:
+        raise HTTPException(status_code=503, detail="Pitch Deck Agent not initialized")
+
+    async def slide_events():
+        from dataclasses import asdict
+        try:
+            async for slide in pitch_deck_agent.stream_slides(
+                business_idea=request.business_idea,
+                business_name=request.business_name,
+                target_market=request.target_market,
+                funding_ask=request.funding_ask
+            ):
+                yield f"data: {json.dumps({'type': 'slide', 'slide': asdict(slide)})}\n\n"
+
+            yield f"data: {json.dumps({'type': 'complete'})}\n\n"
+
+        except asyncio.CancelledError:
+            logger.warning("Slide stream was cancelled by client")
+            return
+        except Exception as e:
+            logger.error(f"Error streaming slides: {str(e)}")
+            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+
+    return StreamingResponse(
+        slide_events(),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no"
+        }
+    )
+
+
 @app.post("/api/pitch-deck/voiceover")
 async def generate_voiceover(
     request: VoiceoverRequest,
@@ -2494,23 +2578,9 @@ async def generate_voiceover(
             raise HTTPException(status_code=503, detail="Pitch Deck Agent not initialized")
         
         # Convert dict back to slides object
-        from pitch_deck_agent import PitchDeckSlides, SlideContent
-        
-        slides_data = request.slides
-        slides = PitchDeckSlides(
-            title_slide=SlideContent(**slides_data.get("title_slide", {})),
-            problem_slide=SlideContent(**slides_data.get("problem_slide", {})),
-            solution_slide=SlideContent(**slides_data.get("solution_slide", {})),
-            market_slide=SlideContent(**slides_data.get("market_slide", {})),
-            product_slide=SlideContent(**slides_data.get("product_slide", {})),
-            business_model_slide=SlideContent(**slides_data.get("business_model_slide", {})),
-            traction_slide=SlideContent(**slides_data.get("traction_slide", {})),
-            competition_slide=SlideContent(**slides_data.get("competition_slide", {})),
-            team_slide=SlideContent(**slides_data.get("team_slide", {})),
-            financials_slide=SlideContent(**slides_data.get("financials_slide", {})),
-            ask_slide=SlideContent(**slides_data.get("ask_slide", {})),
-            closing_slide=SlideContent(**slides_data.get("closing_slide", {}))
-        )
+        from pitch_deck_agent import PitchDeckSlides
+        
+        slides = PitchDeckSlides.from_dict(request.slides)
         
         voiceovers = await pitch_deck_agent.generate_voiceovers(slides)
         
@@ -2538,23 +2608,9 @@ async def generate_demo_script(
             raise HTTPException(status_code=503, detail="Pitch Deck Agent not initialized")
         
         # Convert dict back to slides object
-        from pitch_deck_agent import PitchDeckSlides, SlideContent
-        
-        slides_data = request.slides
-        slides = PitchDeckSlides(
-            title_slide=SlideContent(**slides_data.get("title_slide", {})),
-            problem_slide=SlideContent(**slides_data.get("problem_slide", {})),
-            solution_slide=SlideContent(**slides_data.get("solution_slide", {})),
-            market_slide=SlideContent(**slides_data.get("market_slide", {})),
-            product_slide=SlideContent(**slides_data.get("product_slide", {})),
-            business_model_slide=SlideContent(**slides_data.get("business_model_slide", {})),
-            traction_slide=SlideContent(**slides_data.get("traction_slide", {})),
-            competition_slide=SlideContent(**slides_data.get("competition_slide", {})),
-            team_slide=SlideContent(**slides_data.get("team_slide", {})),
-            financials_slide=SlideContent(**slides_data.get("financials_slide", {})),
-            ask_slide=SlideContent(**slides_data.get("ask_slide", {})),
-            closing_slide=SlideContent(**slides_data.get("closing_slide", {}))
-        )
+        from pitch_deck_agent import PitchDeckSlides
+        
+        slides = PitchDeckSlides.from_dict(request.slides)
         
         demo_script = await pitch_deck_agent.generate_demo_script(
             slides=slides,
@@ -2585,23 +2641,9 @@ async def generate_investor_qa(
             raise HTTPException(status_code=503, detail="Pitch Deck Agent not initialized")
         
         # Convert dict back to slides object
-        from pitch_deck_agent import PitchDeckSlides, SlideContent
-        
-        slides_data = request.slides
-        slides = PitchDeckSlides(
-            title_slide=SlideContent(**slides_data.get("title_slide", {})),
-            problem_slide=SlideContent(**slides_data.get("problem_slide", {})),
-            solution_slide=SlideContent(**slides_data.get("solution_slide", {})),
-            market_slide=SlideContent(**slides_data.get("market_slide", {})),
-            product_slide=SlideContent(**slides_data.get("product_slide", {})),
-            business_model_slide=SlideContent(**slides_data.get("business_model_slide", {})),
-            traction_slide=SlideContent(**slides_data.get("traction_slide", {})),
-            competition_slide=SlideContent(**slides_data.get("competition_slide", {})),
-            team_slide=SlideContent(**slides_data.get("team_slide", {})),
-            financials_slide=SlideContent(**slides_data.get("financials_slide", {})),
-            ask_slide=SlideContent(**slides_data.get("ask_slide", {})),
-            closing_slide=SlideContent(**slides_data.get("closing_slide", {}))
-        )
+        from pitch_deck_agent import PitchDeckSlides
+        
+        slides = PitchDeckSlides.from_dict(request.slides)
         
         investor_qa = await pitch_deck_agent.generate_investor_qa(
             business_idea=request.business_idea,
@@ -24,22 +24,34 @@ License: MIT
 """
 
 import os
+import sys
 import json
 import uuid
 import asyncio
 import logging
-import re
+import random
+import hashlib
+import inspect
+from contextvars import ContextVar
+from functools import wraps
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, asdict, field
-from io import BytesIO
-import base64
+from typing import TYPE_CHECKING, Annotated, AsyncIterator, Callable, Dict, Final, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+from urllib.parse import quote
 
 # Third-party imports
-import aiohttp
-import requests
+import orjson
+from pydantic import AfterValidator, TypeAdapter, ValidationError
 from dotenv import load_dotenv
 
+from cache import TTLCache, cache, cache_ai_response, get_cached_ai_response
+from exceptions import AIServiceException
+
+# httpx is imported on first use by GroqClient; it dominates this module's
+# import time and isn't needed to build or serialize reports
+if TYPE_CHECKING:
+    import httpx
+
 # Load environment variables
 load_dotenv()
 
@@ -54,8 +66,35 @@ logger = logging.getLogger(__name__)
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
+# Slotted to drop the per-instance __dict__ (a report holds dozens of these).
+# Section items are built in one shot from LLM JSON and never modified, so
+# they are also frozen; the SWOT and report objects are filled in as research
+# progresses and stay mutable. All of them are only ever built from keyword
+# arguments and never compared or pattern-matched, so positional __init__,
+# __match_args__ and __eq__ aren't generated.
+#
+# String lists on the frozen items are tuples of interned strings: the same
+# short phrases ("Limited integrations", "Steep learning curve") recur across
+# competitors and reports, and interning keeps one copy of each.
+
+def _i(value: Any) -> Any:
+    """Intern a string; anything else passes through"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def _strs(items: Any) -> Tuple[str, ...]:
+    """Normalize an LLM string list into a tuple of interned strings"""
+    if not items:
+        return ()
+    if isinstance(items, str):
+        items = (items,)
+    return tuple(_i(item) for item in items)
 
-@dataclass
+
+# Interned on the TypeAdapter path too (section validation, cache rehydration)
+InternedStrs = Annotated[Tuple[str, ...], AfterValidator(_strs)]
+
+@dataclass(slots=True, frozen=True, kw_only=True, match_args=False, eq=False)
 class Competitor:
     """Competitor information with funding and team data"""
     name: str
@@ -64,13 +103,13 @@ class Competitor:
     funding: Optional[str] = None
     team_size: Optional[str] = None
     founded: Optional[str] = None
-    strengths: List[str] = field(default_factory=list)
-    weaknesses: List[str] = field(default_factory=list)
+    strengths: InternedStrs = ()
+    weaknesses: InternedStrs = ()
     pricing_model: Optional[str] = None
     market_position: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True, match_args=False, eq=False)
 class MarketSize:
     """TAM-SAM-SOM market size estimation"""
     tam: float  # Total Addressable Market
@@ -83,7 +122,7 @@ class MarketSize:
     reasoning: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True, match_args=False, eq=False)
 class TrendData:
     """Trending keywords and categories"""
     keyword: str
@@ -94,18 +133,18 @@ class TrendData:
     relevance: str = ""
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True, match_args=False, eq=False)
 class SentimentData:
     """User sentiment and pain points"""
     source: str  # Reddit, Twitter, Reviews, etc.
     sentiment_score: float  # -1 to 1
-    pain_points: List[str] = field(default_factory=list)
-    positive_feedback: List[str] = field(default_factory=list)
-    common_complaints: List[str] = field(default_factory=list)
+    pain_points: InternedStrs = ()
+    positive_feedback: InternedStrs = ()
+    common_complaints: InternedStrs = ()
     sample_size: int = 0
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True, match_args=False, eq=False)
 class PricingModel:
     """Competitor pricing information"""
     competitor: str
@@ -115,7 +154,7 @@ class PricingModel:
     value_proposition: str = ""
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, match_args=False, eq=False)
 class SWOTAnalysis:
     """SWOT Analysis data"""
     strengths: List[str] = field(default_factory=list)
@@ -125,7 +164,7 @@ class SWOTAnalysis:
     chart_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, kw_only=True, match_args=False, eq=False)
 class MarketGap:
     """Market gap/opportunity identification"""
     gap_name: str
@@ -136,7 +175,7 @@ class MarketGap:
     potential_solution: str
 
 
-@dataclass
+@dataclass(slots=True, kw_only=True, match_args=False, eq=False)
 class MarketResearchReport:
     """Complete market research report"""
     id: str
@@ -163,10 +202,307 @@ class MarketResearchReport:
     processing_time: float = 0.0
 
 
+# pydantic-core serializes the whole report tree in one Rust pass, replacing
+# the recursive (deep-copying) asdict() walk per section
+_REPORT_ADAPTER = TypeAdapter(MarketResearchReport)
+
+# List sections the LLM returns in bulk; the compiled schemas are built once
+_COMPETITORS_ADAPTER = TypeAdapter(List[Competitor])
+_MARKET_SIZE_ADAPTER = TypeAdapter(MarketSize)
+_TRENDS_ADAPTER = TypeAdapter(List[TrendData])
+_SENTIMENT_ADAPTER = TypeAdapter(List[SentimentData])
+_PRICING_ADAPTER = TypeAdapter(List[PricingModel])
+_MARKET_GAPS_ADAPTER = TypeAdapter(List[MarketGap])
+
+
+def _response_schema(name: str, **sections: TypeAdapter) -> Dict[str, Any]:
+    """
+    Build a Groq json_schema response format for an object whose keys are the
+    given list sections. Nested dataclass definitions are hoisted to the root
+    $defs so every $ref resolves against the top-level schema.
+    """
+    properties = {}
+    defs = {}
+    for key, adapter in sections.items():
+        schema = dict(adapter.json_schema())
+        defs.update(schema.pop("$defs", {}))
+        properties[key] = schema
+    
+    schema = {"type": "object", "properties": properties, "required": list(sections)}
+    if defs:
+        schema["$defs"] = defs
+    return {"name": name, "schema": schema}
+
+
+# The batched landscape call returns one pricing entry per competitor inside
+# a single 8000-token response; above this many competitors it risks being
+# cut off, so conduct_market_research falls back to the three separate calls
+LANDSCAPE_BATCH_MAX_COMPETITORS = 6
+
+
+# Computed once at import; sent as response_format on models that support
+# structured outputs so the list sections come back already shaped for the
+# adapters above
+_TRENDS_SCHEMA = _response_schema("market_trends", trends=_TRENDS_ADAPTER)
+_SENTIMENT_SCHEMA = _response_schema("user_sentiment", sentiment_sources=_SENTIMENT_ADAPTER)
+_PRICING_SCHEMA = _response_schema("pricing_intelligence", pricing_models=_PRICING_ADAPTER)
+_MARKET_GAPS_SCHEMA = _response_schema("market_gaps", market_gaps=_MARKET_GAPS_ADAPTER)
+_LANDSCAPE_SCHEMA = _response_schema(
+    "competitive_landscape",
+    sentiment_sources=_SENTIMENT_ADAPTER,
+    pricing_models=_PRICING_ADAPTER,
+    market_gaps=_MARKET_GAPS_ADAPTER
+)
+
+
+def _validate_list(adapter: TypeAdapter, items: Any) -> Optional[list]:
+    """
+    Validate a whole LLM list in one pydantic-core call. Returns None when the
+    output doesn't fit the schema (missing keys, nulls), so the caller can
+    fall back to its field-by-field parsing with defaults.
+    """
+    try:
+        return adapter.validate_python(items)
+    except ValidationError:
+        return None
+
+
+# ============================================================================
+# SECTION CACHE
+# ============================================================================
+
+# Competitors, market size and trends depend only on the template slots
+# (industry, segment, scope), so different users researching the same market
+# share one result. Sections are stored as validated JSON and rebuilt with
+# their TypeAdapter on a hit, skipping the Groq call and the parsing.
+SECTION_CACHE_TTL = 7 * 24 * 3600
+
+# Set for the duration of conduct_market_research(force_regenerate=True):
+# section and Groq response caches skip their lookups (but still store the
+# fresh results). A ContextVar reaches every gathered section task without
+# threading a flag through each method signature.
+_refresh_caches: ContextVar[bool] = ContextVar("market_research_refresh_caches", default=False)
+
+_section_cache_stats = {"hits": 0, "misses": 0}
+
+
+def section_cache_stats() -> Dict[str, Any]:
+    """Hit/miss counters for the section cache since process start"""
+    total = _section_cache_stats["hits"] + _section_cache_stats["misses"]
+    return {
+        **_section_cache_stats,
+        "hit_ratio": _section_cache_stats["hits"] / total if total else 0.0
+    }
+
+
+def _cached_section(section: str, adapter: TypeAdapter):
+    """
+    Cache a section generator in Redis keyed on its arguments. String slots
+    are normalized so "SaaS" and " saas" share an entry.
+    """
+    def decorator(func: Callable):
+        signature = inspect.signature(func)
+        
+        @wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            slots = {
+                name: value.strip().lower() if isinstance(value, str) else value
+                for name, value in bound.arguments.items()
+                if name != "self"
+            }
+            cache_key = cache.generate_key(f"market_research:section:{section}", **slots)
+            
+            cached = None if _refresh_caches.get() else await cache.get(cache_key)
+            if cached is not None:
+                try:
+                    result = adapter.validate_python(cached)
+                    _section_cache_stats["hits"] += 1
+                    logger.info(f"Section cache hit for {section}")
+                    return result
+                except ValidationError:
+                    logger.warning(f"Discarding stale {section} section cache entry")
+            
+            _section_cache_stats["misses"] += 1
+            result = await func(self, *args, **kwargs)
+            await cache.set(
+                cache_key,
+                adapter.dump_python(result, mode="json", warnings=False),
+                SECTION_CACHE_TTL
+            )
+            return result
+        
+        return wrapper
+    return decorator
+
+
+# Finished reports, keyed by a hash of their inputs. The hash is only a
+# cache key: report ids stay random because they name the downloadable
+# Markdown export, and an id derived from the brief could be recomputed
+# by anyone who knows or guesses it.
+REPORT_CACHE_TTL = 24 * 3600
+
+
+def _report_cache_key(
+    industry: str,
+    target_segment: str,
+    your_product_description: str,
+    geographic_scope: str
+) -> str:
+    """
+    Deterministic cache key: a hash of the normalized research inputs, so the
+    same brief always maps to the same cached report
+    """
+    brief = {
+        "industry": industry.strip().lower(),
+        "target_segment": target_segment.strip().lower(),
+        "your_product_description": your_product_description.strip(),
+        "geographic_scope": geographic_scope.strip().lower()
+    }
+    canonical = orjson.dumps(brief, option=orjson.OPT_SORT_KEYS)
+    return f"market_research:report:{hashlib.blake2b(canonical, digest_size=16).hexdigest()}"
+
+
+# ============================================================================
+# SYSTEM PROMPTS
+# ============================================================================
+
+# Hoisted so every request sends byte-identical system prompts. Groq reuses
+# cached prefill for repeated prompt prefixes, which only hits when the
+# leading system message is exactly the same on each call.
+DEFAULT_SYSTEM_PROMPT: Final[str] = "You are a helpful AI assistant."
+
+COMPETITOR_SYSTEM_PROMPT: Final[str] = (
+    "You are a market research expert specializing in competitive analysis. Provide "
+    "accurate, data-driven insights about real competitors. Always include actual "
+    'company names, never use "Unknown" or placeholders. Return valid JSON only.'
+)
+
+MARKET_SIZE_SYSTEM_PROMPT: Final[str] = (
+    "You are a market sizing expert with deep knowledge of various industries. "
+    "Provide realistic, well-reasoned market size estimates based on available data "
+    "and trends. Return valid JSON only."
+)
+
+TREND_SYSTEM_PROMPT: Final[str] = (
+    "You are a trend analysis expert with deep knowledge of market dynamics. Identify "
+    "meaningful trends that provide actionable insights. Return valid JSON only."
+)
+
+SENTIMENT_SYSTEM_PROMPT: Final[str] = (
+    "You are a sentiment analysis expert specializing in user feedback analysis. "
+    "Provide realistic, data-driven insights based on common user experiences. Return "
+    "valid JSON only."
+)
+
+PRICING_SYSTEM_PROMPT: Final[str] = (
+    "You are a pricing strategy expert with knowledge of SaaS and product pricing. "
+    "Provide realistic pricing information based on common industry practices. Return "
+    "valid JSON only."
+)
+
+SWOT_SYSTEM_PROMPT: Final[str] = (
+    "You are a strategic business analyst expert in SWOT analysis. Provide "
+    "insightful, actionable analysis. Return valid JSON only."
+)
+
+MARKET_GAP_SYSTEM_PROMPT: Final[str] = (
+    "You are an innovation strategist expert at identifying market opportunities. "
+    "Find meaningful gaps that represent real business opportunities. Return valid "
+    "JSON only."
+)
+
+LANDSCAPE_SYSTEM_PROMPT: Final[str] = (
+    "You are a market research expert covering user sentiment, pricing strategy and "
+    "innovation opportunities. Provide realistic, data-driven insights. Return valid "
+    "JSON only."
+)
+
+SUMMARY_SYSTEM_PROMPT: Final[str] = (
+    "You are a senior business analyst creating executive summaries for C-level "
+    "executives. Be concise, insightful, and actionable. Return valid JSON only."
+)
+
+
 # ============================================================================
 # GROQ API CLIENT
 # ============================================================================
 
+# Groq responses keyed by a hash of everything that shapes the completion.
+# Research prompts are templates over a few slots (industry, segment, scope),
+# so repeated runs hit this in-process cache first, then Redis.
+GROQ_CACHE_TTL = 3600
+_groq_response_cache = TTLCache(maxsize=512, ttl=GROQ_CACHE_TTL)
+
+# Groq models that accept response_format json_schema; others fall back to
+# plain JSON mode
+GROQ_JSON_SCHEMA_MODELS = frozenset({
+    "openai/gpt-oss-20b",
+    "openai/gpt-oss-120b",
+    "moonshotai/kimi-k2-instruct",
+    "meta-llama/llama-4-maverick-17b-128e-instruct",
+    "meta-llama/llama-4-scout-17b-16e-instruct",
+})
+
+# Retry policy for transient failures (429 and 5xx)
+GROQ_MAX_ATTEMPTS = 5
+GROQ_BACKOFF_INITIAL = 0.5
+GROQ_BACKOFF_MAX = 8.0
+
+
+class GroqAPIError(AIServiceException):
+    """Groq API returned a non-200 response"""
+    def __init__(self, message: str, status_code: int, retry_after: Optional[float] = None):
+        super().__init__(message, {"status_code": status_code})
+        self.status_code = status_code
+        self.retry_after = retry_after
+
+
+class TransientGroqError(GroqAPIError):
+    """Groq failure that is worth retrying"""
+    pass
+
+
+class GroqRateLimitError(TransientGroqError):
+    """429 from Groq; retry_after carries the server's Retry-After hint"""
+    pass
+
+
+class GroqServerError(TransientGroqError):
+    """5xx from Groq"""
+    pass
+
+
+class GroqClientError(GroqAPIError):
+    """4xx (other than 429) from Groq, e.g. a prompt that is too long"""
+    pass
+
+
+def _groq_error(response: "httpx.Response", error_text: str) -> GroqAPIError:
+    """Map a failed Groq response to the matching exception type"""
+    status = response.status_code
+    message = f"Groq API error ({status}): {error_text}"
+    if status == 429:
+        retry_after = None
+        try:
+            retry_after = float(response.headers.get("retry-after", ""))
+        except ValueError:
+            pass
+        return GroqRateLimitError(message, status, retry_after)
+    if status >= 500:
+        return GroqServerError(message, status)
+    return GroqClientError(message, status)
+
+
+def _backoff_delay(attempt: int, error: Exception) -> float:
+    """Retry-After when the server sent one, else capped exponential backoff with jitter"""
+    retry_after = getattr(error, "retry_after", None)
+    if retry_after is not None:
+        return retry_after
+    return min(GROQ_BACKOFF_MAX, GROQ_BACKOFF_INITIAL * 2 ** attempt) + random.uniform(0, 1)
+
+
 class GroqClient:
     """Client for Groq API using OpenAI-compatible interface"""
     
@@ -183,58 +519,216 @@ class GroqClient:
         
         self.base_url = "https://api.groq.com/openai/v1"
         self.model = "llama-3.3-70b-versatile"  # Using Llama 3.3 70B
-        logger.info(f"GroqClient initialized with model: {self.model}")
+        self._completions_url = f"{self.base_url}/chat/completions"
         
-    async def generate(
-        self,
-        prompt: str,
-        system_prompt: str = "You are a helpful AI assistant.",
-        temperature: float = 0.7,
-        max_tokens: int = 2000,
-        json_mode: bool = False
-    ) -> str:
-        """Generate text using Groq API"""
-        
-        headers = {
+        # Built once instead of per call; the session sends these headers
+        self._headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
+        sampling = {
+            "model": self.model,
+            "top_p": 0.95,  # Nucleus sampling for better quality
+            "frequency_penalty": 0.1,  # Reduce repetition
+            "presence_penalty": 0.1  # Encourage diverse responses
+        }
+        self._payload_plain = sampling
+        self._payload_json = {**sampling, "response_format": {"type": "json_object"}}
+        self.supports_json_schema = self.model in GROQ_JSON_SCHEMA_MODELS
+        
+        # Shared client so consecutive calls reuse pooled TLS connections
+        self._client: Optional["httpx.AsyncClient"] = None
+        # Research sections fan out concurrently; cap in-flight Groq calls
+        self._semaphore = asyncio.Semaphore(8)
         
+        logger.info(f"GroqClient initialized with model: {self.model}")
+    
+    async def _get_client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            import httpx
+            
+            # HTTP/2 multiplexes the parallel section calls over one TLS connection
+            self._client = httpx.AsyncClient(
+                http2=True,
+                headers=self._headers,
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32
+                )
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    async def __aenter__(self) -> "GroqClient":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    def _response_cache_key(
+        self,
+        prompt: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+        schema_name: str = ""
+    ) -> str:
+        """Exact-match key for a completion request"""
+        digest = hashlib.sha256()
+        for part in (self.model, repr(temperature), str(max_tokens), str(json_mode), schema_name, system_prompt, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+        
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         payload = {
-            "model": self.model,
+            **(self._payload_json if json_mode else self._payload_plain),
             "messages": [
                 {"role": "system", "content": system_prompt},
                 {"role": "user", "content": prompt}
             ],
             "temperature": temperature,
-            "max_tokens": max_tokens,
-            "top_p": 0.95,  # Nucleus sampling for better quality
-            "frequency_penalty": 0.1,  # Reduce repetition
-            "presence_penalty": 0.1  # Encourage diverse responses
+            "max_tokens": max_tokens
         }
+        if json_schema is not None:
+            payload["response_format"] = {"type": "json_schema", "json_schema": json_schema}
+        return payload
+    
+    async def _post(self, body: bytes) -> Dict[str, Any]:
+        """
+        POST a completion request, retrying rate limits and server errors.
+        Client errors (bad request, auth) are raised immediately so callers
+        can react, e.g. by shortening the prompt.
+        """
+        import httpx
+        
+        client = await self._get_client()
+        
+        for attempt in range(GROQ_MAX_ATTEMPTS):
+            try:
+                async with self._semaphore:
+                    response = await client.post(self._completions_url, content=body)
+                if response.status_code == 200:
+                    return orjson.loads(response.content)
+                raise _groq_error(response, response.text)
+            
+            except (TransientGroqError, httpx.TransportError) as e:
+                if attempt == GROQ_MAX_ATTEMPTS - 1:
+                    raise
+                delay = _backoff_delay(attempt, e)
+                logger.warning(
+                    f"Groq request failed ({str(e)}), retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1}/{GROQ_MAX_ATTEMPTS})"
+                )
+                await asyncio.sleep(delay)
+    
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        json_mode: bool = False,
+        use_cache: bool = True,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate text using Groq API
         
-        if json_mode:
-            payload["response_format"] = {"type": "json_object"}
+        json_schema ({"name": ..., "schema": ...}) requests structured output
+        on models that support it; on other models the call uses JSON mode.
+        """
+        
+        if json_schema is not None:
+            if self.supports_json_schema:
+                json_mode = False
+            else:
+                json_schema = None
+                json_mode = True
+        
+        if use_cache:
+            schema_name = json_schema["name"] if json_schema is not None else ""
+            cache_key = self._response_cache_key(prompt, system_prompt, temperature, max_tokens, json_mode, schema_name)
+        if use_cache and not _refresh_caches.get():
+            cached = _groq_response_cache.get(cache_key)
+            if cached is None:
+                cached = await get_cached_ai_response("groq", cache_key)
+                if cached is not None:
+                    _groq_response_cache.set(cache_key, cached)
+            if cached is not None:
+                logger.info("Groq cache hit")
+                return cached
+        
+        payload = self._build_payload(prompt, system_prompt, temperature, max_tokens, json_mode, json_schema)
         
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=60)
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        raise Exception(f"Groq API error: {error_text}")
-                    
-                    data = await response.json()
-                    return data["choices"][0]["message"]["content"]
+            data = await self._post(orjson.dumps(payload))
+            content = data["choices"][0]["message"]["content"]
+            
+            if use_cache:
+                _groq_response_cache.set(cache_key, content)
+                await cache_ai_response("groq", cache_key, content, GROQ_CACHE_TTL)
+            return content
                     
         except Exception as e:
             logger.error(f"Groq API error: {str(e)}")
             raise
 
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str = DEFAULT_SYSTEM_PROMPT,
+        temperature: float = 0.7,
+        max_tokens: int = 2000,
+        json_mode: bool = False
+    ) -> AsyncIterator[str]:
+        """
+        Stream generated text from Groq as server-sent events, yielding each
+        content delta as it arrives instead of waiting for the full completion
+        """
+        
+        payload = self._build_payload(prompt, system_prompt, temperature, max_tokens, json_mode)
+        payload["stream"] = True
+        
+        client = await self._get_client()
+        async with self._semaphore, client.stream(
+            "POST",
+            self._completions_url,
+            content=orjson.dumps(payload)
+        ) as response:
+            if response.status_code != 200:
+                error_text = (await response.aread()).decode("utf-8", "replace")
+                logger.error(f"Groq API error: {error_text}")
+                raise _groq_error(response, error_text)
+            
+            async for line in response.aiter_lines():
+                line = line.strip()
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    break
+                
+                delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
 
 # ============================================================================
 # QUICKCHART CLIENT
@@ -249,8 +743,8 @@ class QuickChartClient:
     def generate_chart_url(self, chart_config: Dict[str, Any]) -> str:
         """Generate chart URL from configuration"""
         
-        config_json = json.dumps(chart_config)
-        encoded = requests.utils.quote(config_json)
+        config_json = orjson.dumps(chart_config).decode()
+        encoded = quote(config_json)
         return f"{self.base_url}?c={encoded}"
     
     def create_swot_matrix(self, swot: SWOTAnalysis) -> str:
@@ -410,10 +904,15 @@ class MarketResearchAgent:
         
         logger.info("Market Research Agent initialized successfully")
     
+    async def aclose(self):
+        """Release the Groq client's HTTP session"""
+        await self.groq.close()
+    
     # ========================================================================
     # FEATURE 1: COMPETITOR DISCOVERY ENGINE
     # ========================================================================
     
+    @_cached_section("competitors", _COMPETITORS_ADAPTER)
     async def discover_competitors(
         self,
         industry: str,
@@ -451,10 +950,7 @@ class MarketResearchAgent:
         Include real, well-known companies in the {industry} space. Do not use placeholder names.
         """
         
-        system_prompt = """You are a market research expert specializing in competitive analysis. 
-        Provide accurate, data-driven insights about real competitors. 
-        Always include actual company names, never use "Unknown" or placeholders.
-        Return valid JSON only."""
+        system_prompt = COMPETITOR_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -467,7 +963,7 @@ class MarketResearchAgent:
             
             logger.debug(f"Raw competitor response: {response[:500]}...")  # Log first 500 chars
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             competitors = []
             
             # Parse the response
@@ -492,8 +988,8 @@ class MarketResearchAgent:
                     funding=comp_data.get("funding") or comp_data.get("funding_stage"),
                     team_size=comp_data.get("team_size") or comp_data.get("employees"),
                     founded=comp_data.get("founded") or comp_data.get("year_founded"),
-                    strengths=comp_data.get("strengths", []),
-                    weaknesses=comp_data.get("weaknesses", []),
+                    strengths=_strs(comp_data.get("strengths")),
+                    weaknesses=_strs(comp_data.get("weaknesses")),
                     pricing_model=comp_data.get("pricing_model") or comp_data.get("pricing"),
                     market_position=comp_data.get("market_position") or comp_data.get("position")
                 )
@@ -512,6 +1008,7 @@ class MarketResearchAgent:
     # FEATURE 2: TAM-SAM-SOM ESTIMATOR
     # ========================================================================
     
+    @_cached_section("market_size", _MARKET_SIZE_ADAPTER)
     async def estimate_market_size(
         self,
         industry: str,
@@ -544,9 +1041,7 @@ class MarketResearchAgent:
         Return as JSON with numeric values for tam, sam, som.
         """
         
-        system_prompt = """You are a market sizing expert with deep knowledge of various industries.
-        Provide realistic, well-reasoned market size estimates based on available data and trends.
-        Return valid JSON only."""
+        system_prompt = MARKET_SIZE_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -557,7 +1052,7 @@ class MarketResearchAgent:
                 json_mode=True
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             market_size = MarketSize(
                 tam=float(data.get("tam", 0)),
@@ -581,6 +1076,7 @@ class MarketResearchAgent:
     # FEATURE 3: TREND ANALYZER
     # ========================================================================
     
+    @_cached_section("trends", _TRENDS_ADAPTER)
     async def analyze_trends(
         self,
         industry: str,
@@ -615,8 +1111,7 @@ class MarketResearchAgent:
         Return as JSON array of trends.
         """
         
-        system_prompt = """You are a trend analysis expert with deep knowledge of market dynamics.
-        Identify meaningful trends that provide actionable insights. Return valid JSON only."""
+        system_prompt = TREND_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -624,24 +1119,27 @@ class MarketResearchAgent:
                 system_prompt=system_prompt,
                 temperature=0.4,
                 max_tokens=3000,
-                json_mode=True
+                json_mode=True,
+                json_schema=_TRENDS_SCHEMA
             )
             
-            data = json.loads(response)
-            trends = []
+            data = orjson.loads(response)
             
             trend_list = data.get("trends", [])
             
-            for trend_data in trend_list[:limit]:
-                trend = TrendData(
-                    keyword=trend_data.get("keyword", ""),
-                    trend_score=int(trend_data.get("trend_score", 50)),
-                    category=trend_data.get("category", "General"),
-                    growth_rate=trend_data.get("growth_rate"),
-                    search_volume=trend_data.get("search_volume"),
-                    relevance=trend_data.get("relevance", "")
-                )
-                trends.append(trend)
+            trends = _validate_list(_TRENDS_ADAPTER, trend_list[:limit])
+            if trends is None:
+                trends = []
+                for trend_data in trend_list[:limit]:
+                    trend = TrendData(
+                        keyword=trend_data.get("keyword", ""),
+                        trend_score=int(trend_data.get("trend_score", 50)),
+                        category=trend_data.get("category", "General"),
+                        growth_rate=trend_data.get("growth_rate"),
+                        search_volume=trend_data.get("search_volume"),
+                        relevance=trend_data.get("relevance", "")
+                    )
+                    trends.append(trend)
             
             # Sort by trend score
             trends.sort(key=lambda x: x.trend_score, reverse=True)
@@ -695,8 +1193,7 @@ class MarketResearchAgent:
         Return as JSON array of sentiment data.
         """
         
-        system_prompt = """You are a sentiment analysis expert specializing in user feedback analysis.
-        Provide realistic, data-driven insights based on common user experiences. Return valid JSON only."""
+        system_prompt = SENTIMENT_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -704,24 +1201,15 @@ class MarketResearchAgent:
                 system_prompt=system_prompt,
                 temperature=0.3,
                 max_tokens=3000,
-                json_mode=True
+                json_mode=True,
+                json_schema=_SENTIMENT_SCHEMA
             )
             
-            data = json.loads(response)
-            sentiment_list = []
+            data = orjson.loads(response)
             
             sources = data.get("sentiment_sources", [])
             
-            for source_data in sources:
-                sentiment = SentimentData(
-                    source=source_data.get("source", "Unknown"),
-                    sentiment_score=float(source_data.get("sentiment_score", 0.0)),
-                    pain_points=source_data.get("pain_points", []),
-                    positive_feedback=source_data.get("positive_feedback", []),
-                    common_complaints=source_data.get("common_complaints", []),
-                    sample_size=int(source_data.get("sample_size", 0))
-                )
-                sentiment_list.append(sentiment)
+            sentiment_list = self._parse_sentiment(sources)
             
             logger.info(f"Extracted sentiment from {len(sentiment_list)} sources")
             return sentiment_list
@@ -749,7 +1237,7 @@ class MarketResearchAgent:
         
         prompt = f"""
         Analyze the pricing models for these competitors:
-        {json.dumps(competitor_names, indent=2)}
+        {orjson.dumps(competitor_names, option=orjson.OPT_INDENT_2).decode()}
         
         For each competitor, provide:
         1. Competitor name
@@ -761,8 +1249,7 @@ class MarketResearchAgent:
         Return as JSON array of pricing models.
         """
         
-        system_prompt = """You are a pricing strategy expert with knowledge of SaaS and product pricing.
-        Provide realistic pricing information based on common industry practices. Return valid JSON only."""
+        system_prompt = PRICING_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -770,23 +1257,15 @@ class MarketResearchAgent:
                 system_prompt=system_prompt,
                 temperature=0.3,
                 max_tokens=3000,
-                json_mode=True
+                json_mode=True,
+                json_schema=_PRICING_SCHEMA
             )
             
-            data = json.loads(response)
-            pricing_models = []
+            data = orjson.loads(response)
             
             pricing_list = data.get("pricing_models", [])
             
-            for pricing_data in pricing_list:
-                pricing = PricingModel(
-                    competitor=pricing_data.get("competitor", "Unknown"),
-                    pricing_type=pricing_data.get("pricing_type", "Unknown"),
-                    tiers=pricing_data.get("tiers", []),
-                    average_price=pricing_data.get("average_price"),
-                    value_proposition=pricing_data.get("value_proposition", "")
-                )
-                pricing_models.append(pricing)
+            pricing_models = self._parse_pricing(pricing_list)
             
             logger.info(f"Analyzed pricing for {len(pricing_models)} competitors")
             return pricing_models
@@ -830,8 +1309,7 @@ class MarketResearchAgent:
         Return as JSON with arrays for strengths, weaknesses, opportunities, threats.
         """
         
-        system_prompt = """You are a strategic business analyst expert in SWOT analysis.
-        Provide insightful, actionable analysis. Return valid JSON only."""
+        system_prompt = SWOT_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -842,7 +1320,7 @@ class MarketResearchAgent:
                 json_mode=True
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             swot = SWOTAnalysis(
                 strengths=data.get("strengths", []),
@@ -890,7 +1368,7 @@ class MarketResearchAgent:
         Target Segment: {target_segment}
         
         Current Competitors:
-        {json.dumps(competitor_info, indent=2)}
+        {orjson.dumps(competitor_info, option=orjson.OPT_INDENT_2).decode()}
         
         For each market gap, provide:
         1. Gap name (concise, descriptive)
@@ -909,8 +1387,7 @@ class MarketResearchAgent:
         Return as JSON array of market gaps.
         """
         
-        system_prompt = """You are an innovation strategist expert at identifying market opportunities.
-        Find meaningful gaps that represent real business opportunities. Return valid JSON only."""
+        system_prompt = MARKET_GAP_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -918,14 +1395,68 @@ class MarketResearchAgent:
                 system_prompt=system_prompt,
                 temperature=0.5,
                 max_tokens=3000,
-                json_mode=True
+                json_mode=True,
+                json_schema=_MARKET_GAPS_SCHEMA
             )
             
-            data = json.loads(response)
-            market_gaps = []
+            data = orjson.loads(response)
             
             gaps_list = data.get("market_gaps", [])
             
+            market_gaps = self._parse_market_gaps(gaps_list)
+            
+            logger.info(f"Identified {len(market_gaps)} market gaps")
+            return market_gaps
+            
+        except Exception as e:
+            logger.error(f"Error identifying market gaps: {str(e)}")
+            raise
+    
+    # ========================================================================
+    # SECTION PARSERS
+    # ========================================================================
+    
+    @staticmethod
+    def _parse_sentiment(sources: Any) -> List[SentimentData]:
+        """Build SentimentData items from the LLM's sentiment_sources list"""
+        sentiment_list = _validate_list(_SENTIMENT_ADAPTER, sources)
+        if sentiment_list is None:
+            sentiment_list = []
+            for source_data in sources:
+                sentiment = SentimentData(
+                    source=source_data.get("source", "Unknown"),
+                    sentiment_score=float(source_data.get("sentiment_score", 0.0)),
+                    pain_points=_strs(source_data.get("pain_points")),
+                    positive_feedback=_strs(source_data.get("positive_feedback")),
+                    common_complaints=_strs(source_data.get("common_complaints")),
+                    sample_size=int(source_data.get("sample_size", 0))
+                )
+                sentiment_list.append(sentiment)
+        return sentiment_list
+    
+    @staticmethod
+    def _parse_pricing(pricing_list: Any) -> List[PricingModel]:
+        """Build PricingModel items from the LLM's pricing_models list"""
+        pricing_models = _validate_list(_PRICING_ADAPTER, pricing_list)
+        if pricing_models is None:
+            pricing_models = []
+            for pricing_data in pricing_list:
+                pricing = PricingModel(
+                    competitor=pricing_data.get("competitor", "Unknown"),
+                    pricing_type=pricing_data.get("pricing_type", "Unknown"),
+                    tiers=pricing_data.get("tiers", []),
+                    average_price=pricing_data.get("average_price"),
+                    value_proposition=pricing_data.get("value_proposition", "")
+                )
+                pricing_models.append(pricing)
+        return pricing_models
+    
+    @staticmethod
+    def _parse_market_gaps(gaps_list: Any) -> List[MarketGap]:
+        """Build MarketGap items from the LLM's market_gaps list, best first"""
+        market_gaps = _validate_list(_MARKET_GAPS_ADAPTER, gaps_list)
+        if market_gaps is None:
+            market_gaps = []
             for gap_data in gaps_list:
                 gap = MarketGap(
                     gap_name=gap_data.get("gap_name", ""),
@@ -936,15 +1467,84 @@ class MarketResearchAgent:
                     potential_solution=gap_data.get("potential_solution", "")
                 )
                 market_gaps.append(gap)
+        
+        # Sort by opportunity score
+        market_gaps.sort(key=lambda x: x.opportunity_score, reverse=True)
+        return market_gaps
+    
+    # ========================================================================
+    # BATCHED COMPETITIVE LANDSCAPE (FEATURES 4, 5, 7 IN ONE CALL)
+    # ========================================================================
+    
+    async def analyze_competitive_landscape(
+        self,
+        industry: str,
+        target_segment: str,
+        competitors: List[Competitor]
+    ) -> Tuple[List[SentimentData], List[PricingModel], List[MarketGap]]:
+        """
+        Runs sentiment, pricing and market gap analysis as a single Groq call.
+        The three sections share the same competitor context, so one request
+        sends it (and the system prompt) once instead of three times.
+        """
+        
+        logger.info(f"Analyzing competitive landscape for {industry} (batched)")
+        
+        competitor_info = [
+            {"name": c.name, "description": c.description}
+            for c in competitors
+        ]
+        
+        prompt = f"""
+        Analyze this market and its competitors:
+        
+        Industry: {industry}
+        Target Segment: {target_segment}
+        
+        Competitors:
+        {orjson.dumps(competitor_info, option=orjson.OPT_INDENT_2).decode()}
+        
+        Return ONE JSON object with exactly these three keys:
+        
+        "sentiment_sources": user sentiment from Reddit, Twitter/X, product review sites
+        (G2, Capterra, Trustpilot) and app store reviews. One object per source with
+        source, sentiment_score (-1.0 to 1.0), pain_points (5-10), positive_feedback (3-5),
+        common_complaints and sample_size.
+        
+        "pricing_models": one object per competitor with competitor, pricing_type
+        (Freemium, Subscription, One-time, Usage-based, Enterprise, etc.), tiers (array of
+        objects with name, price, features), average_price (number) and value_proposition.
+        
+        "market_gaps": 5-10 underserved sub-niches, each with gap_name, description,
+        opportunity_score (0-100), target_audience, why_unsolved and potential_solution.
+        """
+        
+        system_prompt = LANDSCAPE_SYSTEM_PROMPT
+        
+        try:
+            response = await self.groq.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=0.4,
+                max_tokens=8000,
+                json_mode=True,
+                json_schema=_LANDSCAPE_SCHEMA
+            )
             
-            # Sort by opportunity score
-            market_gaps.sort(key=lambda x: x.opportunity_score, reverse=True)
+            data = orjson.loads(response)
             
-            logger.info(f"Identified {len(market_gaps)} market gaps")
-            return market_gaps
+            sentiment = self._parse_sentiment(data.get("sentiment_sources", []))
+            pricing = self._parse_pricing(data.get("pricing_models", []))
+            market_gaps = self._parse_market_gaps(data.get("market_gaps", []))
+            
+            logger.info(
+                f"Competitive landscape: {len(sentiment)} sentiment sources, "
+                f"{len(pricing)} pricing models, {len(market_gaps)} market gaps"
+            )
+            return sentiment, pricing, market_gaps
             
         except Exception as e:
-            logger.error(f"Error identifying market gaps: {str(e)}")
+            logger.error(f"Error analyzing competitive landscape: {str(e)}")
             raise
     
     # ========================================================================
@@ -982,7 +1582,7 @@ class MarketResearchAgent:
         prompt = f"""
         Create a comprehensive executive summary for this market research report:
         
-        {json.dumps(context, indent=2)}
+        {orjson.dumps(context, option=orjson.OPT_INDENT_2).decode()}
         
         Provide:
         1. Executive Summary (3-5 paragraphs covering key findings)
@@ -994,8 +1594,7 @@ class MarketResearchAgent:
         Return as JSON with fields: executive_summary, key_insights (array), recommendations (array).
         """
         
-        system_prompt = """You are a senior business analyst creating executive summaries for C-level executives.
-        Be concise, insightful, and actionable. Return valid JSON only."""
+        system_prompt = SUMMARY_SYSTEM_PROMPT
         
         try:
             response = await self.groq.generate(
@@ -1006,7 +1605,7 @@ class MarketResearchAgent:
                 json_mode=True
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
             
             executive_summary = data.get("executive_summary", "")
             key_insights = data.get("key_insights", [])
@@ -1028,19 +1627,66 @@ class MarketResearchAgent:
         industry: str,
         target_segment: str,
         your_product_description: str = "",
-        geographic_scope: str = "Global"
+        geographic_scope: str = "Global",
+        batch_sections: Optional[bool] = None,
+        force_regenerate: bool = False
     ) -> MarketResearchReport:
         """
         Main method that orchestrates all market research features
         Returns a comprehensive MarketResearchReport
+        
+        With batch_sections, sentiment, pricing and market gaps come from one
+        combined Groq call (falling back to separate calls if it fails). Left
+        as None, batching is used when there are few enough competitors for
+        the combined response to fit (LANDSCAPE_BATCH_MAX_COMPETITORS).
+        A completed report for the same inputs is returned from cache unless
+        force_regenerate is set, which also bypasses the section and Groq
+        response caches so every part of the report is generated anew.
         """
         
+        refresh_token = _refresh_caches.set(force_regenerate)
+        try:
+            return await self._conduct_market_research(
+                industry,
+                target_segment,
+                your_product_description,
+                geographic_scope,
+                batch_sections,
+                force_regenerate
+            )
+        finally:
+            _refresh_caches.reset(refresh_token)
+    
+    async def _conduct_market_research(
+        self,
+        industry: str,
+        target_segment: str,
+        your_product_description: str,
+        geographic_scope: str,
+        batch_sections: Optional[bool],
+        force_regenerate: bool
+    ) -> MarketResearchReport:
+        """Body of conduct_market_research, run with the cache refresh flag set"""
+        
         start_time = datetime.now()
         report_id = str(uuid.uuid4())
+        report_cache_key = _report_cache_key(industry, target_segment, your_product_description, geographic_scope)
         
         logger.info(f"Starting comprehensive market research for {industry}")
         logger.info(f"Report ID: {report_id}")
         
+        if not force_regenerate:
+            cached = await cache.get(report_cache_key)
+            if cached is not None:
+                try:
+                    report = _REPORT_ADAPTER.validate_python(cached)
+                    # Each caller gets its own id (and Markdown export)
+                    report.id = report_id
+                    logger.info(f"Returning cached market research report as {report_id}")
+                    return report
+                except ValidationError:
+                    logger.warning("Discarding stale cached market research report")
+        
         try:
             # Initialize report
             report = MarketResearchReport(
@@ -1051,61 +1697,79 @@ class MarketResearchAgent:
                 status="in_progress"
             )
             
-            # Feature 1: Discover Competitors
-            logger.info("Step 1/7: Discovering competitors...")
-            report.competitors = await self.discover_competitors(
-                industry=industry,
-                target_segment=target_segment,
-                limit=10
-            )
-            
-            # Feature 2: Estimate Market Size (TAM-SAM-SOM)
-            logger.info("Step 2/7: Estimating market size...")
-            report.market_size = await self.estimate_market_size(
-                industry=industry,
-                target_segment=target_segment,
-                geographic_scope=geographic_scope
-            )
-            
-            # Feature 3: Analyze Trends
-            logger.info("Step 3/7: Analyzing market trends...")
-            report.trends = await self.analyze_trends(
-                industry=industry,
-                target_segment=target_segment,
-                limit=20
-            )
-            
-            # Feature 4: Extract User Sentiment
-            logger.info("Step 4/7: Extracting user sentiment...")
-            competitor_names = [c.name for c in report.competitors[:5]]
-            report.sentiment = await self.extract_user_sentiment(
-                industry=industry,
-                target_segment=target_segment,
-                competitors=competitor_names
-            )
-            
-            # Feature 5: Analyze Pricing
-            logger.info("Step 5/7: Analyzing competitor pricing...")
-            report.pricing_intelligence = await self.analyze_pricing(
-                competitors=report.competitors
-            )
-            
+            # Features 1-3 and 6 only need the request inputs, so run them
+            # concurrently; wall time is the slowest call, not the sum
+            logger.info("Steps 1-3, 6: Discovering competitors, estimating market size, analyzing trends, generating SWOT...")
+            phase_one = [
+                # Feature 1: Discover Competitors
+                self.discover_competitors(
+                    industry=industry,
+                    target_segment=target_segment,
+                    limit=10
+                ),
+                # Feature 2: Estimate Market Size (TAM-SAM-SOM)
+                self.estimate_market_size(
+                    industry=industry,
+                    target_segment=target_segment,
+                    geographic_scope=geographic_scope
+                ),
+                # Feature 3: Analyze Trends
+                self.analyze_trends(
+                    industry=industry,
+                    target_segment=target_segment,
+                    limit=20
+                )
+            ]
             # Feature 6: Generate SWOT
-            logger.info("Step 6/7: Generating SWOT analysis...")
             if your_product_description:
-                report.swot = await self.generate_swot(
+                phase_one.append(self.generate_swot(
                     industry=industry,
                     target_segment=target_segment,
                     your_product_description=your_product_description
-                )
+                ))
             
-            # Feature 7 (Bonus): Identify Market Gaps
-            logger.info("Step 7/7: Identifying market gaps...")
-            report.market_gaps = await self.identify_market_gaps(
-                industry=industry,
-                target_segment=target_segment,
-                competitors=report.competitors
-            )
+            results = await asyncio.gather(*phase_one)
+            report.competitors, report.market_size, report.trends = results[:3]
+            if your_product_description:
+                report.swot = results[3]
+            
+            # Features 4, 5 and 7 build on the discovered competitors
+            landscape = None
+            if batch_sections is None:
+                batch_sections = len(report.competitors) <= LANDSCAPE_BATCH_MAX_COMPETITORS
+            if batch_sections:
+                logger.info("Steps 4, 5, 7: Analyzing competitive landscape (batched)...")
+                try:
+                    landscape = await self.analyze_competitive_landscape(
+                        industry=industry,
+                        target_segment=target_segment,
+                        competitors=report.competitors
+                    )
+                except Exception as e:
+                    logger.warning(f"Batched landscape analysis failed, using separate calls: {str(e)}")
+            
+            if landscape is None:
+                logger.info("Steps 4, 5, 7: Extracting user sentiment, analyzing pricing, identifying market gaps...")
+                competitor_names = [c.name for c in report.competitors[:5]]
+                landscape = await asyncio.gather(
+                    # Feature 4: Extract User Sentiment
+                    self.extract_user_sentiment(
+                        industry=industry,
+                        target_segment=target_segment,
+                        competitors=competitor_names
+                    ),
+                    # Feature 5: Analyze Pricing
+                    self.analyze_pricing(
+                        competitors=report.competitors
+                    ),
+                    # Feature 7 (Bonus): Identify Market Gaps
+                    self.identify_market_gaps(
+                        industry=industry,
+                        target_segment=target_segment,
+                        competitors=report.competitors
+                    )
+                )
+            report.sentiment, report.pricing_intelligence, report.market_gaps = landscape
             
             # Feature 8: Generate Executive Summary
             logger.info("Generating executive summary...")
@@ -1121,6 +1785,7 @@ class MarketResearchAgent:
             
             logger.info(f"Market research completed in {report.processing_time:.2f} seconds")
             
+            await cache.set(report_cache_key, self.format_report_json(report), REPORT_CACHE_TTL)
             return report
             
         except Exception as e:
@@ -1134,31 +1799,16 @@ class MarketResearchAgent:
     def format_report_json(self, report: MarketResearchReport) -> Dict[str, Any]:
         """Format report as JSON dictionary"""
         
-        return {
-            "id": report.id,
-            "timestamp": report.timestamp,
-            "industry": report.industry,
-            "target_segment": report.target_segment,
-            "status": report.status,
-            "processing_time": report.processing_time,
-            
-            "competitors": [asdict(c) for c in report.competitors],
-            "market_size": asdict(report.market_size) if report.market_size else None,
-            "trends": [asdict(t) for t in report.trends],
-            "sentiment": [asdict(s) for s in report.sentiment],
-            "pricing_intelligence": [asdict(p) for p in report.pricing_intelligence],
-            "swot": asdict(report.swot) if report.swot else None,
-            "market_gaps": [asdict(g) for g in report.market_gaps],
-            
-            "executive_summary": report.executive_summary,
-            "key_insights": report.key_insights,
-            "recommendations": report.recommendations
-        }
+        # LLM output isn't validated against the field types, so don't warn
+        # when a list item isn't the annotated type
+        return _REPORT_ADAPTER.dump_python(report, mode="json", warnings=False)
     
     def export_to_markdown(self, report: MarketResearchReport) -> str:
         """Export report as Markdown format"""
         
-        md = f"""# Market Research Report
+        # Sections are appended to a list and joined once at the end; repeated
+        # += on a growing string re-copies the whole document each time
+        parts = [f"""# Market Research Report
         
 **Industry:** {report.industry}  
 **Target Segment:** {report.target_segment}  
@@ -1176,121 +1826,127 @@ class MarketResearchAgent:
 
 ## Key Insights
 
-"""
+"""]
         
-        for insight in report.key_insights:
-            md += f"- {insight}\n"
+        parts.extend(f"- {insight}\n" for insight in report.key_insights)
         
-        md += "\n---\n\n## Strategic Recommendations\n\n"
+        parts.append("\n---\n\n## Strategic Recommendations\n\n")
         
-        for rec in report.recommendations:
-            md += f"- {rec}\n"
+        parts.extend(f"- {rec}\n" for rec in report.recommendations)
         
         # Market Size
         if report.market_size:
-            md += f"\n---\n\n## Market Size Analysis (TAM-SAM-SOM)\n\n"
-            md += f"- **TAM (Total Addressable Market):** ${report.market_size.tam:,.0f} {report.market_size.currency}\n"
-            md += f"  - {report.market_size.tam_description}\n\n"
-            md += f"- **SAM (Serviceable Addressable Market):** ${report.market_size.sam:,.0f} {report.market_size.currency}\n"
-            md += f"  - {report.market_size.sam_description}\n\n"
-            md += f"- **SOM (Serviceable Obtainable Market):** ${report.market_size.som:,.0f} {report.market_size.currency}\n"
-            md += f"  - {report.market_size.som_description}\n\n"
+            parts.append(f"\n---\n\n## Market Size Analysis (TAM-SAM-SOM)\n\n")
+            parts.append(f"- **TAM (Total Addressable Market):** ${report.market_size.tam:,.0f} {report.market_size.currency}\n")
+            parts.append(f"  - {report.market_size.tam_description}\n\n")
+            parts.append(f"- **SAM (Serviceable Addressable Market):** ${report.market_size.sam:,.0f} {report.market_size.currency}\n")
+            parts.append(f"  - {report.market_size.sam_description}\n\n")
+            parts.append(f"- **SOM (Serviceable Obtainable Market):** ${report.market_size.som:,.0f} {report.market_size.currency}\n")
+            parts.append(f"  - {report.market_size.som_description}\n\n")
         
         # Competitors
-        md += f"\n---\n\n## Competitor Analysis ({len(report.competitors)} competitors)\n\n"
+        parts.append(f"\n---\n\n## Competitor Analysis ({len(report.competitors)} competitors)\n\n")
         
         for i, comp in enumerate(report.competitors, 1):
-            md += f"### {i}. {comp.name}\n\n"
-            md += f"{comp.description}\n\n"
+            parts.append(f"### {i}. {comp.name}\n\n")
+            parts.append(f"{comp.description}\n\n")
             if comp.url:
-                md += f"**Website:** {comp.url}\n\n"
+                parts.append(f"**Website:** {comp.url}\n\n")
             if comp.funding:
-                md += f"**Funding:** {comp.funding}\n\n"
+                parts.append(f"**Funding:** {comp.funding}\n\n")
             if comp.team_size:
-                md += f"**Team Size:** {comp.team_size}\n\n"
+                parts.append(f"**Team Size:** {comp.team_size}\n\n")
             if comp.pricing_model:
-                md += f"**Pricing Model:** {comp.pricing_model}\n\n"
+                parts.append(f"**Pricing Model:** {comp.pricing_model}\n\n")
             
             if comp.strengths:
-                md += "**Strengths:**\n"
-                for strength in comp.strengths:
-                    md += f"- {strength}\n"
-                md += "\n"
+                parts.append("**Strengths:**\n")
+                parts.extend(f"- {strength}\n" for strength in comp.strengths)
+                parts.append("\n")
             
             if comp.weaknesses:
-                md += "**Weaknesses:**\n"
-                for weakness in comp.weaknesses:
-                    md += f"- {weakness}\n"
-                md += "\n"
+                parts.append("**Weaknesses:**\n")
+                parts.extend(f"- {weakness}\n" for weakness in comp.weaknesses)
+                parts.append("\n")
         
         # Trends
-        md += f"\n---\n\n## Market Trends ({len(report.trends)} trends)\n\n"
+        parts.append(f"\n---\n\n## Market Trends ({len(report.trends)} trends)\n\n")
         
         for i, trend in enumerate(report.trends[:10], 1):
-            md += f"{i}. **{trend.keyword}** (Score: {trend.trend_score}/100)\n"
-            md += f"   - Category: {trend.category}\n"
+            parts.append(f"{i}. **{trend.keyword}** (Score: {trend.trend_score}/100)\n")
+            parts.append(f"   - Category: {trend.category}\n")
             if trend.growth_rate:
-                md += f"   - Growth Rate: {trend.growth_rate}\n"
-            md += f"   - {trend.relevance}\n\n"
+                parts.append(f"   - Growth Rate: {trend.growth_rate}\n")
+            parts.append(f"   - {trend.relevance}\n\n")
         
         # Sentiment
         if report.sentiment:
-            md += f"\n---\n\n## User Sentiment Analysis\n\n"
+            parts.append(f"\n---\n\n## User Sentiment Analysis\n\n")
             
             for sent in report.sentiment:
-                md += f"### {sent.source}\n\n"
-                md += f"**Sentiment Score:** {sent.sentiment_score:.2f} (-1 to +1)\n\n"
-                md += f"**Sample Size:** {sent.sample_size} reviews\n\n"
+                parts.append(f"### {sent.source}\n\n")
+                parts.append(f"**Sentiment Score:** {sent.sentiment_score:.2f} (-1 to +1)\n\n")
+                parts.append(f"**Sample Size:** {sent.sample_size} reviews\n\n")
                 
                 if sent.pain_points:
-                    md += "**Pain Points:**\n"
-                    for pain in sent.pain_points:
-                        md += f"- {pain}\n"
-                    md += "\n"
+                    parts.append("**Pain Points:**\n")
+                    parts.extend(f"- {pain}\n" for pain in sent.pain_points)
+                    parts.append("\n")
                 
                 if sent.positive_feedback:
-                    md += "**Positive Feedback:**\n"
-                    for pos in sent.positive_feedback:
-                        md += f"- {pos}\n"
-                    md += "\n"
+                    parts.append("**Positive Feedback:**\n")
+                    parts.extend(f"- {pos}\n" for pos in sent.positive_feedback)
+                    parts.append("\n")
         
         # SWOT
         if report.swot:
-            md += f"\n---\n\n## SWOT Analysis\n\n"
+            parts.append(f"\n---\n\n## SWOT Analysis\n\n")
             
-            md += "### Strengths\n\n"
-            for s in report.swot.strengths:
-                md += f"- {s}\n"
+            parts.append("### Strengths\n\n")
+            parts.extend(f"- {s}\n" for s in report.swot.strengths)
             
-            md += "\n### Weaknesses\n\n"
-            for w in report.swot.weaknesses:
-                md += f"- {w}\n"
+            parts.append("\n### Weaknesses\n\n")
+            parts.extend(f"- {w}\n" for w in report.swot.weaknesses)
             
-            md += "\n### Opportunities\n\n"
-            for o in report.swot.opportunities:
-                md += f"- {o}\n"
+            parts.append("\n### Opportunities\n\n")
+            parts.extend(f"- {o}\n" for o in report.swot.opportunities)
             
-            md += "\n### Threats\n\n"
-            for t in report.swot.threats:
-                md += f"- {t}\n"
+            parts.append("\n### Threats\n\n")
+            parts.extend(f"- {t}\n" for t in report.swot.threats)
             
             if report.swot.chart_url:
-                md += f"\n![SWOT Analysis]({report.swot.chart_url})\n"
+                parts.append(f"\n![SWOT Analysis]({report.swot.chart_url})\n")
         
         # Market Gaps
         if report.market_gaps:
-            md += f"\n---\n\n## Market Gap Radar ({len(report.market_gaps)} opportunities)\n\n"
+            parts.append(f"\n---\n\n## Market Gap Radar ({len(report.market_gaps)} opportunities)\n\n")
             
             for i, gap in enumerate(report.market_gaps, 1):
-                md += f"### {i}. {gap.gap_name} (Opportunity Score: {gap.opportunity_score}/100)\n\n"
-                md += f"{gap.description}\n\n"
-                md += f"**Target Audience:** {gap.target_audience}\n\n"
-                md += f"**Why Unsolved:** {gap.why_unsolved}\n\n"
-                md += f"**Potential Solution:** {gap.potential_solution}\n\n"
+                parts.append(f"### {i}. {gap.gap_name} (Opportunity Score: {gap.opportunity_score}/100)\n\n")
+                parts.append(f"{gap.description}\n\n")
+                parts.append(f"**Target Audience:** {gap.target_audience}\n\n")
+                parts.append(f"**Why Unsolved:** {gap.why_unsolved}\n\n")
+                parts.append(f"**Potential Solution:** {gap.potential_solution}\n\n")
         
-        md += "\n---\n\n*Report generated by Nexora Market Research Agent*\n"
+        parts.append("\n---\n\n*Report generated by Nexora Market Research Agent*\n")
         
-        return md
+        return "".join(parts)
+    
+    def _write_markdown_report(self, report: MarketResearchReport, reports_dir: str) -> str:
+        """Render and write the Markdown export (blocking; runs in a worker thread)"""
+        os.makedirs(reports_dir, exist_ok=True)
+        report_path = os.path.join(reports_dir, f"market_research_{report.id}.md")
+        with open(report_path, "w", encoding="utf-8") as f:
+            f.write(self.export_to_markdown(report))
+        return report_path
+    
+    async def save_markdown_report(self, report: MarketResearchReport, reports_dir: str = "reports") -> str:
+        """
+        Save the Markdown export where the report download endpoint looks for
+        it. Rendering and file I/O run off the event loop so concurrent Groq
+        calls aren't stalled behind them.
+        """
+        return await asyncio.to_thread(self._write_markdown_report, report, reports_dir)
 
 
 # ============================================================================
@@ -18,22 +18,34 @@ License: MIT
 """
 
 import os
-import json
+import random
 import uuid
 import asyncio
 import logging
 import re
+import time
 import base64
+import copy
+import hashlib
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, AsyncIterator, Dict, Final, Iterator, List, Mapping, Optional, Any, Set, Tuple
 from dataclasses import dataclass, asdict, field
 from io import BytesIO
 from urllib.parse import quote
 
 # Third-party imports
 import aiohttp
+import orjson
 import requests
 from dotenv import load_dotenv
+from pydantic import TypeAdapter, ValidationError
+
+from cache import TTLCache
+
+# httpx is imported on first use by GroqClient, as in the market research agent
+if TYPE_CHECKING:
+    import httpx
 
 # PPTX Generation
 try:
@@ -42,6 +54,9 @@ try:
     from pptx.enum.text import PP_ALIGN
     from pptx.dml.color import RGBColor
     PPTX_AVAILABLE = True
+    
+    # RGBColor is an immutable tuple, so one instance serves every shape
+    WHITE = RGBColor(255, 255, 255)
 except ImportError:
     PPTX_AVAILABLE = False
     logging.warning("python-pptx not available. PPTX generation will be disabled.")
@@ -72,6 +87,15 @@ class SlideContent:
     chart_type: Optional[str] = None  # bar, line, pie, doughnut
 
 
+# PitchDeckSlides fields in presentation order (index = slide_number - 1)
+SLIDE_FIELDS: Final[Tuple[str, ...]] = (
+    "title_slide", "problem_slide", "solution_slide",
+    "market_slide", "product_slide", "business_model_slide",
+    "traction_slide", "competition_slide", "team_slide",
+    "financials_slide", "ask_slide", "closing_slide"
+)
+
+
 @dataclass
 class PitchDeckSlides:
     """Complete pitch deck slides"""
@@ -87,6 +111,15 @@ class PitchDeckSlides:
     financials_slide: SlideContent
     ask_slide: SlideContent
     closing_slide: SlideContent
+    
+    def all_slides(self) -> List[SlideContent]:
+        """Slides in presentation order"""
+        return [getattr(self, name) for name in SLIDE_FIELDS]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PitchDeckSlides":
+        """Rebuild from asdict() output, e.g. slides posted back by the frontend"""
+        return cls(**{name: SlideContent(**data.get(name, {})) for name in SLIDE_FIELDS})
 
 
 @dataclass
@@ -147,10 +180,113 @@ class PitchDeckResponse:
     created_at: str = ""
 
 
+# Validators for the model's JSON, compiled once at import. pydantic-core
+# builds the dataclasses in one pass instead of a per-field kwargs loop.
+_SLIDES_ADAPTER = TypeAdapter(List[SlideContent])
+_DESIGN_THEME_ADAPTER = TypeAdapter(DesignTheme)
+_DEMO_SCRIPT_ADAPTER = TypeAdapter(DemoScript)
+_INVESTOR_QA_ADAPTER = TypeAdapter(List[InvestorQuestion])
+
+
+def _validate_response(adapter: TypeAdapter, data: Any) -> Optional[Any]:
+    """
+    Validate model output against an adapter. Returns None when it doesn't fit
+    (missing keys, nulls, wrong types) so the caller can fall back to its
+    field-by-field parsing with defaults.
+    """
+    try:
+        return adapter.validate_python(data)
+    except ValidationError:
+        return None
+
+
+def _response_schema(name: str, **sections: TypeAdapter) -> Dict[str, Any]:
+    """
+    Build a Groq json_schema response format for an object whose keys are the
+    given sections. Nested dataclass definitions are hoisted to the root
+    $defs so every $ref resolves against the top-level schema.
+    """
+    properties = {}
+    defs = {}
+    for key, adapter in sections.items():
+        schema = dict(adapter.json_schema())
+        defs.update(schema.pop("$defs", {}))
+        properties[key] = schema
+    
+    schema = {"type": "object", "properties": properties, "required": list(sections)}
+    if defs:
+        schema["$defs"] = defs
+    return {"name": name, "schema": schema}
+
+
+# Computed once at import; sent as response_format on models that support
+# structured outputs so responses come back already shaped for the adapters
+_SLIDES_SCHEMA = _response_schema("pitch_deck_slides", slides=_SLIDES_ADAPTER)
+_DESIGN_THEME_SCHEMA = {"name": "design_theme", "schema": _DESIGN_THEME_ADAPTER.json_schema()}
+_DEMO_SCRIPT_SCHEMA = {"name": "demo_script", "schema": _DEMO_SCRIPT_ADAPTER.json_schema()}
+_INVESTOR_QA_SCHEMA = _response_schema("investor_qa", questions=_INVESTOR_QA_ADAPTER)
+
+
 # ============================================================================
 # API CLIENTS
 # ============================================================================
 
+# Upper bound on in-flight Groq requests across every agent instance in the
+# process. create_pitch_deck fans out several calls at once; beyond this they
+# queue here instead of tripping Groq's rate limits.
+GROQ_CONCURRENCY = int(os.getenv("NEXORA_GROQ_CONCURRENCY", "20"))
+_GROQ_SEMAPHORE = asyncio.Semaphore(GROQ_CONCURRENCY)
+
+# Backoff for 429s and timeouts: 2s, 4s, 8s, ... capped, plus jitter so
+# concurrent callers don't retry in lockstep
+GROQ_BACKOFF_BASE = 2.0
+GROQ_BACKOFF_MAX = 30.0
+
+
+class GroqAPIError(Exception):
+    """A Groq request failed (error status, timeout, or connection failure)"""
+
+
+class GroqRateLimitError(GroqAPIError):
+    """Groq answered 429; retry_after is the server's hint in seconds, if any"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _retry_after_seconds(headers: Mapping[str, str]) -> Optional[float]:
+    """Parse a numeric Retry-After header"""
+    try:
+        return float(headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Seconds to wait before retry number attempt + 1"""
+    if retry_after is not None:
+        return min(retry_after, GROQ_BACKOFF_MAX)
+    return min(GROQ_BACKOFF_MAX, GROQ_BACKOFF_BASE * 2 ** attempt) + random.uniform(0, 1)
+
+
+# Failures a generation step recovers from by returning default content:
+# the Groq call failing, or the model returning JSON of the wrong shape
+# (bad syntax, missing keys, lists where objects were expected). Anything
+# else is a bug and propagates instead of being masked by defaults.
+RECOVERABLE_ERRORS = (GroqAPIError, ValueError, KeyError, TypeError, AttributeError)
+
+
+# Groq models that accept response_format json_schema; others fall back to
+# plain JSON mode
+GROQ_JSON_SCHEMA_MODELS = frozenset({
+    "openai/gpt-oss-20b",
+    "openai/gpt-oss-120b",
+    "moonshotai/kimi-k2-instruct",
+    "meta-llama/llama-4-maverick-17b-128e-instruct",
+    "meta-llama/llama-4-scout-17b-16e-instruct",
+})
+
 class GroqClient:
     """Groq API client for Llama models with rate limiting"""
     
@@ -162,13 +298,59 @@ class GroqClient:
         self.model = os.getenv("GROQ_MODEL", "llama-3.1-8b-instant")
         self.last_request_time = 0
         self.min_request_interval = 2.0  # Minimum 2 seconds between requests
+        self.supports_json_schema = self.model in GROQ_JSON_SCHEMA_MODELS
         
         if not self.api_key:
             raise ValueError("GROQ_API_KEY not found in environment variables")
         
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # Shared client so every call reuses one pooled HTTP/2 connection
+        # instead of a new session and TLS handshake per request
+        self._client: Optional["httpx.AsyncClient"] = None
+        
         logger.info(f"GroqClient initialized with model: {self.model} (rate limited)")
     
-    async def generate(
+    async def _get_client(self) -> "httpx.AsyncClient":
+        """Get the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            import httpx
+            
+            # HTTP/2 multiplexes create_pitch_deck's concurrent calls over one connection
+            self._client = httpx.AsyncClient(
+                http2=True,
+                headers=self._headers,
+                timeout=httpx.Timeout(60.0),
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32
+                )
+            )
+        return self._client
+    
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+    
+    async def _wait_for_slot(self):
+        """
+        Rate limiting: reserve the next request slot before sleeping so
+        concurrent callers start min_request_interval apart instead of all
+        passing the check at once
+        """
+        current_time = time.time()
+        request_time = max(current_time, self.last_request_time + self.min_request_interval)
+        self.last_request_time = request_time
+        if request_time > current_time:
+            wait_time = request_time - current_time
+            logger.info(f"Rate limiting: waiting {wait_time:.1f}s before request")
+            await asyncio.sleep(wait_time)
+    
+    async def generate_stream(
         self,
         prompt: str,
         system_prompt: Optional[str] = None,
@@ -176,20 +358,97 @@ class GroqClient:
         max_tokens: int = 4000,
         json_mode: bool = False,
         model: Optional[str] = None,
+        json_schema: Optional[Dict[str, Any]] = None,
         max_retries: int = 5
-    ) -> str:
-        """Generate response using Groq with exponential backoff retry"""
+    ) -> AsyncIterator[str]:
+        """
+        Stream a completion from Groq, yielding content deltas as they arrive
+        
+        A 429 arrives before any content, so it is retried with the same
+        backoff as generate; once deltas are flowing there is no retry.
+        """
         
         messages = []
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
         messages.append({"role": "user", "content": prompt})
         
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
+        payload = {
+            "model": model or self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "top_p": 0.95,
+            "frequency_penalty": 0.1,
+            "presence_penalty": 0.1,
+            "stream": True
         }
         
+        if json_schema is not None and (model or self.model) in GROQ_JSON_SCHEMA_MODELS:
+            payload["response_format"] = {"type": "json_schema", "json_schema": json_schema}
+        elif json_mode or json_schema is not None:
+            payload["response_format"] = {"type": "json_object"}
+        
+        client = await self._get_client()
+        body = orjson.dumps(payload)
+        
+        for attempt in range(max_retries + 1):
+            await self._wait_for_slot()
+            
+            async with _GROQ_SEMAPHORE, client.stream("POST", self.base_url, content=body) as response:
+                if response.status_code != 200:
+                    error_text = (await response.aread()).decode("utf-8", "replace")
+                    if response.status_code != 429:
+                        logger.error(f"Groq API error: {error_text}")
+                        raise GroqAPIError(f"Groq API error ({response.status_code}): {error_text}")
+                    retry_after = _retry_after_seconds(response.headers)
+                else:
+                    async for line in response.aiter_lines():
+                        line = line.strip()
+                        if not line.startswith("data:"):
+                            continue
+                        data = line[5:].strip()
+                        if data == "[DONE]":
+                            break
+                        
+                        delta = orjson.loads(data)["choices"][0].get("delta", {}).get("content")
+                        if delta:
+                            yield delta
+                    return
+            
+            # Rate limited; back off outside the semaphore
+            if attempt == max_retries:
+                raise GroqRateLimitError(
+                    f"Rate limit exceeded after {max_retries} retries. Please wait 60-90 seconds and try again. Error: {error_text}",
+                    retry_after
+                )
+            wait_time = _backoff_delay(attempt, retry_after)
+            logger.warning(f"Rate limit hit. Retry {attempt + 1}/{max_retries} after {wait_time:.1f}s...")
+            await asyncio.sleep(wait_time)
+    
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 4000,
+        json_mode: bool = False,
+        model: Optional[str] = None,
+        max_retries: int = 5,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """
+        Generate response using Groq with exponential backoff retry
+        
+        json_schema ({"name": ..., "schema": ...}) requests structured output
+        on models that support it; on other models the call uses JSON mode.
+        """
+        
+        messages = []
+        if system_prompt:
+            messages.append({"role": "system", "content": system_prompt})
+        messages.append({"role": "user", "content": prompt})
+        
         payload = {
             "model": model or self.model,
             "messages": messages,
@@ -200,73 +459,53 @@ class GroqClient:
             "presence_penalty": 0.1
         }
         
-        if json_mode:
+        if json_schema is not None and (model or self.model) in GROQ_JSON_SCHEMA_MODELS:
+            payload["response_format"] = {"type": "json_schema", "json_schema": json_schema}
+        elif json_mode or json_schema is not None:
             payload["response_format"] = {"type": "json_object"}
         
-        retry_count = 0
-        base_delay = 2.0
+        import httpx
+        
+        client = await self._get_client()
+        body = orjson.dumps(payload)
         
-        while retry_count <= max_retries:
+        for attempt in range(max_retries + 1):
             try:
-                # Rate limiting: ensure minimum interval between requests
-                import time
-                current_time = time.time()
-                time_since_last = current_time - self.last_request_time
-                if time_since_last < self.min_request_interval:
-                    wait_time = self.min_request_interval - time_since_last
-                    logger.info(f"Rate limiting: waiting {wait_time:.1f}s before request")
-                    await asyncio.sleep(wait_time)
+                await self._wait_for_slot()
                 
-                async with aiohttp.ClientSession() as session:
-                    async with session.post(
-                        self.base_url,
-                        json=payload,
-                        headers=headers,
-                        timeout=aiohttp.ClientTimeout(total=60)
-                    ) as response:
-                        self.last_request_time = time.time()
-                        
-                        if response.status == 429:  # Rate limit error
-                            retry_count += 1
-                            if retry_count > max_retries:
-                                error_text = await response.text()
-                                raise Exception(f"Rate limit exceeded after {max_retries} retries. Please wait 60-90 seconds and try again. Error: {error_text}")
-                            
-                            # Exponential backoff: 2s, 4s, 8s, 16s, 32s
-                            wait_time = base_delay * (2 ** retry_count)
-                            logger.warning(f"Rate limit hit. Retry {retry_count}/{max_retries} after {wait_time}s...")
-                            await asyncio.sleep(wait_time)
-                            continue
-                        
-                        if response.status != 200:
-                            error_text = await response.text()
-                            logger.error(f"Groq API error: {error_text}")
-                            raise Exception(f"Groq API error ({response.status}): {error_text}")
-                        
-                        data = await response.json()
-                        return data["choices"][0]["message"]["content"]
-                        
-            except asyncio.TimeoutError:
-                retry_count += 1
-                if retry_count > max_retries:
-                    raise Exception(f"Request timeout after {max_retries} retries")
-                wait_time = base_delay * retry_count
-                logger.warning(f"Timeout. Retry {retry_count}/{max_retries} after {wait_time}s...")
-                await asyncio.sleep(wait_time)
+                async with _GROQ_SEMAPHORE:
+                    response = await client.post(self.base_url, content=body)
                 
-            except Exception as e:
-                if "rate limit" in str(e).lower() or "429" in str(e):
-                    retry_count += 1
-                    if retry_count > max_retries:
-                        raise Exception(f"Rate limit exceeded. Please wait 60-90 seconds and try again. The free Groq API has a limit of 12,000 tokens per minute.")
-                    wait_time = base_delay * (2 ** retry_count)
-                    logger.warning(f"Rate limit error. Retry {retry_count}/{max_retries} after {wait_time}s...")
-                    await asyncio.sleep(wait_time)
-                else:
-                    logger.error(f"Error calling Groq API: {str(e)}")
-                    raise
+                if response.status_code == 429:  # Rate limit error
+                    raise GroqRateLimitError(response.text, _retry_after_seconds(response.headers))
+                
+                if response.status_code != 200:
+                    error_text = response.text
+                    logger.error(f"Groq API error: {error_text}")
+                    raise GroqAPIError(f"Groq API error ({response.status_code}): {error_text}")
+                
+                data = orjson.loads(response.content)
+                return data["choices"][0]["message"]["content"]
+            
+            except GroqRateLimitError as e:
+                if attempt == max_retries:
+                    raise GroqRateLimitError(f"Rate limit exceeded after {max_retries} retries. Please wait 60-90 seconds and try again. Error: {e}")
+                wait_time = _backoff_delay(attempt, e.retry_after)
+                logger.warning(f"Rate limit hit. Retry {attempt + 1}/{max_retries} after {wait_time:.1f}s...")
+                await asyncio.sleep(wait_time)
+            
+            except httpx.TimeoutException:
+                if attempt == max_retries:
+                    raise GroqAPIError(f"Request timeout after {max_retries} retries")
+                wait_time = _backoff_delay(attempt)
+                logger.warning(f"Timeout. Retry {attempt + 1}/{max_retries} after {wait_time:.1f}s...")
+                await asyncio.sleep(wait_time)
+            
+            except httpx.TransportError as e:
+                logger.error(f"Error calling Groq API: {str(e)}")
+                raise GroqAPIError(f"Error calling Groq API: {str(e)}") from e
         
-        raise Exception("Maximum retries exceeded")
+        raise GroqAPIError("Maximum retries exceeded")
 
 
 class MoonshotClient:
@@ -425,7 +664,7 @@ class QuickChartClient:
             }
         }
         
-        config_json = json.dumps(chart_config)
+        config_json = orjson.dumps(chart_config).decode()
         encoded_config = quote(config_json)
         
         return f"{self.base_url}?width={width}&height={height}&chart={encoded_config}"
@@ -456,56 +695,73 @@ class QuickChartClient:
 
 
 # ============================================================================
-# PITCH DECK AGENT
+# INCREMENTAL JSON
 # ============================================================================
 
-class PitchDeckAgent:
+class JSONArrayItemScanner:
     """
-    PITCH DECK AGENT
-    
-    Creates professional, investor-ready pitch decks automatically with:
-    - Auto Slide Generator (12 slides)
-    - Voiceover Narration (ElevenLabs)
-    - AI Design Theme Selector
-    - Chart Auto-Builder (QuickChart)
-    - Script Writer for Demo Day
-    - Slide Export as PPTX/Video
-    - Investor Q&A Simulator
+    Incrementally scans a streamed JSON document shaped like
+    {"key": [{...}, {...}]} and yields each array element as soon as its
+    closing brace arrives, without waiting for the rest of the document.
     """
     
-    def __init__(
-        self,
-        groq_api_key: Optional[str] = None,
-        elevenlabs_api_key: Optional[str] = None
-    ):
-        """Initialize the Pitch Deck Agent"""
-        
-        # Always use Groq client for Llama models
-        logger.info("Initializing PitchDeckAgent with Groq client")
-        self.groq = GroqClient(groq_api_key)
-        self.elevenlabs = ElevenLabsClient(elevenlabs_api_key)
-        self.quickchart = QuickChartClient()
-        
-        logger.info("Pitch Deck Agent initialized successfully")
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._item_start = -1
     
-    # ========================================================================
-    # MODULE 1: AUTO SLIDE GENERATOR
-    # ========================================================================
+    def feed(self, chunk: str) -> Iterator[Dict[str, Any]]:
+        """Add streamed text and yield any array items it completes"""
+        self._buffer += chunk
+        buffer = self._buffer
+        
+        for pos in range(self._pos, len(buffer)):
+            char = buffer[pos]
+            
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                # An object opening inside the top-level array (object depth
+                # 1, array depth 2) starts a new item
+                if char == "{" and self._depth == 3:
+                    self._item_start = pos
+            elif char in "}]":
+                self._depth -= 1
+                if char == "}" and self._depth == 2 and self._item_start >= 0:
+                    item = buffer[self._item_start:pos + 1]
+                    self._item_start = -1
+                    try:
+                        yield orjson.loads(item)
+                    except orjson.JSONDecodeError:
+                        logger.warning("Skipping malformed streamed JSON item")
+        
+        self._pos = len(buffer)
     
-    async def generate_slides(
-        self,
-        business_idea: str,
-        business_name: str = "",
-        target_market: str = "",
-        funding_ask: float = 0
-    ) -> PitchDeckSlides:
-        """Generate structured slide content for the pitch deck.
+    @property
+    def text(self) -> str:
+        """Everything received so far"""
+        return self._buffer
 
-        This uses the LLM to create 12 slides with clear titles and
-        30 concise, investor-focused bullet points per slide.
-        """
-        
-        system_prompt = """You are a world-class startup pitch deck expert.
+
+# ============================================================================
+# SYSTEM PROMPTS
+# ============================================================================
+# Module constants so every call sends byte-identical system messages; Groq's
+# prompt caching reuses prefill for a repeated prefix. Request-specific text
+# (idea, name, slides) only ever goes in the user message.
+
+SLIDES_SYSTEM_PROMPT: Final[str] = """You are a world-class startup pitch deck expert.
 Generate a structured, investor-ready 12-slide pitch deck.
 
 The deck MUST follow this exact structure and order:
@@ -538,90 +794,438 @@ Return ONLY valid JSON with this structure (no extra text):
   ]
 }"""
 
-        funding_ask_str = f"${funding_ask:,.0f}" if funding_ask and funding_ask > 0 else "Not specified"
+NARRATION_SYSTEM_PROMPT: Final[str] = """You are a professional pitch coach. 
+Convert slide bullet points into a natural, engaging narration script.
+Keep it conversational, confident, and concise (30-60 seconds per slide).
+
+Write one script per slide you are given and return JSON:
+{
+  "narrations": [
+    {"slide_number": 1, "script": "Narration for slide 1"}
+  ]
+}"""
+
+DESIGN_THEME_SYSTEM_PROMPT: Final[str] = """You are a UI/UX designer specializing in pitch deck design.
+Select appropriate colors, fonts, and style for the given business.
 
-        user_prompt = f"""Create a complete 12-slide pitch deck for this business.
+Return ONLY valid JSON:
+{
+  "name": "Theme Name",
+  "primary_color": "#HEX",
+  "secondary_color": "#HEX",
+  "accent_color": "#HEX",
+  "background_color": "#HEX",
+  "text_color": "#HEX",
+  "font_family": "Font Name",
+  "style_description": "Description of the design style"
+}"""
+
+MARKET_CHART_SYSTEM_PROMPT: Final[str] = """You are a market research analyst.
+Estimate TAM (Total Addressable Market), SAM (Serviceable Addressable Market), 
+and SOM (Serviceable Obtainable Market) for the given business.
+
+Return ONLY valid JSON:
+{
+  "labels": ["TAM", "SAM", "SOM"],
+  "datasets": [{
+    "label": "Market Size ($B)",
+    "data": [100, 20, 2],
+    "backgroundColor": ["#3b82f6", "#60a5fa", "#93c5fd"]
+  }]
+}"""
+
+DEMO_SCRIPT_SYSTEM_PROMPT: Final[str] = """You are a pitch coach who has trained hundreds of founders for Demo Day.
+Create a compelling, well-paced pitch script that flows naturally.
+
+Include:
+- Natural transitions between slides
+- Pacing cues (PAUSE, EMPHASIZE, SLOW DOWN, etc.)
+- Time allocation per slide
+- Key emphasis points
+
+Return ONLY valid JSON:
+{
+  "full_script": "Complete script text...",
+  "slide_scripts": [
+    {
+      "slide_number": 1,
+      "script": "Script for this slide...",
+      "duration_seconds": 20,
+      "pacing_cues": ["PAUSE after company name", "EMPHASIZE tagline"]
+    }
+  ],
+  "total_duration_minutes": 5.0,
+  "pacing_cues": ["Overall pacing tip 1", "Overall pacing tip 2"],
+  "emphasis_points": ["Key point to emphasize 1", "Key point to emphasize 2"]
+}"""
+
+INVESTOR_QA_SYSTEM_PROMPT: Final[str] = """You are a veteran venture capitalist conducting due diligence.
+Generate tough but fair questions that investors would ask after a pitch.
+
+Categories: financial, market, team, product, competition
+Difficulty: easy, medium, hard
+
+Return ONLY valid JSON:
+{
+  "questions": [
+    {
+      "question": "The question text",
+      "category": "financial",
+      "difficulty": "medium",
+      "suggested_answer": "A strong answer to this question",
+      "key_points": ["point1", "point2", "point3"]
+    }
+  ]
+}"""
+
+
+# ============================================================================
+# USER PROMPT TEMPLATES
+# ============================================================================
+# Filled with str.format_map so the fixed wording is built once at import
+# rather than re-assembled by an f-string on every call.
+
+SLIDES_USER_TEMPLATE: Final[str] = """Create a complete 12-slide pitch deck for this business.
+
+BUSINESS IDEA: {business_idea}
+BUSINESS NAME: {business_name}
+TARGET MARKET: {target_market}
+FUNDING ASK: {funding_ask}
+
+Requirements:
+- Follow exactly the 12-slide structure defined in the system prompt.
+- Each slide must have a clear, specific title.
+- Each slide's "content" must be a list of 36 short, punchy bullet points.
+- Make the content concrete, investor-focused, and easy to present.
+- Where possible, include simple numbers or examples instead of vague claims.
+
+Return ONLY valid JSON matching the specified schema."""
+
+NARRATION_USER_TEMPLATE: Final[str] = """Create a narration script for each of these slides:
+
+{slides}
+
+Write a natural, engaging script that sounds great when spoken aloud.
+Keep each one to 30-60 seconds. Be confident and compelling.
+Return as JSON with one entry per slide."""
+
+NARRATION_SLIDE_TEMPLATE: Final[str] = """SLIDE {slide_number}
+TITLE: {title}
+CONTENT:
+{content}
+
+NOTES: {notes}"""
+
+DESIGN_THEME_USER_TEMPLATE: Final[str] = """Select a design theme for this pitch deck:
 
 BUSINESS IDEA: {business_idea}
-BUSINESS NAME: {business_name or "Not specified"}
-TARGET MARKET: {target_market or "Not specified"}
-FUNDING ASK: {funding_ask_str}
+BRAND TONE: {brand_tone}
+
+Choose colors and fonts that match the business and brand tone.
+Popular tones: Minimalist, Techy, Bold, Corporate, Creative, Modern.
+Return as JSON."""
+
+MARKET_CHART_USER_TEMPLATE: Final[str] = """Estimate market sizes for: {business_idea}
+
+Provide realistic TAM, SAM, SOM estimates in billions of dollars.
+Return as JSON for a bar chart."""
+
+DEMO_SCRIPT_USER_TEMPLATE: Final[str] = """Create a {target_duration_minutes}-minute Demo Day pitch script for these slides:
+
+{slides_summary}
+
+Requirements:
+- Total duration: {target_duration_minutes} minutes
+- Natural, conversational tone
+- Smooth transitions
+- Include pacing cues
+- Emphasize key points
+- Build excitement and momentum
+
+Return as JSON."""
+
+INVESTOR_QA_USER_TEMPLATE: Final[str] = """Generate {num_questions} investor questions for this pitch:
+
+Business: {business_idea}
+
+{slides_summary}
+
+
+Mix of categories (financial, market, team, product, competition).
+Mix of difficulties (easy, medium, hard).
+Include suggested answers and key points.
+
+Return as JSON."""
+
+
+# ============================================================================
+# PITCH DECK AGENT
+# ============================================================================
+
+# Placeholder titles for slides the model leaves out, in SLIDE_FIELDS order
+MISSING_SLIDE_TITLES: Final[Tuple[str, ...]] = (
+    "Title", "Problem", "Solution", "Market", "Product", "Business Model",
+    "Traction", "Competition", "Team", "Financials", "The Ask", "Closing"
+)
+
+# Exact-match cache for Groq completions. Only low-temperature calls are
+# cached: at higher temperatures a repeat request is expected to come back
+# different, so serving the old answer would change behaviour.
+RESPONSE_CACHE_TTL = 1800
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
+class PitchDeckAgent:
+    """
+    PITCH DECK AGENT
+    
+    Creates professional, investor-ready pitch decks automatically with:
+    - Auto Slide Generator (12 slides)
+    - Voiceover Narration (ElevenLabs)
+    - AI Design Theme Selector
+    - Chart Auto-Builder (QuickChart)
+    - Script Writer for Demo Day
+    - Slide Export as PPTX/Video
+    - Investor Q&A Simulator
+    """
+    
+    def __init__(
+        self,
+        groq_api_key: Optional[str] = None,
+        elevenlabs_api_key: Optional[str] = None
+    ):
+        """Initialize the Pitch Deck Agent"""
+        
+        # Always use Groq client for Llama models
+        logger.info("Initializing PitchDeckAgent with Groq client")
+        self.groq = GroqClient(groq_api_key)
+        self.elevenlabs = ElevenLabsClient(elevenlabs_api_key)
+        self.quickchart = QuickChartClient()
+        self._response_cache = TTLCache(maxsize=256, ttl=RESPONSE_CACHE_TTL)
+        
+        logger.info("Pitch Deck Agent initialized successfully")
+    
+    async def aclose(self):
+        """Release the Groq client's HTTP session"""
+        await self.groq.close()
+    
+    async def _cached_generate(
+        self,
+        *,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        temperature: float = 0.7,
+        json_mode: bool = False,
+        max_tokens: int = 4000,
+        ttl: float = RESPONSE_CACHE_TTL,
+        json_schema: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """groq.generate with a response cache for deterministic-enough calls"""
+        
+        if temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return await self.groq.generate(
+                prompt=prompt,
+                system_prompt=system_prompt,
+                temperature=temperature,
+                json_mode=json_mode,
+                max_tokens=max_tokens,
+                json_schema=json_schema
+            )
+        
+        cache_key = hashlib.sha256(orjson.dumps({
+            "model": self.groq.model,
+            "prompt": prompt,
+            "system_prompt": system_prompt,
+            "temperature": temperature,
+            "json_mode": json_mode,
+            "max_tokens": max_tokens,
+            "json_schema": json_schema["name"] if json_schema is not None else ""
+        }, option=orjson.OPT_SORT_KEYS)).hexdigest()
+        
+        cached = self._response_cache.get(cache_key)
+        if cached is not None:
+            logger.info("Groq response cache hit")
+            return cached
+        
+        response = await self.groq.generate(
+            prompt=prompt,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            json_mode=json_mode,
+            max_tokens=max_tokens,
+            json_schema=json_schema
+        )
+        self._response_cache.set(cache_key, response, ttl)
+        return response
+    
+    # ========================================================================
+    # MODULE 1: AUTO SLIDE GENERATOR
+    # ========================================================================
+    
+    async def generate_slides(
+        self,
+        business_idea: str,
+        business_name: str = "",
+        target_market: str = "",
+        funding_ask: float = 0
+    ) -> PitchDeckSlides:
+        """Generate structured slide content for the pitch deck.
 
-Requirements:
-- Follow exactly the 12-slide structure defined in the system prompt.
-- Each slide must have a clear, specific title.
-- Each slide's "content" must be a list of 36 short, punchy bullet points.
-- Make the content concrete, investor-focused, and easy to present.
-- Where possible, include simple numbers or examples instead of vague claims.
+        This uses the LLM to create 12 slides with clear titles and
+        30 concise, investor-focused bullet points per slide.
+        """
+        
+        system_prompt = SLIDES_SYSTEM_PROMPT
 
-Return ONLY valid JSON matching the specified schema."""
+        user_prompt = self._slides_user_prompt(business_idea, business_name, target_market, funding_ask)
 
         try:
-            response = await self.groq.generate(
+            response = await self._cached_generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 temperature=0.6,
                 json_mode=True,
-                max_tokens=4000
+                max_tokens=4000,
+                json_schema=_SLIDES_SCHEMA
             )
 
-            data = json.loads(response)
+            data = orjson.loads(response)
             slides_data = data.get("slides", [])
 
             # Parse slides into structured format
             slides_dict: Dict[int, SlideContent] = {}
-            for slide in slides_data:
-                slides_dict[slide["slide_number"]] = SlideContent(
-                    slide_number=slide["slide_number"],
-                    title=slide["title"],
-                    content=slide["content"],
-                    notes=slide.get("notes", "")
-                )
+            parsed_slides = _validate_response(_SLIDES_ADAPTER, slides_data)
+            if parsed_slides is not None:
+                for slide in parsed_slides:
+                    slides_dict[slide.slide_number] = slide
+            else:
+                for slide in slides_data:
+                    slides_dict[slide["slide_number"]] = SlideContent(
+                        slide_number=slide["slide_number"],
+                        title=slide["title"],
+                        content=slide["content"],
+                        notes=slide.get("notes", "")
+                    )
 
             # Ensure title slide is always customized with business name & idea
             title_slide = slides_dict.get(1)
             if not title_slide:
                 # Create a title slide if the model failed to return one
-                tagline = business_idea.split(".\n")[0].split(".")[0].strip()
-                if not tagline:
-                    tagline = business_idea[:120].strip()
-                slides_dict[1] = SlideContent(
-                    slide_number=1,
-                    title=business_name or "Your Company",
-                    content=[tagline] if tagline else ["AI-powered startup"],
-                    notes="Auto-generated title slide based on business idea."
-                )
+                slides_dict[1] = self._fallback_title_slide(business_idea, business_name)
             else:
-                # Inject business name into the title if missing
-                if business_name and business_name not in title_slide.title:
-                    title_slide.title = business_name
-                # Ensure first bullet acts as a tagline based on the idea
-                if not title_slide.content:
-                    tagline = business_idea.split(".\n")[0].split(".")[0].strip()
-                    if not tagline:
-                        tagline = business_idea[:120].strip()
-                    title_slide.content = [tagline] if tagline else ["AI-powered startup"]
-                slides_dict[1] = title_slide
-
-            return PitchDeckSlides(
-                title_slide=slides_dict.get(1, self._default_slide(1, "Title")),
-                problem_slide=slides_dict.get(2, self._default_slide(2, "Problem")),
-                solution_slide=slides_dict.get(3, self._default_slide(3, "Solution")),
-                market_slide=slides_dict.get(4, self._default_slide(4, "Market")),
-                product_slide=slides_dict.get(5, self._default_slide(5, "Product")),
-                business_model_slide=slides_dict.get(6, self._default_slide(6, "Business Model")),
-                traction_slide=slides_dict.get(7, self._default_slide(7, "Traction")),
-                competition_slide=slides_dict.get(8, self._default_slide(8, "Competition")),
-                team_slide=slides_dict.get(9, self._default_slide(9, "Team")),
-                financials_slide=slides_dict.get(10, self._default_slide(10, "Financials")),
-                ask_slide=slides_dict.get(11, self._default_slide(11, "The Ask")),
-                closing_slide=slides_dict.get(12, self._default_slide(12, "Closing"))
-            )
+                slides_dict[1] = self._customize_title_slide(title_slide, business_idea, business_name)
+
+            # Placeholders only for slides the model left out
+            return PitchDeckSlides(**{
+                name: slides_dict.get(number) or self._default_slide(number, title)
+                for number, (name, title) in enumerate(zip(SLIDE_FIELDS, MISSING_SLIDE_TITLES), start=1)
+            })
         
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             logger.error(f"Error generating slides: {str(e)}")
             return self._get_default_slides()
     
+    async def stream_slides(
+        self,
+        business_idea: str,
+        business_name: str = "",
+        target_market: str = "",
+        funding_ask: float = 0
+    ) -> AsyncIterator[SlideContent]:
+        """
+        Streaming variant of generate_slides: yields each slide as soon as the
+        model has finished writing it, so a UI can render the deck progressively.
+        
+        Slides the model left out follow as placeholders once the stream ends,
+        as in generate_slides. Raises ValueError if no slide could be parsed.
+        """
+        
+        user_prompt = self._slides_user_prompt(business_idea, business_name, target_market, funding_ask)
+        scanner = JSONArrayItemScanner()
+        seen: Set[int] = set()
+        
+        async for piece in self.groq.generate_stream(
+            prompt=user_prompt,
+            system_prompt=SLIDES_SYSTEM_PROMPT,
+            temperature=0.6,
+            json_mode=True,
+            max_tokens=4000,
+            json_schema=_SLIDES_SCHEMA
+        ):
+            for slide in scanner.feed(piece):
+                slide_content = SlideContent(
+                    slide_number=slide.get("slide_number", 0),
+                    title=slide.get("title", ""),
+                    content=slide.get("content", []),
+                    notes=slide.get("notes", "")
+                )
+                if slide_content.slide_number == 1:
+                    slide_content = self._customize_title_slide(slide_content, business_idea, business_name)
+                seen.add(slide_content.slide_number)
+                yield slide_content
+        
+        if not seen:
+            raise ValueError("No slides could be parsed from the model response")
+        
+        for number, title in enumerate(MISSING_SLIDE_TITLES, start=1):
+            if number in seen:
+                continue
+            if number == 1:
+                yield self._fallback_title_slide(business_idea, business_name)
+            else:
+                yield self._default_slide(number, title)
+    
+    def _fallback_title_slide(self, business_idea: str, business_name: str) -> SlideContent:
+        """Title slide built from the business name and idea"""
+        tagline = self._tagline_from_idea(business_idea)
+        return SlideContent(
+            slide_number=1,
+            title=business_name or "Your Company",
+            content=[tagline] if tagline else ["AI-powered startup"],
+            notes="Auto-generated title slide based on business idea."
+        )
+    
+    @staticmethod
+    def _tagline_from_idea(business_idea: str) -> str:
+        """First sentence of the idea, used as a fallback tagline"""
+        tagline = business_idea.split(".\n")[0].split(".")[0].strip()
+        if not tagline:
+            tagline = business_idea[:120].strip()
+        return tagline
+    
+    def _customize_title_slide(
+        self,
+        title_slide: SlideContent,
+        business_idea: str,
+        business_name: str
+    ) -> SlideContent:
+        """Inject the business name and a tagline into the model's title slide"""
+        # Inject business name into the title if missing
+        if business_name and business_name not in title_slide.title:
+            title_slide.title = business_name
+        # Ensure first bullet acts as a tagline based on the idea
+        if not title_slide.content:
+            tagline = self._tagline_from_idea(business_idea)
+            title_slide.content = [tagline] if tagline else ["AI-powered startup"]
+        return title_slide
+    
+    def _slides_user_prompt(
+        self,
+        business_idea: str,
+        business_name: str,
+        target_market: str,
+        funding_ask: float
+    ) -> str:
+        """User prompt for slide generation"""
+        
+        funding_ask_str = f"${funding_ask:,.0f}" if funding_ask and funding_ask > 0 else "Not specified"
+
+        return SLIDES_USER_TEMPLATE.format_map({
+            "business_idea": business_idea,
+            "business_name": business_name or "Not specified",
+            "target_market": target_market or "Not specified",
+            "funding_ask": funding_ask_str
+        })
+    
     # ========================================================================
     # MODULE 2: VOICEOVER NARRATION
     # ========================================================================
@@ -634,66 +1238,83 @@ Return ONLY valid JSON matching the specified schema."""
         Add AI voiceover to slides using ElevenLabs
         """
         
-        voiceovers = []
-        all_slides = [
-            slides.title_slide, slides.problem_slide, slides.solution_slide,
-            slides.market_slide, slides.product_slide, slides.business_model_slide,
-            slides.traction_slide, slides.competition_slide, slides.team_slide,
-            slides.financials_slide, slides.ask_slide, slides.closing_slide
-        ]
+        all_slides = slides.all_slides()
         
-        for slide in all_slides:
-            # Generate narration script
-            narration_text = await self._generate_narration_script(slide)
-            
-            # Generate audio
-            audio_bytes = await self.elevenlabs.generate_speech(narration_text)
-            
-            # Calculate duration (rough estimate: 150 words per minute)
-            word_count = len(narration_text.split())
-            duration = calculate_slide_duration(word_count)
-            
-            voiceover = VoiceoverNarration(
-                slide_number=slide.slide_number,
-                text=narration_text,
-                audio_url=None,  # Would save to storage and return URL
-                duration_seconds=duration
-            )
-            
-            voiceovers.append(voiceover)
+        # One request writes every script; audio is then synthesized per
+        # slide concurrently
+        scripts = await self._generate_narration_scripts(all_slides)
+        
+        return list(await asyncio.gather(*(
+            self._generate_voiceover(slide, scripts[slide.slide_number]) for slide in all_slides
+        )))
+    
+    async def _generate_voiceover(self, slide: SlideContent, narration_text: str) -> VoiceoverNarration:
+        """Synthesize the narration for a single slide"""
         
-        return voiceovers
+        # Generate audio
+        audio_bytes = await self.elevenlabs.generate_speech(narration_text)
+        
+        # Calculate duration (rough estimate: 150 words per minute)
+        word_count = len(narration_text.split())
+        duration = calculate_slide_duration(word_count)
+        
+        return VoiceoverNarration(
+            slide_number=slide.slide_number,
+            text=narration_text,
+            audio_url=None,  # Would save to storage and return URL
+            duration_seconds=duration
+        )
     
     async def _generate_narration_script(self, slide: SlideContent) -> str:
         """Generate natural narration script for a slide"""
+        return (await self._generate_narration_scripts([slide]))[slide.slide_number]
+    
+    async def _generate_narration_scripts(self, slides: List[SlideContent]) -> Dict[int, str]:
+        """
+        Generate narration scripts for several slides in a single request,
+        keyed by slide number. Slides the model skips get a script read
+        straight off the bullets.
+        """
         
-        system_prompt = """You are a professional pitch coach. 
-Convert slide bullet points into a natural, engaging narration script.
-Keep it conversational, confident, and concise (30-60 seconds per slide)."""
+        system_prompt = NARRATION_SYSTEM_PROMPT
+        
+        user_prompt = NARRATION_USER_TEMPLATE.format_map({
+            "slides": "\n\n".join(
+                NARRATION_SLIDE_TEMPLATE.format_map({
+                    "slide_number": slide.slide_number,
+                    "title": slide.title,
+                    "content": "\n".join(f"- {item}" for item in slide.content),
+                    "notes": slide.notes
+                })
+                for slide in slides
+            )
+        })
         
-        user_prompt = f"""Create a narration script for this slide:
-
-TITLE: {slide.title}
-CONTENT:
-{chr(10).join(f"- {item}" for item in slide.content)}
-
-NOTES: {slide.notes}
-
-Write a natural, engaging script that sounds great when spoken aloud.
-Keep it to 30-60 seconds. Be confident and compelling."""
-
+        scripts: Dict[int, str] = {}
         try:
-            response = await self.groq.generate(
+            # A 30-60 second script is ~75-150 words (~200 tokens) per slide
+            response = await self._cached_generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 temperature=0.7,
-                max_tokens=500
+                json_mode=True,
+                max_tokens=min(250 * len(slides) + 100, 4000)
             )
-            return response.strip()
+            
+            data = orjson.loads(response)
+            for narration in data.get("narrations", []):
+                script = str(narration.get("script", "")).strip()
+                if script:
+                    scripts[int(narration.get("slide_number", 0))] = script
         
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             logger.error(f"Error generating narration: {str(e)}")
-            return f"{slide.title}. " + " ".join(slide.content)
+        
+        for slide in slides:
+            if slide.slide_number not in scripts:
+                scripts[slide.slide_number] = f"{slide.title}. " + " ".join(slide.content)
+        
+        return scripts
     
     # ========================================================================
     # MODULE 3: AI DESIGN THEME SELECTOR
@@ -708,40 +1329,28 @@ Keep it to 30-60 seconds. Be confident and compelling."""
         Create slide design based on brand tone (e.g., "Minimalist", "Techy")
         """
         
-        system_prompt = """You are a UI/UX designer specializing in pitch deck design.
-Select appropriate colors, fonts, and style for the given business.
-
-Return ONLY valid JSON:
-{
-  "name": "Theme Name",
-  "primary_color": "#HEX",
-  "secondary_color": "#HEX",
-  "accent_color": "#HEX",
-  "background_color": "#HEX",
-  "text_color": "#HEX",
-  "font_family": "Font Name",
-  "style_description": "Description of the design style"
-}"""
-
-        user_prompt = f"""Select a design theme for this pitch deck:
-
-BUSINESS IDEA: {business_idea}
-BRAND TONE: {brand_tone}
+        system_prompt = DESIGN_THEME_SYSTEM_PROMPT
 
-Choose colors and fonts that match the business and brand tone.
-Popular tones: Minimalist, Techy, Bold, Corporate, Creative, Modern.
-Return as JSON."""
+        user_prompt = DESIGN_THEME_USER_TEMPLATE.format_map({
+            "business_idea": business_idea,
+            "brand_tone": brand_tone
+        })
 
         try:
-            response = await self.groq.generate(
+            response = await self._cached_generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 temperature=0.5,
                 json_mode=True,
-                max_tokens=500
+                max_tokens=300,
+                json_schema=_DESIGN_THEME_SCHEMA
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
+            
+            theme = _validate_response(_DESIGN_THEME_ADAPTER, data)
+            if theme is not None:
+                return theme
             
             return DesignTheme(
                 name=data.get("name", "Professional"),
@@ -754,7 +1363,7 @@ Return as JSON."""
                 style_description=data.get("style_description", "Clean and professional")
             )
         
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             logger.error(f"Error selecting design theme: {str(e)}")
             return self._get_default_theme()
     
@@ -771,18 +1380,21 @@ Return as JSON."""
         Add charts for market size, growth, and revenue forecasts using QuickChart
         """
         
-        # Generate market size chart for Market slide
-        market_chart_data = await self._generate_market_chart_data(business_idea)
+        market_chart_data, revenue_chart_data, traction_chart_data = await asyncio.gather(
+            self._generate_market_chart_data(business_idea),
+            self._generate_revenue_chart_data(business_idea),
+            self._generate_traction_chart_data(business_idea)
+        )
+        
+        # Market size chart for Market slide
         slides.market_slide.chart_data = market_chart_data
         slides.market_slide.chart_type = "bar"
         
-        # Generate revenue forecast chart for Financials slide
-        revenue_chart_data = await self._generate_revenue_chart_data(business_idea)
+        # Revenue forecast chart for Financials slide
         slides.financials_slide.chart_data = revenue_chart_data
         slides.financials_slide.chart_type = "line"
         
-        # Generate traction chart for Traction slide
-        traction_chart_data = await self._generate_traction_chart_data(business_idea)
+        # Traction chart for Traction slide
         slides.traction_slide.chart_data = traction_chart_data
         slides.traction_slide.chart_type = "line"
         
@@ -791,36 +1403,21 @@ Return as JSON."""
     async def _generate_market_chart_data(self, business_idea: str) -> Dict[str, Any]:
         """Generate market size chart data"""
         
-        system_prompt = """You are a market research analyst.
-Estimate TAM (Total Addressable Market), SAM (Serviceable Addressable Market), 
-and SOM (Serviceable Obtainable Market) for the given business.
-
-Return ONLY valid JSON:
-{
-  "labels": ["TAM", "SAM", "SOM"],
-  "datasets": [{
-    "label": "Market Size ($B)",
-    "data": [100, 20, 2],
-    "backgroundColor": ["#3b82f6", "#60a5fa", "#93c5fd"]
-  }]
-}"""
-
-        user_prompt = f"""Estimate market sizes for: {business_idea}
+        system_prompt = MARKET_CHART_SYSTEM_PROMPT
 
-Provide realistic TAM, SAM, SOM estimates in billions of dollars.
-Return as JSON for a bar chart."""
+        user_prompt = MARKET_CHART_USER_TEMPLATE.format_map({"business_idea": business_idea})
 
         try:
-            response = await self.groq.generate(
+            response = await self._cached_generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
-                temperature=0.4,
+                temperature=0.3,
                 json_mode=True,
-                max_tokens=500
+                max_tokens=300
             )
-            return json.loads(response)
+            return orjson.loads(response)
         
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             logger.error(f"Error generating market chart: {str(e)}")
             return {
                 "labels": ["TAM", "SAM", "SOM"],
@@ -866,75 +1463,38 @@ Return as JSON for a bar chart."""
     async def generate_demo_script(
         self,
         slides: PitchDeckSlides,
-        target_duration_minutes: float = 5.0
+        target_duration_minutes: float = 5.0,
+        slides_summary: Optional[str] = None
     ) -> DemoScript:
         """
         Generate a 2-minute pitch script with pacing cues
         """
         
-        system_prompt = """You are a pitch coach who has trained hundreds of founders for Demo Day.
-Create a compelling, well-paced pitch script that flows naturally.
-
-Include:
-- Natural transitions between slides
-- Pacing cues (PAUSE, EMPHASIZE, SLOW DOWN, etc.)
-- Time allocation per slide
-- Key emphasis points
-
-Return ONLY valid JSON:
-{
-  "full_script": "Complete script text...",
-  "slide_scripts": [
-    {
-      "slide_number": 1,
-      "script": "Script for this slide...",
-      "duration_seconds": 20,
-      "pacing_cues": ["PAUSE after company name", "EMPHASIZE tagline"]
-    }
-  ],
-  "total_duration_minutes": 5.0,
-  "pacing_cues": ["Overall pacing tip 1", "Overall pacing tip 2"],
-  "emphasis_points": ["Key point to emphasize 1", "Key point to emphasize 2"]
-}"""
+        system_prompt = DEMO_SCRIPT_SYSTEM_PROMPT
 
-        # Collect all slide content
-        all_slides = [
-            slides.title_slide, slides.problem_slide, slides.solution_slide,
-            slides.market_slide, slides.product_slide, slides.business_model_slide,
-            slides.traction_slide, slides.competition_slide, slides.team_slide,
-            slides.financials_slide, slides.ask_slide, slides.closing_slide
-        ]
-        
-        slides_summary = "\n\n".join([
-            f"SLIDE {slide.slide_number}: {slide.title}\n" + 
-            "\n".join(f"- {item}" for item in slide.content)
-            for slide in all_slides
-        ])
+        if slides_summary is None:
+            slides_summary = self._render_slides_summary(slides)
         
-        user_prompt = f"""Create a {target_duration_minutes}-minute Demo Day pitch script for these slides:
-
-{slides_summary}
-
-Requirements:
-- Total duration: {target_duration_minutes} minutes
-- Natural, conversational tone
-- Smooth transitions
-- Include pacing cues
-- Emphasize key points
-- Build excitement and momentum
-
-Return as JSON."""
+        user_prompt = DEMO_SCRIPT_USER_TEMPLATE.format_map({
+            "target_duration_minutes": target_duration_minutes,
+            "slides_summary": slides_summary
+        })
 
         try:
-            response = await self.groq.generate(
+            response = await self._cached_generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 temperature=0.7,
                 json_mode=True,
-                max_tokens=3000
+                max_tokens=3000,
+                json_schema=_DEMO_SCRIPT_SCHEMA
             )
             
-            data = json.loads(response)
+            data = orjson.loads(response)
+            
+            demo_script = _validate_response(_DEMO_SCRIPT_ADAPTER, data)
+            if demo_script is not None:
+                return demo_script
             
             return DemoScript(
                 full_script=data.get("full_script", ""),
@@ -944,7 +1504,7 @@ Return as JSON."""
                 emphasis_points=data.get("emphasis_points", [])
             )
         
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             logger.error(f"Error generating demo script: {str(e)}")
             return self._get_default_demo_script()
     
@@ -956,62 +1516,44 @@ Return as JSON."""
         self,
         business_idea: str,
         slides: PitchDeckSlides,
-        num_questions: int = 10
+        num_questions: int = 10,
+        slides_summary: Optional[str] = None
     ) -> List[InvestorQuestion]:
         """
         Let users practice answering questions via AI chat using AI reasoning
         """
         
-        system_prompt = """You are a veteran venture capitalist conducting due diligence.
-Generate tough but fair questions that investors would ask after a pitch.
-
-Categories: financial, market, team, product, competition
-Difficulty: easy, medium, hard
-
-Return ONLY valid JSON:
-{
-  "questions": [
-    {
-      "question": "The question text",
-      "category": "financial",
-      "difficulty": "medium",
-      "suggested_answer": "A strong answer to this question",
-      "key_points": ["point1", "point2", "point3"]
-    }
-  ]
-}"""
-
-        slides_context = f"""
-Business: {business_idea}
-Problem: {', '.join(slides.problem_slide.content)}
-Solution: {', '.join(slides.solution_slide.content)}
-Market: {', '.join(slides.market_slide.content)}
-Team: {', '.join(slides.team_slide.content)}
-"""
-
-        user_prompt = f"""Generate {num_questions} investor questions for this pitch:
+        system_prompt = INVESTOR_QA_SYSTEM_PROMPT
 
-{slides_context}
-
-Mix of categories (financial, market, team, product, competition).
-Mix of difficulties (easy, medium, hard).
-Include suggested answers and key points.
-
-Return as JSON."""
+        if slides_summary is None:
+            slides_summary = self._render_slides_summary(slides)
+        
+        user_prompt = INVESTOR_QA_USER_TEMPLATE.format_map({
+            "num_questions": num_questions,
+            "business_idea": business_idea,
+            "slides_summary": slides_summary
+        })
 
         try:
             # Use Llama model for reasoning
-            response = await self.groq.generate(
+            response = await self._cached_generate(
                 prompt=user_prompt,
                 system_prompt=system_prompt,
                 temperature=0.6,
                 json_mode=True,
-                max_tokens=3000,
+                # Scales with the caller-chosen question count (3000 for the
+                # default 10) so long lists aren't cut off mid-JSON
+                max_tokens=min(250 * num_questions + 500, 4000),
+                json_schema=_INVESTOR_QA_SCHEMA
             )
             
-            data = json.loads(response)
-            questions = []
+            data = orjson.loads(response)
+            
+            questions = _validate_response(_INVESTOR_QA_ADAPTER, data.get("questions", []))
+            if questions is not None:
+                return questions
             
+            questions = []
             for q_data in data.get("questions", []):
                 questions.append(InvestorQuestion(
                     question=q_data.get("question", ""),
@@ -1023,7 +1565,7 @@ Return as JSON."""
             
             return questions
         
-        except Exception as e:
+        except RECOVERABLE_ERRORS as e:
             logger.error(f"Error generating investor Q&A: {str(e)}")
             return self._get_default_qa()
     
@@ -1049,45 +1591,47 @@ Return as JSON."""
         deck_id = str(uuid.uuid4())
         logger.info(f"Creating pitch deck {deck_id} for: {business_name or business_idea[:50]}")
         
-        # Step 1: Generate slides
-        logger.info("Generating slides...")
-        slides = await self.generate_slides(
-            business_idea=business_idea,
-            business_name=business_name,
-            target_market=target_market,
-            funding_ask=funding_ask
+        # Steps 1-2: Slides and design theme only need the request inputs
+        logger.info("Generating slides and selecting design theme...")
+        slides, design_theme = await asyncio.gather(
+            self.generate_slides(
+                business_idea=business_idea,
+                business_name=business_name,
+                target_market=target_market,
+                funding_ask=funding_ask
+            ),
+            self.select_design_theme(
+                business_idea=business_idea,
+                brand_tone=brand_tone
+            )
         )
         
-        # Step 2: Select design theme
-        logger.info("Selecting design theme...")
-        design_theme = await self.select_design_theme(
-            business_idea=business_idea,
-            brand_tone=brand_tone
-        )
+        # Steps 3-6 all build on the slides but not on each other. Charts only
+        # set chart fields, which the other steps don't read.
+        logger.info("Adding charts, voiceovers, demo script and investor Q&A...")
+        
+        async def _no_voiceovers() -> List[VoiceoverNarration]:
+            return []
+        
+        async def _no_qa() -> List[InvestorQuestion]:
+            return []
+        
+        async def _default_demo_script() -> DemoScript:
+            return self._get_default_demo_script()
         
-        # Step 3: Add charts
-        logger.info("Adding charts...")
-        slides = await self.add_charts_to_slides(slides, business_idea)
-        
-        # Step 4: Generate voiceovers (optional)
-        voiceovers = []
-        if include_voiceover:
-            logger.info("Generating voiceovers...")
-            voiceovers = await self.generate_voiceovers(slides)
-        
-        # Step 5: Generate demo script (optional)
-        demo_script = None
-        if include_demo_script:
-            logger.info("Generating demo script...")
-            demo_script = await self.generate_demo_script(slides)
-        else:
-            demo_script = self._get_default_demo_script()
-        
-        # Step 6: Generate investor Q&A (optional)
-        investor_qa = []
-        if include_qa:
-            logger.info("Generating investor Q&A...")
-            investor_qa = await self.generate_investor_qa(business_idea, slides)
+        # Demo script and Q&A both work from the same slide text; render it once
+        slides_summary = self._render_slides_summary(slides)
+        
+        slides, voiceovers, demo_script, investor_qa = await asyncio.gather(
+            # Step 3: Add charts
+            self.add_charts_to_slides(slides, business_idea),
+            # Step 4: Generate voiceovers (optional)
+            self.generate_voiceovers(slides) if include_voiceover else _no_voiceovers(),
+            # Step 5: Generate demo script (optional)
+            self.generate_demo_script(slides, slides_summary=slides_summary) if include_demo_script else _default_demo_script(),
+            # Step 6: Generate investor Q&A (optional)
+            self.generate_investor_qa(business_idea, slides, slides_summary=slides_summary) if include_qa else _no_qa()
+        )
         
         # Create response
         response = PitchDeckResponse(
@@ -1119,6 +1663,16 @@ Return as JSON."""
     # HELPER METHODS
     # ========================================================================
     
+    @staticmethod
+    def _render_slides_summary(slides: PitchDeckSlides) -> str:
+        """Plain-text outline of every slide's title and bullets, used as prompt context"""
+        all_slides = slides.all_slides()
+        return "\n\n".join([
+            f"SLIDE {slide.slide_number}: {slide.title}\n" + 
+            "\n".join(f"- {item}" for item in slide.content)
+            for slide in all_slides
+        ])
+    
     def _default_slide(self, slide_number: int, title: str) -> SlideContent:
         """Create a default slide"""
         return SlideContent(
@@ -1128,6 +1682,11 @@ Return as JSON."""
             notes="Notes for " + title
         )
     
+    # The _get_default_* builders return fresh objects on every call rather
+    # than cached instances: callers mutate what they get back (charts are
+    # attached to slides, the title slide is customised), so a shared default
+    # would leak one deck's edits into the next. They only run on failure.
+    
     def _get_default_slides(self) -> PitchDeckSlides:
         """Get default slides structure"""
         return PitchDeckSlides(
@@ -1197,67 +1756,95 @@ Return as JSON."""
             raise ImportError("python-pptx is required for PPTX export. Install with: pip install python-pptx")
         
         try:
-            # Create presentation
-            prs = Presentation()
-            prs.slide_width = Inches(10)
-            prs.slide_height = Inches(7.5)
-            
-            # Parse colors from hex
-            primary_color = self._hex_to_rgb(deck.design_theme.primary_color)
-            secondary_color = self._hex_to_rgb(deck.design_theme.secondary_color)
-            accent_color = self._hex_to_rgb(deck.design_theme.accent_color)
-            text_color = self._hex_to_rgb(deck.design_theme.text_color)
-            
-            # Get all slides
-            all_slides = [
-                deck.slides.title_slide,
-                deck.slides.problem_slide,
-                deck.slides.solution_slide,
-                deck.slides.market_slide,
-                deck.slides.product_slide,
-                deck.slides.business_model_slide,
-                deck.slides.traction_slide,
-                deck.slides.competition_slide,
-                deck.slides.team_slide,
-                deck.slides.financials_slide,
-                deck.slides.ask_slide,
-                deck.slides.closing_slide
-            ]
-            
-            # Create each slide
-            for slide_content in all_slides:
-                if slide_content.slide_number == 1:
-                    # Title slide
-                    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-                    self._create_title_slide(slide, deck, primary_color, text_color)
-                else:
-                    # Content slide
-                    slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
-                    self._create_content_slide(
-                        slide, 
-                        slide_content, 
-                        primary_color, 
-                        secondary_color,
-                        accent_color,
-                        text_color
-                    )
-                    
-                    # Add chart if available
-                    if slide_content.chart_data and slide_content.chart_type:
-                        await self._add_chart_to_slide(slide, slide_content)
-            
-            # Save presentation to bytes in memory
-            buffer = BytesIO()
-            prs.save(buffer)
-            buffer.seek(0)
+            # Chart images are the only network I/O; fetch them concurrently,
+            # then build the file in a worker thread so python-pptx's
+            # synchronous XML work doesn't block the event loop
+            chart_images = await self._fetch_chart_images(deck)
+            pptx_bytes = await asyncio.to_thread(self._build_pptx, deck, chart_images)
             logger.info("PPTX exported successfully")
             
-            return buffer.getvalue()
+            return pptx_bytes
         
         except Exception as e:
             logger.error(f"Error exporting to PPTX: {str(e)}")
             raise
     
+    async def _fetch_chart_images(self, deck: PitchDeckResponse) -> Dict[int, bytes]:
+        """Render every slide chart via QuickChart, keyed by slide number"""
+        
+        all_slides = deck.slides.all_slides()
+        # The title slide has its own layout and never shows a chart
+        chart_slides = [
+            slide_content for slide_content in all_slides
+            if slide_content.slide_number != 1 and slide_content.chart_data and slide_content.chart_type
+        ]
+        
+        async def _fetch(slide_content: SlideContent) -> Optional[bytes]:
+            try:
+                return await self.quickchart.generate_chart_image(
+                    chart_type=slide_content.chart_type,
+                    data=slide_content.chart_data,
+                    width=600,
+                    height=400
+                )
+            except Exception as e:
+                logger.warning(f"Could not render chart for slide {slide_content.slide_number}: {str(e)}")
+                return None
+        
+        images = await asyncio.gather(*(_fetch(slide_content) for slide_content in chart_slides))
+        return {
+            slide_content.slide_number: image
+            for slide_content, image in zip(chart_slides, images)
+            if image
+        }
+    
+    def _build_pptx(self, deck: PitchDeckResponse, chart_images: Dict[int, bytes]) -> bytes:
+        """Build the presentation synchronously; runs off the event loop"""
+        
+        # Create presentation from the cached blank template
+        prs = Presentation(BytesIO(_presentation_template()))
+        
+        # Parse colors from hex
+        theme = deck.design_theme
+        primary_color, secondary_color, accent_color, text_color = (
+            self._hex_to_rgb(color) for color in (
+                theme.primary_color, theme.secondary_color, theme.accent_color, theme.text_color
+            )
+        )
+        
+        # Get all slides
+        all_slides = deck.slides.all_slides()
+        
+        # Create each slide
+        for slide_content in all_slides:
+            if slide_content.slide_number == 1:
+                # Title slide
+                slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+                self._create_title_slide(slide, deck, primary_color, text_color)
+            else:
+                # Content slide
+                slide = prs.slides.add_slide(prs.slide_layouts[6])  # Blank layout
+                self._create_content_slide(
+                    slide, 
+                    slide_content, 
+                    primary_color, 
+                    secondary_color,
+                    accent_color,
+                    text_color
+                )
+                
+                # Add chart if one was rendered
+                chart_image = chart_images.get(slide_content.slide_number)
+                if chart_image:
+                    self._add_chart_to_slide(slide, chart_image)
+        
+        # Save presentation to bytes in memory
+        buffer = BytesIO()
+        prs.save(buffer)
+        buffer.seek(0)
+        
+        return buffer.getvalue()
+    
     def _create_title_slide(
         self,
         slide,
@@ -1287,7 +1874,7 @@ Return as JSON."""
         title_para = title_frame.paragraphs[0]
         title_para.font.size = Pt(60)
         title_para.font.bold = True
-        title_para.font.color.rgb = RGBColor(255, 255, 255)
+        title_para.font.color.rgb = WHITE
         title_para.alignment = PP_ALIGN.CENTER
         
         # Add tagline
@@ -1299,7 +1886,7 @@ Return as JSON."""
         tagline_frame.text = deck.tagline
         tagline_para = tagline_frame.paragraphs[0]
         tagline_para.font.size = Pt(24)
-        tagline_para.font.color.rgb = RGBColor(255, 255, 255)
+        tagline_para.font.color.rgb = WHITE
         tagline_para.alignment = PP_ALIGN.CENTER
     
     def _create_content_slide(
@@ -1333,7 +1920,7 @@ Return as JSON."""
         title_para = title_frame.paragraphs[0]
         title_para.font.size = Pt(36)
         title_para.font.bold = True
-        title_para.font.color.rgb = RGBColor(255, 255, 255)
+        title_para.font.color.rgb = WHITE
         
         # Add content bullets
         content_box = slide.shapes.add_textbox(
@@ -1343,17 +1930,27 @@ Return as JSON."""
         content_frame = content_box.text_frame
         content_frame.word_wrap = True
         
-        for i, bullet_text in enumerate(slide_content.content):
-            if i > 0:
-                content_frame.add_paragraph()
-            
-            para = content_frame.paragraphs[i]
-            para.text = bullet_text
+        # Every bullet shares the same formatting: style the first paragraph
+        # once, then clone its <a:p> for the rest and append them to the text
+        # body in a single extend instead of one add_paragraph per bullet
+        bullets = slide_content.content
+        if bullets:
+            para = content_frame.paragraphs[0]
             para.level = 0
             para.font.size = Pt(20)
             para.font.color.rgb = text_color
             para.space_before = Pt(12)
             para.space_after = Pt(12)
+            
+            template = copy.deepcopy(para._p)
+            para._p.append_text(bullets[0])
+            
+            paragraphs = []
+            for bullet_text in bullets[1:]:
+                p = copy.deepcopy(template)
+                p.append_text(bullet_text)
+                paragraphs.append(p)
+            para._p.getparent().extend(paragraphs)
         
         # Add slide number
         slide_num_box = slide.shapes.add_textbox(
@@ -1367,57 +1964,62 @@ Return as JSON."""
         slide_num_para.font.color.rgb = text_color
         slide_num_para.alignment = PP_ALIGN.RIGHT
     
-    async def _add_chart_to_slide(self, slide, slide_content: SlideContent):
-        """Add chart image to slide"""
+    def _add_chart_to_slide(self, slide, chart_image: bytes):
+        """Add a rendered chart image to slide"""
         
         try:
-            # Generate chart image
-            chart_image = await self.quickchart.generate_chart_image(
-                chart_type=slide_content.chart_type,
-                data=slide_content.chart_data,
-                width=600,
-                height=400
+            # add_picture reads from a stream, so no temp file is needed
+            slide.shapes.add_picture(
+                BytesIO(chart_image),
+                Inches(5), Inches(2),
+                width=Inches(4), height=Inches(3)
             )
-            
-            if chart_image:
-                # Save to temporary file
-                temp_chart_path = f"temp_chart_{slide_content.slide_number}.png"
-                with open(temp_chart_path, 'wb') as f:
-                    f.write(chart_image)
-                
-                # Add to slide
-                slide.shapes.add_picture(
-                    temp_chart_path,
-                    Inches(5), Inches(2),
-                    width=Inches(4), height=Inches(3)
-                )
-                
-                # Clean up temp file
-                import os
-                os.remove(temp_chart_path)
         
         except Exception as e:
-            logger.warning(f"Could not add chart to slide {slide_content.slide_number}: {str(e)}")
+            logger.warning(f"Could not add chart to slide: {str(e)}")
     
-    def _hex_to_rgb(self, hex_color: str) -> RGBColor:
-        """Convert hex color to RGBColor"""
-        
-        hex_color = hex_color.lstrip('#')
+    @staticmethod
+    def _hex_to_rgb(hex_color: Any) -> RGBColor:
+        """Convert hex color to RGBColor, defaulting to blue if it can't be parsed"""
         
-        try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-            return RGBColor(r, g, b)
-        except:
-            # Default to blue if parsing fails
-            return RGBColor(37, 99, 235)
+        # Theme colors come from LLM JSON and may be null or a number; anything
+        # that isn't a string falls through to the default
+        return _parse_hex_color(hex_color if isinstance(hex_color, str) else "")
 
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+@lru_cache(maxsize=1)
+def _presentation_template() -> bytes:
+    """
+    Blank 10x7.5in presentation, saved once and reopened from memory per
+    export instead of re-reading python-pptx's default template from disk
+    """
+    prs = Presentation()
+    prs.slide_width = Inches(10)
+    prs.slide_height = Inches(7.5)
+    buffer = BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+@lru_cache(maxsize=64)
+def _parse_hex_color(hex_color: str) -> RGBColor:
+    """Parse "#rrggbb" into an RGBColor (cached; decks reuse a few theme colors)"""
+    hex_color = hex_color.lstrip('#')
+    
+    try:
+        r = int(hex_color[0:2], 16)
+        g = int(hex_color[2:4], 16)
+        b = int(hex_color[4:6], 16)
+        return RGBColor(r, g, b)
+    except ValueError:
+        # Default to blue if parsing fails
+        return RGBColor(37, 99, 235)
+
+
 def format_currency(amount: float) -> str:
     """Format currency with commas and dollar sign"""
     return f"${amount:,.0f}"
@@ -1471,12 +2073,7 @@ async def main():
         print(f"Colors: {deck.design_theme.primary_color}, {deck.design_theme.secondary_color}")
         
         print(f"\n📊 SLIDES GENERATED:")
-        all_slides = [
-            deck.slides.title_slide, deck.slides.problem_slide, deck.slides.solution_slide,
-            deck.slides.market_slide, deck.slides.product_slide, deck.slides.business_model_slide,
-            deck.slides.traction_slide, deck.slides.competition_slide, deck.slides.team_slide,
-            deck.slides.financials_slide, deck.slides.ask_slide, deck.slides.closing_slide
-        ]
+        all_slides = deck.slides.all_slides()
         
         for slide in all_slides:
             print(f"\n  Slide {slide.slide_number}: {slide.title}")
@@ -0,0 +1,149 @@
+"""
+Tests for the hand-rolled HS256 JWT encoder/verifier in auth.py
+"""
+import os
+import sys
+import time
+
+import jwt
+import pytest
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+os.environ.setdefault("JWT_SECRET", "test-secret-for-jwt-unit-tests")
+
+import auth
+from auth import _b64encode, _decode_jwt, _encode_jwt
+
+
+def _pyjwt_token(payload, algorithm="HS256", key=None, headers=None):
+    return jwt.encode(payload, key or auth.JWT_SECRET, algorithm=algorithm, headers=headers)
+
+
+def _flip_char(segment: str, index: int) -> str:
+    """Swap one base64url character for a different one"""
+    replacement = "A" if segment[index] != "A" else "B"
+    return segment[:index] + replacement + segment[index + 1:]
+
+
+# ============================================================================
+# ROUND TRIP
+# ============================================================================
+
+def test_own_token_round_trips():
+    payload = {"user_id": "u1", "email": "a@b.c", "exp": int(time.time()) + 60}
+    assert _decode_jwt(_encode_jwt(payload)) == payload
+
+
+def test_pyjwt_accepts_our_tokens():
+    payload = {"user_id": "u1", "exp": int(time.time()) + 60}
+    token = _encode_jwt(payload)
+    assert jwt.decode(token, auth.JWT_SECRET, algorithms=["HS256"]) == payload
+
+
+def test_we_accept_pyjwt_tokens():
+    payload = {"user_id": "u1", "email": "a@b.c", "exp": int(time.time()) + 60}
+    assert _decode_jwt(_pyjwt_token(payload)) == payload
+
+
+def test_access_token_verifies():
+    token = auth.create_access_token("u1", "a@b.c")
+    payload = auth.verify_token(token)
+    assert payload["user_id"] == "u1"
+    assert payload["email"] == "a@b.c"
+
+
+# ============================================================================
+# REJECTIONS
+# ============================================================================
+
+def test_tampered_signature_rejected():
+    header, payload, signature = _encode_jwt({"user_id": "u1"}).split(".")
+    token = ".".join((header, payload, _flip_char(signature, 10)))
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(token)
+
+
+def test_tampered_payload_rejected():
+    header, _, signature = _encode_jwt({"user_id": "u1"}).split(".")
+    forged = _b64encode(b'{"user_id":"admin"}').decode()
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(".".join((header, forged, signature)))
+
+
+def test_wrong_secret_rejected():
+    token = _pyjwt_token({"user_id": "u1"}, key="some-other-secret")
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(token)
+
+
+@pytest.mark.parametrize("alg", ["none", "HS384", "RS256"])
+def test_wrong_alg_header_rejected(alg):
+    # Keep a well-formed, correctly sized signature so only the header is wrong
+    _, payload, signature = _encode_jwt({"user_id": "u1"}).split(".")
+    header = _b64encode(b'{"alg":"%s","typ":"JWT"}' % alg.encode()).decode()
+    with pytest.raises(jwt.InvalidAlgorithmError):
+        _decode_jwt(".".join((header, payload, signature)))
+
+
+def test_hs512_token_rejected():
+    token = _pyjwt_token({"user_id": "u1"}, algorithm="HS512")
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_jwt(token)
+
+
+def test_expired_token_rejected():
+    token = _encode_jwt({"user_id": "u1", "exp": int(time.time()) - 1})
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _decode_jwt(token)
+    assert auth.verify_token(token) is None
+
+
+def test_non_integer_exp_rejected():
+    token = _encode_jwt({"user_id": "u1", "exp": "soon"})
+    with pytest.raises(jwt.DecodeError):
+        _decode_jwt(token)
+
+
+@pytest.mark.parametrize("token", [
+    "",
+    "onlyonesegment",
+    "two.segments",
+    "a.b.c.d",
+    "..",
+])
+def test_bad_segment_count_rejected(token):
+    with pytest.raises(jwt.InvalidTokenError):
+        _decode_jwt(token)
+
+
+@pytest.mark.parametrize("trim", [1, 5])
+def test_short_signature_rejected(trim):
+    token = _encode_jwt({"user_id": "u1"})
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(token[:-trim])
+
+
+def test_long_signature_rejected():
+    with pytest.raises(jwt.InvalidSignatureError):
+        _decode_jwt(_encode_jwt({"user_id": "u1"}) + "AAAA")
+
+
+def test_non_object_payload_rejected():
+    header = auth._JWT_HEADER_B64
+    signing_input = header + b"." + _b64encode(b"[1, 2, 3]")
+    token = (signing_input + b"." + _b64encode(auth._sign(signing_input))).decode()
+    with pytest.raises(jwt.DecodeError):
+        _decode_jwt(token)
+
+
+def test_non_ascii_token_rejected():
+    with pytest.raises(jwt.DecodeError):
+        _decode_jwt(_encode_jwt({"user_id": "u1"}) + "é")
+
+
+def test_batch_verification():
+    good = _encode_jwt({"user_id": "u1", "exp": int(time.time()) + 60})
+    expired = _encode_jwt({"user_id": "u1", "exp": int(time.time()) - 1})
+    assert auth.verify_tokens_batch([good, expired, "garbage"]) == [True, False, False]
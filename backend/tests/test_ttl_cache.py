@@ -0,0 +1,88 @@
+"""
+Tests for the in-process TTLCache in cache.py
+"""
+import os
+import sys
+
+import pytest
+
+# Add the backend directory to the path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import cache as cache_module
+from cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic inside cache.py"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_get_returns_default_when_missing():
+    c = TTLCache(maxsize=2, ttl=10)
+    assert c.get("missing") is None
+    assert c.get("missing", "fallback") == "fallback"
+
+
+def test_entry_expires_after_ttl(clock):
+    c = TTLCache(maxsize=4, ttl=10)
+    c.set("k", "v")
+    clock[0] += 9.9
+    assert c.get("k") == "v"
+    clock[0] += 0.1
+    assert c.get("k") is None
+    # Expired entries are dropped on read
+    assert len(c) == 0
+
+
+def test_per_entry_ttl_overrides_default(clock):
+    c = TTLCache(maxsize=4, ttl=10)
+    c.set("short", 1, ttl=1)
+    c.set("long", 2, ttl=100)
+    clock[0] += 5
+    assert c.get("short") is None
+    assert c.get("long") == 2
+
+
+def test_set_refreshes_expiry(clock):
+    c = TTLCache(maxsize=4, ttl=10)
+    c.set("k", "old")
+    clock[0] += 8
+    c.set("k", "new")
+    clock[0] += 8
+    assert c.get("k") == "new"
+
+
+def test_lru_eviction_drops_oldest():
+    c = TTLCache(maxsize=2, ttl=10)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.set("c", 3)
+    assert c.get("a") is None
+    assert c.get("b") == 2
+    assert c.get("c") == 3
+    assert len(c) == 2
+
+
+def test_get_marks_entry_recently_used():
+    c = TTLCache(maxsize=2, ttl=10)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.get("a")
+    c.set("c", 3)
+    assert c.get("a") == 1
+    assert c.get("b") is None
+
+
+def test_pop_and_clear():
+    c = TTLCache(maxsize=4, ttl=10)
+    c.set("a", 1)
+    c.set("b", 2)
+    assert c.pop("a") == 1
+    assert c.pop("a", "gone") == "gone"
+    c.clear()
+    assert len(c) == 0
+    assert c.get("b") is None